@@ -0,0 +1,192 @@
+"""
+Batching decorator for commitment identifiers.
+
+Concurrent callers each ask for the commitments in a single communication;
+this adapter collects those requests for a short window and answers them
+with one batched call to the wrapped identifier, so a model-based identifier
+runs one forward pass per batch instead of one per communication.
+"""
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import List, Optional, Tuple
+
+from audhd_lifecoach.core.domain.entities.communication import Communication
+from audhd_lifecoach.core.domain.entities.commitment import Commitment
+from audhd_lifecoach.core.interfaces.commitment_identifiable import CommitmentIdentifiable
+
+
+logger = logging.getLogger(__name__)
+
+# Queued to tell the worker thread to exit
+_STOP = object()
+
+
+class BatchingCommitmentIdentifier:
+    """
+    Commitment identifier that batches concurrent requests.
+    
+    A background thread takes the first waiting request, then keeps collecting
+    requests until max_batch_size are waiting or max_wait seconds have passed,
+    and identifies the commitments for the whole batch at once.
+    """
+    
+    def __init__(self,
+                 commitment_identifier: CommitmentIdentifiable,
+                 max_batch_size: int = 32,
+                 max_wait: float = 0.01):
+        """
+        Initialize the batching commitment identifier.
+        
+        Args:
+            commitment_identifier: The identifier that analyzes each batch
+            max_batch_size: Maximum number of communications per batch
+            max_wait: Longest time in seconds the first request in a batch
+                waits for others to join it
+        """
+        self.commitment_identifier = commitment_identifier
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        
+        self._queue: queue.Queue = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        # Guards starting the worker, queueing requests and closing
+        self._worker_lock = threading.Lock()
+        self._closed = False
+    
+    def identify_commitments(self, communication: Communication) -> List[Commitment]:
+        """
+        Identify any commitments contained within a communication.
+        
+        Blocks until the batch the communication joined has been analyzed.
+        
+        Args:
+            communication: The communication to analyze
+        
+        Returns:
+            A list of identified commitments (empty if none found)
+        
+        Raises:
+            RuntimeError: If the identifier has been closed
+        """
+        return self._submit(communication).result()
+    
+    def identify_commitments_batch(self, communications: List[Communication]) -> List[List[Commitment]]:
+        """
+        Identify the commitments contained within each of several communications.
+        
+        The communications already form a batch, so they go straight to the
+        wrapped identifier.
+        
+        Args:
+            communications: The communications to analyze
+        
+        Returns:
+            A list of identified commitments for each communication, in order
+        """
+        return self.commitment_identifier.identify_commitments_batch(communications)
+    
+    def close(self) -> None:
+        """
+        Answer the requests already waiting, then stop the background thread.
+        
+        Requests made after closing are refused instead of waiting for a
+        thread that will never answer them.
+        """
+        with self._worker_lock:
+            self._closed = True
+            if self._worker is None:
+                return
+            # Every request was queued under the lock, so all of them are ahead
+            # of the stop marker and are answered before the thread exits
+            self._queue.put(_STOP)
+            self._worker.join()
+            self._worker = None
+    
+    def _submit(self, communication: Communication) -> Future:
+        """
+        Queue a communication for the next batch, starting the background thread if needed.
+        
+        Args:
+            communication: The communication to analyze
+        
+        Returns:
+            Future: Resolves to the communication's commitments
+        
+        Raises:
+            RuntimeError: If the identifier has been closed
+        """
+        future: Future = Future()
+        with self._worker_lock:
+            if self._closed:
+                raise RuntimeError("BatchingCommitmentIdentifier has been closed")
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run,
+                    name="batching-commitment-identifier",
+                    daemon=True
+                )
+                self._worker.start()
+            self._queue.put((communication, future))
+        return future
+    
+    def _run(self) -> None:
+        """Collect and analyze batches of requests until told to stop."""
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+        
+            batch, stop = self._collect_batch(item)
+            self._identify_batch(batch)
+            if stop:
+                return
+    
+    def _collect_batch(self,
+                       first: Tuple[Communication, Future]) -> Tuple[List[Tuple[Communication, Future]], bool]:
+        """
+        Gather the requests that arrive within the batching window.
+        
+        Args:
+            first: The request that opened the batch
+        
+        Returns:
+            Tuple[List[Tuple[Communication, Future]], bool]: The batch, and
+                whether a stop request was received while collecting it
+        """
+        batch = [first]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+    
+    def _identify_batch(self, batch: List[Tuple[Communication, Future]]) -> None:
+        """
+        Identify the commitments for a batch and hand each caller its result.
+        
+        Args:
+            batch: The (communication, future) pairs to answer
+        """
+        try:
+            results = self.commitment_identifier.identify_commitments_batch(
+                [communication for communication, _ in batch]
+            )
+        except Exception as e:
+            logger.exception("Error identifying commitments for a batch of %d communications: %s", len(batch), e)
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        
+        for (_, future), commitments in zip(batch, results):
+            future.set_result(commitments)
@@ -4,8 +4,14 @@ Transformer-based implementation of the CommitmentIdentifiable interface using H
 This adapter uses Hugging Face's transformer models for local processing
 of natural language to identify commitments.
 """
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Tuple, Union
+from pathlib import Path
+import functools
+import os
+import platform
 import re
+import threading
+from collections import OrderedDict
 from datetime import datetime, timedelta
 import logging
 
@@ -31,6 +37,53 @@ TIME_PATTERNS = [
     r'(?:friday|monday|tuesday|wednesday|thursday|saturday|sunday)', # broader match for days
 ]
 
+# Compiled once, as the patterns are applied to every message
+COMPILED_TIME_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in TIME_PATTERNS]
+
+# Phrases that suggest a message makes or mentions a commitment
+COMMITMENT_PHRASES = [
+    "will", "i'll", "going to", "meet", "plan to",
+    "attend", "submit", "promise", "promised", "agreed", "need to",
+    "must", "have to", "should", "discuss", "by friday",
+    "tomorrow", "this evening", "morning", "afternoon",
+    "checkup", "recital", "report"
+]
+
+# A single alternation scans a message once instead of once per phrase
+COMMITMENT_INTENT_PATTERN = re.compile(
+    "|".join(re.escape(phrase) for phrase in COMMITMENT_PHRASES),
+    re.IGNORECASE
+)
+
+# Common activities to look for, in order of preference
+ACTIVITIES = [
+    "call", "meet", "meeting", "appointment", "lunch", "dinner",
+    "breakfast", "submit", "report", "presentation", "review",
+    "interview", "discuss", "discussion", "check", "checkup",
+    "exam", "examination", "attend", "event", "conference",
+    "recital", "performance", "game", "match", "delivery"
+]
+
+# Compiled once, as every message with a commitment is checked for each activity
+COMPILED_ACTIVITY_PATTERNS = [
+    (activity, re.compile(r'\b' + activity + r'\b', re.IGNORECASE)) for activity in ACTIVITIES
+]
+
+# A clock time such as "15:30" or "3 pm", which makes a time of day reference exact
+EXPLICIT_TIME_PATTERN = re.compile(r'\d{1,2}:\d{2}|\d{1,2}\s*(am|pm)', re.IGNORECASE)
+
+# Any day of the week; one scan instead of a substring check per day
+WEEKDAY_PATTERN = re.compile(r'monday|tuesday|wednesday|thursday|friday|saturday|sunday', re.IGNORECASE)
+
+# An hour and minute such as "15:30" or "3:30", captured separately
+CLOCK_TIME_PATTERN = re.compile(r'([0-1]?[0-9]|2[0-3]):([0-5][0-9])')
+
+# The NER model used when no other is given
+DEFAULT_MODEL_NAME = "dslim/bert-base-NER"
+
+# Where exported ONNX models are kept when no directory is given
+ONNX_CACHE_DIR = Path.home() / ".cache" / "audhd_lifecoach" / "onnx"
+
 # Time of day mappings for implicit references
 TIME_OF_DAY = {
     "morning": (9, 0),      # 9:00 AM
@@ -42,6 +95,102 @@ TIME_OF_DAY = {
 }
 
 
+def _cpu_flags() -> set:
+    """
+    Read the instruction set extensions of the host CPU.
+    
+    Returns:
+        set: The CPU flags, or an empty set if they cannot be read
+    """
+    try:
+        with open("/proc/cpuinfo") as cpuinfo:
+            for line in cpuinfo:
+                if line.startswith("flags"):
+                    return set(line.split(":", 1)[1].split())
+    except OSError:
+        pass
+    return set()
+
+
+def _quantization_config(auto_quantization_config):
+    """
+    Choose the dynamic int8 quantization settings for the host CPU.
+    
+    Int8 matrix multiplications are fastest with the VNNI instructions;
+    without them, weights are quantized to a reduced range so the AVX2 and
+    AVX-512 kernels do not saturate.
+    
+    Args:
+        auto_quantization_config: optimum's AutoQuantizationConfig class
+    
+    Returns:
+        The quantization configuration for the host CPU
+    """
+    if platform.machine().lower() in ("arm64", "aarch64"):
+        return auto_quantization_config.arm64(is_static=False, per_channel=False)
+    
+    flags = _cpu_flags()
+    if "avx512_vnni" in flags or "avx_vnni" in flags:
+        return auto_quantization_config.avx512_vnni(is_static=False, per_channel=False)
+    if "avx512f" in flags:
+        return auto_quantization_config.avx512(is_static=False, per_channel=False)
+    return auto_quantization_config.avx2(is_static=False, per_channel=False)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_onnx_pipeline(model_name: str, quantize: bool, onnx_model_dir: Optional[str]):
+    """
+    Load a NER model into an ONNX Runtime pipeline, once per process.
+    
+    The model is exported to ONNX on first use and, if requested, its
+    weights are dynamically quantized to int8, which roughly halves memory
+    traffic and speeds up inference on CPUs with int8 instructions. Creating
+    the inference session is the slow part of start-up, so every identifier
+    configured for the same model shares the one session.
+    
+    Args:
+        model_name: The Hugging Face model name to use for NER
+        quantize: Whether to quantize the model's weights to int8
+        onnx_model_dir: Directory the exported model is saved to and reused
+            from. Defaults to a directory per model under ~/.cache, so the
+            export only happens once per machine.
+    
+    Returns:
+        The NER pipeline backed by ONNX Runtime
+    """
+    # Imported here so the PyTorch backend does not pay for loading ONNX Runtime
+    import onnxruntime
+    from optimum.onnxruntime import ORTModelForTokenClassification, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+    
+    model_dir = Path(onnx_model_dir) if onnx_model_dir else ONNX_CACHE_DIR / model_name.replace("/", "--")
+    model_dir.mkdir(parents=True, exist_ok=True)
+    file_name = "model_quantized.onnx" if quantize else "model.onnx"
+    
+    if not (model_dir / file_name).exists():
+        model = ORTModelForTokenClassification.from_pretrained(model_name, export=True)
+        model.save_pretrained(model_dir)
+        if quantize:
+            quantizer = ORTQuantizer.from_pretrained(model)
+            quantizer.quantize(
+                save_dir=model_dir,
+                quantization_config=_quantization_config(AutoQuantizationConfig)
+            )
+    
+    session_options = onnxruntime.SessionOptions()
+    session_options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+    session_options.intra_op_num_threads = os.cpu_count() or 0
+    
+    model = ORTModelForTokenClassification.from_pretrained(
+        model_dir,
+        file_name=file_name,
+        provider="CPUExecutionProvider",
+        session_options=session_options
+    )
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    return pipeline("ner", model=model, tokenizer=tokenizer)
+
+
 class HuggingFaceONYXTransformerCommitmentIdentifier:
     """
     Identifies commitments in communications using transformer models.
@@ -50,30 +199,86 @@ class HuggingFaceONYXTransformerCommitmentIdentifier:
     and locations from text, enabling accurate identification of commitments.
     """
     
-    def __init__(self, model_name: str = "dslim/bert-base-NER", ner_pipeline=None):
+    def __init__(self, model_name: str = DEFAULT_MODEL_NAME, ner_pipeline=None, batch_size: int = 32,
+                 use_onnx: bool = False, quantize: bool = False, onnx_model_dir: Optional[str] = None,
+                 device: Optional[Union[int, str]] = None, half_precision: bool = True,
+                 ner_cache_size: int = 1024):
         """
         Initialize the commitment identifier with transformer model.
         
         Args:
             model_name: The Hugging Face model name to use for NER
             ner_pipeline: Optional pre-configured pipeline for testing
+            batch_size: Maximum number of texts per NER forward pass when
+                identifying commitments in a batch of communications
+            use_onnx: Whether to run the model with ONNX Runtime instead of PyTorch
+            quantize: Whether to quantize the ONNX model's weights to int8.
+                Only used together with use_onnx.
+            onnx_model_dir: Directory the exported ONNX model is saved to and
+                reused from, so the export only happens once. Defaults to a
+                directory per model under ~/.cache.
+            device: Device the PyTorch model runs on, e.g. 0 or "cuda:0" for
+                the first GPU. Defaults to the CPU.
+            half_precision: Whether to run the PyTorch model in float16 when it
+                is on a GPU. Ignored on the CPU, where float16 is not faster.
+            ner_cache_size: Maximum number of texts whose named entities are
+                cached, so repeated texts skip the model. Zero disables the cache.
         """
         self.model_name = model_name
+        self.batch_size = batch_size
+        self.use_onnx = use_onnx
+        self.quantize = quantize
+        self.onnx_model_dir = onnx_model_dir
+        self.device = device
+        self.half_precision = half_precision
+        self.ner_cache_size = ner_cache_size
         # Allow dependency injection for testing
         self._ner_pipeline = ner_pipeline
+        
+        # The entities only depend on the text, so unlike commitments they never go stale
+        self._ner_cache: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict()
+        self._ner_cache_lock = threading.Lock()
     
     @property
     def ner_pipeline(self):
         """Lazy loading of the NER pipeline."""
         if self._ner_pipeline is None:
-            self._ner_pipeline = pipeline("ner", model=self.model_name)
+            if self.use_onnx:
+                self._ner_pipeline = self._load_onnx_pipeline()
+            else:
+                self._ner_pipeline = self._load_torch_pipeline()
             logger.info(f"Loaded NER model: {self.model_name}")
         return self._ner_pipeline
     
+    def _load_torch_pipeline(self):
+        """
+        Load the NER model into a PyTorch pipeline.
+        
+        On a GPU the weights are loaded in float16 if half_precision is set,
+        which halves their memory traffic.
+        
+        Returns:
+            The NER pipeline backed by PyTorch
+        """
+        model_kwargs = {}
+        if self.half_precision and self.device not in (None, -1, "cpu"):
+            import torch
+            model_kwargs["torch_dtype"] = torch.float16
+        return pipeline("ner", model=self.model_name, device=self.device, **model_kwargs)
+    
+    def _load_onnx_pipeline(self):
+        """
+        Load the NER model into an ONNX Runtime pipeline.
+        
+        Returns:
+            The NER pipeline backed by ONNX Runtime
+        """
+        return _get_onnx_pipeline(self.model_name, self.quantize, self.onnx_model_dir)
+    
     def _extract_time_from_entity(self, entity_text: str) -> Optional[tuple]:
         """Extract hour and minute from a time entity string."""
         # Try to extract time format like "15:30" or "3:30"
-        time_match = re.search(r'([0-1]?[0-9]|2[0-3]):([0-5][0-9])', entity_text)
+        time_match = CLOCK_TIME_PATTERN.search(entity_text)
         if time_match:
             return int(time_match.group(1)), int(time_match.group(2))
         return None
@@ -90,20 +295,29 @@ class HuggingFaceONYXTransformerCommitmentIdentifier:
         """
         time_entities = []
         
+        # Several patterns often match the same expression, e.g. a bare
+        # "friday" or "morning", so each distinct expression is only parsed
+        # once, against a single reference time
+        now = datetime.now()
+        settings = {'PREFER_DATES_FROM': 'future', 'RELATIVE_BASE': now}
+        parsed_expressions: Dict[str, Optional[datetime]] = {}
+        
+        def parse(expression: str) -> Optional[datetime]:
+            if expression not in parsed_expressions:
+                parsed_expressions[expression] = dateparser.parse(expression, settings=settings)
+            return parsed_expressions[expression]
+        
         # Use regex patterns to find potential time expressions
         potential_times = []
-        for pattern in TIME_PATTERNS:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        for pattern in COMPILED_TIME_PATTERNS:
+            matches = pattern.finditer(text)
             for match in matches:
                 potential_times.append((match.group(0), match.start(), match.end()))
         
         # Process each potential time expression
         for time_expr, start, end in potential_times:
             # Try to parse the time expression
-            parsed_date = dateparser.parse(time_expr, settings={
-                'PREFER_DATES_FROM': 'future',
-                'RELATIVE_BASE': datetime.now()
-            })
+            parsed_date = parse(time_expr)
             
             # Handle time-of-day references (morning, afternoon, evening)
             if not parsed_date:
@@ -114,29 +328,23 @@ class HuggingFaceONYXTransformerCommitmentIdentifier:
                         base_expr = time_expr.lower().replace(time_name, "").strip()
                         if base_expr:
                             # Parse the base expression (e.g., "tomorrow" from "tomorrow morning")
-                            base_date = dateparser.parse(base_expr, settings={
-                                'PREFER_DATES_FROM': 'future',
-                                'RELATIVE_BASE': datetime.now()
-                            })
+                            base_date = parse(base_expr)
                             if base_date:
                                 # Set the time portion using our time of day mapping
                                 parsed_date = base_date.replace(hour=hour, minute=minute)
                                 break
                         else:
                             # If just "morning", "afternoon", etc., use today's date
-                            today = datetime.now().replace(hour=hour, minute=minute)
+                            today = now.replace(hour=hour, minute=minute)
                             # If the time has already passed today, move to tomorrow
-                            if today < datetime.now():
+                            if today < now:
                                 today = today + timedelta(days=1)
                             parsed_date = today
                             break
                             
                 # Handle day of week without specific time
-                if not parsed_date and any(day in time_expr.lower() for day in ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]):
-                    parsed_date = dateparser.parse(time_expr, settings={
-                        'PREFER_DATES_FROM': 'future',
-                        'RELATIVE_BASE': datetime.now()
-                    })
+                if not parsed_date and WEEKDAY_PATTERN.search(time_expr):
+                    parsed_date = parse(time_expr)
                     
                     # Set a default time if only a day was specified (e.g., "Friday")
                     if parsed_date:
@@ -164,10 +372,7 @@ class HuggingFaceONYXTransformerCommitmentIdentifier:
             for phrase in time_phrases:
                 if phrase in text.lower():
                     # Parse the phrase
-                    parsed_date = dateparser.parse(phrase, settings={
-                        'PREFER_DATES_FROM': 'future',
-                        'RELATIVE_BASE': datetime.now()
-                    })
+                    parsed_date = parse(phrase)
                     
                     if parsed_date:
                         # If it's a time of day reference, set appropriate hour
@@ -277,14 +482,7 @@ class HuggingFaceONYXTransformerCommitmentIdentifier:
         """
         Determine if the text contains a commitment intent.
         """
-        commitment_phrases = [
-            "will", "i'll", "going to", "meet", "plan to", 
-            "attend", "submit", "promise", "promised", "agreed", "need to",
-            "must", "have to", "should", "discuss", "by friday", 
-            "tomorrow", "this evening", "morning", "afternoon",
-            "checkup", "recital", "report"
-        ]
-        return any(phrase in text.lower() for phrase in commitment_phrases)
+        return COMMITMENT_INTENT_PATTERN.search(text) is not None
     
     def _extract_activity(self, text: str, standard_entities: List[Dict[str, Any]]) -> str:
         """
@@ -297,18 +495,9 @@ class HuggingFaceONYXTransformerCommitmentIdentifier:
         Returns:
             The activity described or a default value
         """
-        # Common activities to look for
-        activities = [
-            "call", "meet", "meeting", "appointment", "lunch", "dinner", 
-            "breakfast", "submit", "report", "presentation", "review", 
-            "interview", "discuss", "discussion", "check", "checkup", 
-            "exam", "examination", "attend", "event", "conference", 
-            "recital", "performance", "game", "match", "delivery"
-        ]
-        
-        # Look for these activities in the text
-        for activity in activities:
-            if re.search(r'\b' + activity + r'\b', text, re.IGNORECASE):
+        # Look for the common activities in the text, in order of preference
+        for activity, pattern in COMPILED_ACTIVITY_PATTERNS:
+            if pattern.search(text):
                 return activity.capitalize()
         
         # Default if no specific activity found
@@ -330,6 +519,7 @@ class HuggingFaceONYXTransformerCommitmentIdentifier:
         """
         start_time = time_entity['parsed_datetime']
         time_word = time_entity['word'].lower()
+        has_explicit_time = EXPLICIT_TIME_PATTERN.search(time_word) is not None
         
         # Set default duration based on the activity and time reference
         duration = timedelta(minutes=60)  # Default 1 hour for most commitments
@@ -350,26 +540,26 @@ class HuggingFaceONYXTransformerCommitmentIdentifier:
         if "morning" in time_word:
             # For morning references (e.g., "tomorrow morning"), create a broader range
             # If it's a specific time in the morning, keep the default duration
-            if re.search(r'\d{1,2}:\d{2}|\d{1,2}\s*(am|pm)', time_word, re.IGNORECASE) is None:
+            if not has_explicit_time:
                 # No specific time, make it a 3-hour window in the morning
                 end_time = start_time + timedelta(hours=3)
                 return start_time, end_time
                 
         elif "afternoon" in time_word:
-            if re.search(r'\d{1,2}:\d{2}|\d{1,2}\s*(am|pm)', time_word, re.IGNORECASE) is None:
+            if not has_explicit_time:
                 # No specific time, make it a 4-hour window in the afternoon
                 end_time = start_time + timedelta(hours=4)
                 return start_time, end_time
                 
         elif "evening" in time_word:
-            if re.search(r'\d{1,2}:\d{2}|\d{1,2}\s*(am|pm)', time_word, re.IGNORECASE) is None:
+            if not has_explicit_time:
                 # No specific time, make it a 3-hour window in the evening
                 end_time = start_time + timedelta(hours=3)
                 return start_time, end_time
                 
         # For day references without time (e.g., "Friday")
-        elif any(day in time_word for day in ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]):
-            if re.search(r'\d{1,2}:\d{2}|\d{1,2}\s*(am|pm)', time_word, re.IGNORECASE) is None:
+        elif WEEKDAY_PATTERN.search(time_word):
+            if not has_explicit_time:
                 # If it's a workday, make it a workday-length commitment (8 hours)
                 if start_time.weekday() < 5:  # Monday-Friday
                     end_time = start_time + timedelta(hours=8)
@@ -401,11 +591,106 @@ class HuggingFaceONYXTransformerCommitmentIdentifier:
         if not self._has_commitment_intent(text):
             return []
         
+        # A commitment needs a time, so only run the model when one is found
+        time_entities = self._extract_time_entities(text)
+        if not time_entities:
+            return []
+        
         # Extract standard named entities (locations, organizations, etc.)
-        standard_entities = self.ner_pipeline(text)
+        standard_entities = self._named_entities([text])[0]
         
-        # Extract time entities using dateparser and our enhanced logic
-        time_entities = self._extract_time_entities(text)
+        return self._build_commitments(communication, standard_entities, time_entities)
+    
+    def identify_commitments_batch(self, communications: List[Communication]) -> List[List[Commitment]]:
+        """
+        Identify the commitments contained within each of several communications.
+        
+        The communications that need named entity recognition are sent through
+        the NER pipeline together, so the model runs over padded batches rather
+        than once per communication.
+        
+        Args:
+            communications: The communications to analyze
+            
+        Returns:
+            A list of identified commitments for each communication, in order
+        """
+        results: List[List[Commitment]] = [[] for _ in communications]
+        
+        # Only communications with a commitment intent and a time need the model
+        pending = []
+        for index, communication in enumerate(communications):
+            if not communication.content or not self._has_commitment_intent(communication.content):
+                continue
+            time_entities = self._extract_time_entities(communication.content)
+            if time_entities:
+                pending.append((index, communication, time_entities))
+        if not pending:
+            return results
+        
+        texts = [communication.content for _, communication, _ in pending]
+        entities_per_text = self._named_entities(texts)
+        
+        for (index, communication, time_entities), standard_entities in zip(pending, entities_per_text):
+            results[index] = self._build_commitments(communication, standard_entities, time_entities)
+        
+        return results
+    
+    def _named_entities(self, texts: List[str]) -> List[List[Dict[str, Any]]]:
+        """
+        Run named entity recognition over several texts.
+        
+        Texts seen recently are answered from the cache; the rest are sent
+        through the NER pipeline, together if there are several of them.
+        
+        Args:
+            texts: The texts to analyze
+            
+        Returns:
+            The named entities found in each text, in order
+        """
+        entities_per_text: Dict[str, List[Dict[str, Any]]] = {}
+        if self.ner_cache_size > 0:
+            with self._ner_cache_lock:
+                for text in texts:
+                    if text in self._ner_cache:
+                        self._ner_cache.move_to_end(text)
+                        entities_per_text[text] = self._ner_cache[text]
+        
+        missing = list(dict.fromkeys(text for text in texts if text not in entities_per_text))
+        if len(missing) == 1:
+            entities_per_text[missing[0]] = self.ner_pipeline(missing[0])
+        elif missing:
+            identified = self.ner_pipeline(missing, batch_size=min(len(missing), self.batch_size))
+            entities_per_text.update(zip(missing, identified))
+        
+        if missing and self.ner_cache_size > 0:
+            with self._ner_cache_lock:
+                for text in missing:
+                    self._ner_cache[text] = entities_per_text[text]
+                    self._ner_cache.move_to_end(text)
+                # Evict the least recently used entries
+                while len(self._ner_cache) > self.ner_cache_size:
+                    self._ner_cache.popitem(last=False)
+        
+        return [entities_per_text[text] for text in texts]
+    
+    def _build_commitments(self, 
+                           communication: Communication, 
+                           standard_entities: List[Dict[str, Any]],
+                           time_entities: List[Dict[str, Any]]) -> List[Commitment]:
+        """
+        Build the commitments for a communication from its entities.
+        
+        Args:
+            communication: The communication being analyzed
+            standard_entities: The NER entities found in its content
+            time_entities: The time entities found in its content
+            
+        Returns:
+            A list of identified commitments (empty if none found)
+        """
+        text = communication.content
         
         # Find location entities from standard entities
         location_entity = None
@@ -4,6 +4,8 @@ Controller for handling communication-related API requests.
 This controller is responsible for processing incoming communication requests
 and returning appropriate responses according to API contracts.
 """
+from typing import List
+
 from audhd_lifecoach.application.dtos.communication_dto import CommunicationRequestDTO, CommunicationResponseDTO
 from audhd_lifecoach.application.use_cases.process_communication import ProcessCommunication
 
@@ -36,4 +38,16 @@ class CommunicationController:
         Returns:
             Response with processing results and created reminders
         """
-        return self.process_communication_use_case.execute(communication_request)
\ No newline at end of file
+        return self.process_communication_use_case.execute(communication_request)
+        
+    def process_communications_batch(self, communication_requests: List[CommunicationRequestDTO]) -> List[CommunicationResponseDTO]:
+        """
+        Handle incoming API requests carrying several communications.
+        
+        Args:
+            communication_requests: The communications sent to the API
+            
+        Returns:
+            Responses with processing results and created reminders, in request order
+        """
+        return self.process_communication_use_case.execute_many(communication_requests)
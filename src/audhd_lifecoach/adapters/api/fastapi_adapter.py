@@ -1,18 +1,44 @@
-from typing import Any, Callable, Dict, List, Optional, Type, Union
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Type, Union
 
 from fastapi import FastAPI, APIRouter, HTTPException
+from fastapi.responses import JSONResponse
+import orjson
 import uvicorn
 
 from audhd_lifecoach.application.interfaces.web_app_interface import WebAppInterface
 
 
+class OrjsonResponse(JSONResponse):
+    """JSON response rendered with orjson rather than the standard library json module."""
+    
+    def render(self, content: Any) -> bytes:
+        """Render the already JSON-compatible content to bytes."""
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
 class FastAPIAdapter(WebAppInterface):
     """Adapter for FastAPI that implements the WebAppInterface."""
     
     def __init__(self, title: str = "AuDHD LifeCoach", description: str = "A life coach application for people with AuDHD"):
         """Initialize the FastAPI adapter."""
-        self.app = FastAPI(title=title, description=description)
+        self._shutdown_handlers: List[Callable[[], Any]] = []
+        # FastAPI 0.110 encodes response models to JSON with the standard library
+        # json module; OrjsonResponse does that step in native code instead
+        self.app = FastAPI(
+            title=title,
+            description=description,
+            default_response_class=OrjsonResponse,
+            lifespan=self._lifespan
+        )
         self.router = APIRouter()
+    
+    @asynccontextmanager
+    async def _lifespan(self, app: FastAPI) -> AsyncIterator[None]:
+        """Run the registered shutdown handlers once the application stops."""
+        yield
+        for handler in self._shutdown_handlers:
+            handler()
         
     def register_route(
         self,
@@ -48,6 +74,10 @@ class FastAPIAdapter(WebAppInterface):
             **kwargs
         )(handler_func)
     
+    def register_shutdown_handler(self, handler: Callable[[], Any]) -> None:
+        """Register a function to call when the FastAPI application shuts down."""
+        self._shutdown_handlers.append(handler)
+    
     def get_app(self) -> FastAPI:
         """Return the FastAPI application instance."""
         # Make sure the router is included in the app
@@ -0,0 +1,242 @@
+"""
+RabbitMQ Connection Pool.
+
+This module provides a pool of RabbitMQ connections and channels that can be
+shared by the threads of a messaging adapter.
+"""
+import logging
+import os
+import queue
+import threading
+from typing import Any, List, Optional, Tuple
+
+import pika
+from pika.exceptions import AMQPError
+
+
+logger = logging.getLogger(__name__)
+
+# Default upper bound on pooled connections, one per CPU
+DEFAULT_MAX_CHANNELS = os.cpu_count() or 4
+
+# Seconds a caller waits for a pooled channel before re-checking the pool
+POOL_WAIT_INTERVAL = 1.0
+
+
+class RabbitMQChannelPool:
+    """
+    Pool of RabbitMQ connection/channel pairs.
+
+    pika connections are not thread-safe, so each pair is lent to a single
+    thread at a time. The pool grows on demand up to max_channels; once every
+    pair is in use, callers wait for one to be released.
+
+    Nothing services an idle pair's I/O while it sits in the pool, so it may
+    miss heartbeats and be dropped by the broker. Each idle pair is checked
+    when it is handed out, and a dead one is replaced.
+    """
+
+    def __init__(self, parameters: pika.ConnectionParameters, max_channels: Optional[int] = None):
+        """
+        Initialize the channel pool.
+
+        Args:
+            parameters: The connection parameters for new connections
+            max_channels: Maximum number of pooled connection/channel pairs.
+                Defaults to the number of CPUs.
+        """
+        self.parameters = parameters
+        self.max_channels = max_channels or DEFAULT_MAX_CHANNELS
+
+        self._lock = threading.Lock()
+        self._idle_channels = queue.LifoQueue()
+        self._open_channels: List[Tuple[Any, Any]] = []
+        # Slots reserved for pairs whose connection is still being opened
+        self._opening = 0
+        self._closed = False
+
+    def open(self) -> None:
+        """
+        Open the first connection/channel pair so it is ready for use.
+
+        Raises:
+            AMQPError: If the connection cannot be opened
+        """
+        with self._lock:
+            self._opening += 1
+        pair = self._open_channel()
+        if pair is not None:
+            self._idle_channels.put(pair)
+
+    def acquire(self) -> Optional[Tuple[Any, Any]]:
+        """
+        Take a connection/channel pair from the pool for exclusive use.
+
+        An idle pair is reused when it is still open. Otherwise a new one is
+        opened while the pool is below max_channels, or the caller waits for a
+        pair to be released.
+
+        Returns:
+            Optional[Tuple[Any, Any]]: The pair, or None if the pool is closed
+
+        Raises:
+            AMQPError: If a new connection cannot be opened
+        """
+        while True:
+            try:
+                pair = self._idle_channels.get_nowait()
+            except queue.Empty:
+                pass
+            else:
+                if self._is_alive(pair):
+                    return pair
+                self.release(pair, broken=True)
+                continue
+
+            with self._lock:
+                if self._closed:
+                    return None
+                can_grow = len(self._open_channels) + self._opening < self.max_channels
+                if can_grow:
+                    self._opening += 1
+
+            if can_grow:
+                return self._open_channel()
+
+            try:
+                pair = self._idle_channels.get(timeout=POOL_WAIT_INTERVAL)
+            except queue.Empty:
+                # Re-check: the pool may have been closed, or a broken pair
+                # may have been dropped, freeing room to grow
+                continue
+            if self._is_alive(pair):
+                return pair
+            self.release(pair, broken=True)
+
+    def release(self, pair: Tuple[Any, Any], broken: bool = False) -> None:
+        """
+        Return a connection/channel pair to the pool.
+
+        Args:
+            pair: The pair to return
+            broken: Whether using the pair failed. Broken pairs are closed and
+                dropped so a fresh one is opened when needed. Pairs returned
+                after the pool has been closed are closed as well.
+        """
+        with self._lock:
+            if pair not in self._open_channels:
+                return
+            if not broken and not self._closed:
+                self._idle_channels.put(pair)
+                return
+            self._open_channels.remove(pair)
+
+        self._close_pair(pair)
+
+    def close(self) -> bool:
+        """
+        Close the pool and every idle connection and channel.
+
+        Pairs that are checked out stay open for their current user and are
+        closed when they are released.
+
+        Returns:
+            bool: True if everything closed cleanly, False otherwise
+        """
+        with self._lock:
+            self._closed = True
+            idle_channels = []
+            while True:
+                try:
+                    idle_channels.append(self._idle_channels.get_nowait())
+                except queue.Empty:
+                    break
+            for pair in idle_channels:
+                self._open_channels.remove(pair)
+
+        success = True
+        for pair in idle_channels:
+            success = self._close_pair(pair) and success
+        return success
+
+    @staticmethod
+    def _is_alive(pair: Tuple[Any, Any]) -> bool:
+        """
+        Check that an idle pair is still usable.
+
+        Pending I/O is processed first, so heartbeats are answered and a
+        close by the broker is noticed before the pair is handed out.
+
+        Args:
+            pair: The pair to check
+
+        Returns:
+            bool: True if the connection and channel are open, False otherwise
+        """
+        connection, channel = pair
+        try:
+            if connection.is_open:
+                connection.process_data_events(time_limit=0)
+        except AMQPError as e:
+            logger.warning("Dropping pooled RabbitMQ connection: %s", e)
+            return False
+        return connection.is_open and channel.is_open
+
+    @staticmethod
+    def _close_pair(pair: Tuple[Any, Any]) -> bool:
+        """
+        Close a connection/channel pair.
+
+        Args:
+            pair: The pair to close
+
+        Returns:
+            bool: True if the pair closed cleanly, False otherwise
+        """
+        connection, channel = pair
+        try:
+            if connection.is_open:
+                # Close channel first if it exists
+                if channel.is_open:
+                    channel.close()
+
+                # Close connection
+                connection.close()
+        except AMQPError as e:
+            logger.error("Error closing RabbitMQ connection: %s", e)
+            return False
+        return True
+
+    def _open_channel(self) -> Optional[Tuple[Any, Any]]:
+        """
+        Open a new connection/channel pair in a reserved slot and register it.
+
+        The caller reserves the slot by incrementing the opening count under
+        the pool lock. The connection itself is opened without the lock, so a
+        slow or unreachable broker does not hold up release() and close().
+
+        Returns:
+            Optional[Tuple[Any, Any]]: The new connection and its channel, or
+                None if the pool was closed while the connection was opening
+
+        Raises:
+            AMQPError: If the connection cannot be opened
+        """
+        try:
+            connection = pika.BlockingConnection(self.parameters)
+            channel = connection.channel()
+        except Exception:
+            # Give the reserved slot back
+            with self._lock:
+                self._opening -= 1
+            raise
+
+        pair = (connection, channel)
+        with self._lock:
+            self._opening -= 1
+            if not self._closed:
+                self._open_channels.append(pair)
+                return pair
+
+        self._close_pair(pair)
+        return None
@@ -3,10 +3,12 @@ RabbitMQ Message Consumer Adapter.
 
 This adapter implements the MessageConsumerInterface for RabbitMQ.
 """
-import json
+import functools
 import logging
-from typing import Any, Callable, Dict, Optional
+import threading
+from typing import Any, Callable, Dict, List, Optional
 
+import orjson
 # The pika library is used for RabbitMQ communication
 import pika
 
@@ -26,7 +28,8 @@ class RabbitMQMessageConsumer(MessageConsumerInterface):
     
     def __init__(self, host: str = 'localhost', port: int = 5672, 
                  username: str = 'guest', password: str = 'guest',
-                 virtual_host: str = '/'):
+                 virtual_host: str = '/',
+                 prefetch_count: int = 16):
         """
         Initialize the RabbitMQ message consumer.
         
@@ -36,17 +39,26 @@ class RabbitMQMessageConsumer(MessageConsumerInterface):
             username: RabbitMQ username
             password: RabbitMQ password
             virtual_host: RabbitMQ virtual host
+            prefetch_count: Maximum number of unacknowledged messages the broker
+                delivers to this consumer, which bounds the messages waiting to
+                be processed. Zero means no limit.
         """
         self.host = host
         self.port = port
         self.username = username
         self.password = password
         self.virtual_host = virtual_host
+        self.prefetch_count = prefetch_count
         
         self._connection = None
         self._channel = None
         self._consumer_tag = None
         self._callback = None
+        self._raw_callback = None
+        self._consumer_thread_id = None
+        # Delivery tags handed to the callback but not yet acked or rejected.
+        # Only touched on the connection thread.
+        self._unacked_tags = set()
     
     def connect(self) -> bool:
         """
@@ -78,6 +90,10 @@ class RabbitMQMessageConsumer(MessageConsumerInterface):
         Returns:
             bool: True if disconnection successful, False otherwise
         """
+        # Run any acks/rejects scheduled by worker threads before closing
+        if self._connection and self._connection.is_open:
+            self._connection.process_data_events(time_limit=0)
+        
         # Cancel consumer if it exists
         if self._channel and self._consumer_tag:
             self._channel.basic_cancel(self._consumer_tag)
@@ -91,6 +107,9 @@ class RabbitMQMessageConsumer(MessageConsumerInterface):
         if self._connection:
             self._connection.close()
             self._connection = None
+        
+        self._consumer_thread_id = None
+        self._unacked_tags.clear()
             
         logger.info("Disconnected from RabbitMQ")
         return True
@@ -105,10 +124,67 @@ class RabbitMQMessageConsumer(MessageConsumerInterface):
         """
         # Store the callback function
         self._callback = callback
-            
+        self._raw_callback = None
+        self._start_consuming(queue_name)
+    
+    def consume_raw(self, queue_name: str, callback: Callable[[bytes, str], Any]) -> None:
+        """
+        Start consuming messages from the specified queue without decoding them.
+        
+        Bodies are passed to the callback exactly as delivered, leaving the
+        callback to parse them straight into its own types.
+        
+        Args:
+            queue_name: Name of the queue to consume from
+            callback: Function to call with the message body and message ID
+                when a message is received
+        """
+        self._callback = None
+        self._raw_callback = callback
+        self._start_consuming(queue_name)
+    
+    def stop_consuming(self) -> bool:
+        """
+        Stop delivering new messages, leaving the connection open.
+        
+        The consumer is cancelled on the connection thread, which makes the
+        consume call return there. Messages already delivered can still be
+        acknowledged or rejected until disconnect() is called.
+        
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if self._connection is None or not self._connection.is_open:
+            return True
+        
+        self._call_on_connection_thread(self._cancel_consumer)
+        return True
+    
+    def _cancel_consumer(self) -> None:
+        """Cancel the consumer and end the IO loop, on the connection thread."""
+        if self._channel is None or self._consumer_tag is None:
+            return
+        
+        # Cancels every consumer on the channel and makes start_consuming return;
+        # messages not yet handed to the callback are requeued by pika
+        self._channel.stop_consuming()
+        self._consumer_tag = None
+    
+    def _start_consuming(self, queue_name: str) -> None:
+        """
+        Subscribe to the queue and run the IO loop until consuming stops.
+        
+        Args:
+            queue_name: Name of the queue to consume from
+        """
         # Declare the queue (ensures it exists)
         self._channel.queue_declare(queue=queue_name, durable=True)
         
+        # Let the broker hold back deliveries once enough are unacknowledged,
+        # instead of pushing the whole backlog into the client
+        if self.prefetch_count:
+            self._channel.basic_qos(prefetch_count=self.prefetch_count)
+        
         # Start consuming messages
         self._consumer_tag = self._channel.basic_consume(
             queue=queue_name,
@@ -118,6 +194,10 @@ class RabbitMQMessageConsumer(MessageConsumerInterface):
         
         logger.info(f"Started consuming messages from queue '{queue_name}'")
         
+        # Remember which thread drives the IO loop so acks from other threads
+        # can be handed back to it
+        self._consumer_thread_id = threading.get_ident()
+        
         # Start the IO loop to process messages
         self._channel.start_consuming()
     
@@ -126,7 +206,8 @@ class RabbitMQMessageConsumer(MessageConsumerInterface):
         Callback function for RabbitMQ message delivery.
         
         This function is called by pika when a message is received.
-        It parses the message body and calls the user-provided callback.
+        It parses the message body and calls the user-provided callback, or
+        hands the body over unparsed when consuming raw messages.
         
         Args:
             channel: The pika channel
@@ -134,25 +215,51 @@ class RabbitMQMessageConsumer(MessageConsumerInterface):
             properties: The pika properties
             body: The message body
         """
+        if self._raw_callback:
+            self._on_raw_message(channel, method, body)
+            return
+        
+        # Parse the message body
+        try:
+            message_data = orjson.loads(body)
+        except ValueError as e:
+            logger.exception(f"Failed to parse message body: {e}")
+            # Reject messages that cannot be decoded
+            channel.basic_reject(delivery_tag=method.delivery_tag, requeue=False)
+            return
+        
         try:
-            # Parse the message body
-            message_data = json.loads(body)
-            
             # Store the delivery tag for acknowledgment
             message_data["message_id"] = method.delivery_tag
+            self._unacked_tags.add(method.delivery_tag)
             
             # Call the user-provided callback
             if self._callback:
                 self._callback(message_data)
             
-        except json.JSONDecodeError as e:
-            logger.exception(f"Failed to parse message body: {e}")
-            # Reject invalid JSON messages
-            channel.basic_reject(delivery_tag=method.delivery_tag, requeue=False)
-            
         except Exception as e:
             logger.exception(f"Error processing message: {e}")
             # Reject and requeue on other errors
+            self._unacked_tags.discard(method.delivery_tag)
+            channel.basic_reject(delivery_tag=method.delivery_tag, requeue=True)
+    
+    def _on_raw_message(self, channel, method, body: bytes) -> None:
+        """
+        Hand an undecoded message body to the raw callback.
+        
+        Args:
+            channel: The pika channel
+            method: The pika method frame
+            body: The message body
+        """
+        try:
+            # The delivery tag is the message ID used for acknowledgment
+            self._unacked_tags.add(method.delivery_tag)
+            self._raw_callback(body, str(method.delivery_tag))
+        except Exception as e:
+            logger.exception(f"Error processing message: {e}")
+            # Reject and requeue on errors
+            self._unacked_tags.discard(method.delivery_tag)
             channel.basic_reject(delivery_tag=method.delivery_tag, requeue=True)
     
     def acknowledge_message(self, message_id: str) -> bool:
@@ -167,7 +274,25 @@ class RabbitMQMessageConsumer(MessageConsumerInterface):
         """
         # In RabbitMQ, the message_id is the delivery tag
         delivery_tag = int(message_id)
-        self._channel.basic_ack(delivery_tag=delivery_tag)
+        self._call_on_connection_thread(functools.partial(self._ack, [delivery_tag]))
+        return True
+    
+    def acknowledge_messages(self, message_ids: List[str]) -> bool:
+        """
+        Acknowledge a batch of messages.
+        
+        Args:
+            message_ids: IDs of the messages to acknowledge
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if not message_ids:
+            return True
+        
+        # In RabbitMQ, the message_id is the delivery tag
+        delivery_tags = [int(message_id) for message_id in message_ids]
+        self._call_on_connection_thread(functools.partial(self._ack, delivery_tags))
         return True
     
     def reject_message(self, message_id: str, requeue: bool = False) -> bool:
@@ -183,6 +308,59 @@ class RabbitMQMessageConsumer(MessageConsumerInterface):
         """
         # In RabbitMQ, the message_id is the delivery tag
         delivery_tag = int(message_id)
-        self._channel.basic_reject(delivery_tag=delivery_tag, requeue=requeue)
+        self._call_on_connection_thread(
+            functools.partial(self._reject, delivery_tag, requeue)
+        )
         return True
+    
+    def _ack(self, delivery_tags: List[int]) -> None:
+        """
+        Acknowledge delivery tags on the connection thread.
+        
+        When the batch covers every outstanding tag up to its highest one, a
+        single ack with multiple=True replaces one frame per message.
+        
+        Args:
+            delivery_tags: The delivery tags to acknowledge
+        """
+        highest = max(delivery_tags)
+        batch = set(delivery_tags)
+        covers_outstanding = all(
+            tag in batch for tag in self._unacked_tags if tag <= highest
+        )
+        
+        if len(batch) > 1 and covers_outstanding:
+            self._channel.basic_ack(delivery_tag=highest, multiple=True)
+        else:
+            for delivery_tag in delivery_tags:
+                self._channel.basic_ack(delivery_tag=delivery_tag)
+        
+        self._unacked_tags.difference_update(batch)
+    
+    def _reject(self, delivery_tag: int, requeue: bool) -> None:
+        """
+        Reject a delivery tag on the connection thread.
+        
+        Args:
+            delivery_tag: The delivery tag to reject
+            requeue: Whether to requeue the message
+        """
+        self._unacked_tags.discard(delivery_tag)
+        self._channel.basic_reject(delivery_tag=delivery_tag, requeue=requeue)
+    
+    def _call_on_connection_thread(self, callback: Callable[[], Any]) -> None:
+        """
+        Run a channel operation on the thread that owns the connection.
+        
+        pika's BlockingConnection is not thread-safe, so operations requested
+        from worker threads are scheduled onto the IO loop instead of being
+        executed directly.
+        
+        Args:
+            callback: The channel operation to run
+        """
+        if self._consumer_thread_id in (None, threading.get_ident()):
+            callback()
+        else:
+            self._connection.add_callback_threadsafe(callback)
     
\ No newline at end of file
@@ -3,19 +3,24 @@ RabbitMQ Message Publisher.
 
 This adapter implements the message publisher interface for RabbitMQ.
 """
-import json
 import logging
+import time
 from typing import Any, Dict, Optional
 
+import orjson
 import pika
 from pika.exceptions import AMQPError
 
+from audhd_lifecoach.adapters.messaging.rabbitmq_connection_pool import RabbitMQChannelPool
 # The publisher interface is defined as a Protocol - no need to inherit
 from audhd_lifecoach.application.interfaces.message_publisher_interface import MessagePublisherInterface
 
 
 logger = logging.getLogger(__name__)
 
+# Upper bound in seconds on the backoff between publish attempts
+MAX_PUBLISH_BACKOFF = 5.0
+
 
 class RabbitMQMessagePublisher:
     """
@@ -23,6 +28,9 @@ class RabbitMQMessagePublisher:
     
     This implementation assumes all infrastructure (exchanges, queues, bindings)
     has been pre-provisioned externally (e.g., by Terraform).
+    
+    Publishing threads draw connection/channel pairs from a
+    RabbitMQChannelPool, since pika connections are not thread-safe.
     """
     
     def __init__(
@@ -33,7 +41,10 @@ class RabbitMQMessagePublisher:
         password: str = "guest",
         virtual_host: str = "/",
         connection_attempts: int = 3,
-        retry_delay: int = 5
+        retry_delay: int = 5,
+        max_channels: Optional[int] = None,
+        publish_attempts: int = 1,
+        publish_backoff: float = 0.1
     ):
         """
         Initialize the RabbitMQ message publisher.
@@ -46,6 +57,12 @@ class RabbitMQMessagePublisher:
             virtual_host: RabbitMQ virtual host
             connection_attempts: Number of connection attempts
             retry_delay: Delay between connection attempts in seconds
+            max_channels: Maximum number of pooled connection/channel pairs.
+                Defaults to the number of CPUs.
+            publish_attempts: Number of attempts to publish a message before
+                giving up. Each retry uses a fresh connection.
+            publish_backoff: Delay before the first retry in seconds, doubled
+                for each further retry up to MAX_PUBLISH_BACKOFF
         """
         self._host = host
         self._port = port
@@ -54,15 +71,20 @@ class RabbitMQMessagePublisher:
         self._virtual_host = virtual_host
         self._connection_attempts = connection_attempts
         self._retry_delay = retry_delay
+        self._max_channels = max_channels
+        self._publish_attempts = max(1, publish_attempts)
+        self._publish_backoff = publish_backoff
         
         # Connection state
-        self._connection = None
-        self._channel = None
+        self._pool: Optional[RabbitMQChannelPool] = None
         
     def connect(self) -> bool:
         """
         Connect to RabbitMQ.
         
+        Opens the first pooled connection; further connections are opened as
+        concurrent publishers need them.
+        
         Returns:
             bool: True if connection successful, False otherwise
         """
@@ -83,14 +105,17 @@ class RabbitMQMessagePublisher:
             )
             
             # Connect to RabbitMQ
-            self._connection = pika.BlockingConnection(parameters)
-            self._channel = self._connection.channel()
+            pool = RabbitMQChannelPool(parameters, max_channels=self._max_channels)
+            pool.open()
+            previous_pool, self._pool = self._pool, pool
+            if previous_pool is not None:
+                previous_pool.close()
             
-            logger.info(f"Connected to RabbitMQ at {self._host}:{self._port}")
+            logger.info("Connected to RabbitMQ at %s:%s", self._host, self._port)
             return True
             
         except AMQPError as e:
-            logger.error(f"Failed to connect to RabbitMQ: {e}")
+            logger.error("Failed to connect to RabbitMQ: %s", e)
             return False
     
     def disconnect(self) -> bool:
@@ -100,26 +125,14 @@ class RabbitMQMessagePublisher:
         Returns:
             bool: True if disconnection successful, False otherwise
         """
-        try:
-            if self._connection and self._connection.is_open:
-                # Close channel first if it exists
-                if self._channel and self._channel.is_open:
-                    self._channel.close()
-                
-                # Close connection
-                self._connection.close()
-                
-                # Reset connection state
-                self._connection = None
-                self._channel = None
-                
-                logger.info("Disconnected from RabbitMQ")
-                return True
+        pool, self._pool = self._pool, None
+        if pool is None:
             return True  # Already disconnected
-            
-        except AMQPError as e:
-            logger.error(f"Error disconnecting from RabbitMQ: {e}")
-            return False
+        
+        if pool.close():
+            logger.info("Disconnected from RabbitMQ")
+            return True
+        return False
     
     def publish_message(
         self,
@@ -127,7 +140,8 @@ class RabbitMQMessagePublisher:
         routing_key: str,
         message: Dict[str, Any],
         content_type: str = "application/json",
-        persistent: bool = True
+        persistent: bool = True,
+        schema: Optional[str] = None
     ) -> bool:
         """
         Publish a message to RabbitMQ.
@@ -140,34 +154,98 @@ class RabbitMQMessagePublisher:
             message: The message to publish (will be serialized to JSON)
             content_type: The content type of the message
             persistent: Whether the message should be persisted by the broker
+            schema: Optional schema identifier sent as the AMQP type property
             
         Returns:
             bool: True if the message was published successfully, False otherwise
         """
         try:
-            # Convert message to JSON
-            message_body = json.dumps(message).encode('utf-8')
+            # Convert message to UTF-8 encoded JSON
+            message_body = orjson.dumps(message)
+        except orjson.JSONEncodeError as e:
+            logger.error("Failed to serialize message: %s", e)
+            return False
+        
+        return self.publish_raw(
+            exchange=exchange,
+            routing_key=routing_key,
+            body=message_body,
+            content_type=content_type,
+            persistent=persistent,
+            schema=schema
+        )
+    
+    def publish_raw(
+        self,
+        exchange: str,
+        routing_key: str,
+        body: bytes,
+        content_type: str = "application/json",
+        persistent: bool = True,
+        schema: Optional[str] = None
+    ) -> bool:
+        """
+        Publish an already-serialized message body to RabbitMQ.
+        
+        The body is sent as-is, so callers that already hold encoded bytes
+        (e.g. when forwarding a consumed message) skip a decode/encode round-trip.
+        
+        Args:
+            exchange: The exchange to publish to
+            routing_key: The routing key for the message
+            body: The serialized message body
+            content_type: The content type of the message
+            persistent: Whether the message should be persisted by the broker
+            schema: Optional schema identifier sent as the AMQP type property
             
-            # Create message properties
-            properties = pika.BasicProperties(
-                content_type=content_type,
-                delivery_mode=2 if persistent else 1  # 2 = persistent, 1 = non-persistent
-            )
+        Returns:
+            bool: True if the message was published successfully, False otherwise
+        """
+        # Create message properties
+        properties = pika.BasicProperties(
+            content_type=content_type,
+            content_encoding="utf-8",
+            type=schema,
+            delivery_mode=2 if persistent else 1  # 2 = persistent, 1 = non-persistent
+        )
+        
+        for attempt in range(self._publish_attempts):
+            if attempt:
+                # Back off exponentially so a struggling broker is not hammered
+                time.sleep(min(self._publish_backoff * 2 ** (attempt - 1), MAX_PUBLISH_BACKOFF))
             
-            # Publish message
-            self._channel.basic_publish(
-                exchange=exchange,
-                routing_key=routing_key,
-                body=message_body,
-                properties=properties
-            )
+            pool = self._pool
+            try:
+                pair = pool.acquire() if pool is not None else None
+            except AMQPError as e:
+                logger.warning("Failed to open RabbitMQ channel (attempt %d): %s", attempt + 1, e)
+                continue
             
-            logger.debug(f"Published message to exchange '{exchange}' with routing key '{routing_key}'")
-            return True
+            if pair is None:
+                logger.error("Cannot publish message: not connected to RabbitMQ")
+                return False
             
-        except AMQPError as e:
-            logger.error(f"Failed to publish message: {e}")
-            return False
-        except Exception as e:
-            logger.error(f"Unexpected error publishing message: {e}")
-            return False
\ No newline at end of file
+            _, channel = pair
+            try:
+                # Publish message
+                channel.basic_publish(
+                    exchange=exchange,
+                    routing_key=routing_key,
+                    body=body,
+                    properties=properties
+                )
+            except AMQPError as e:
+                logger.warning("Failed to publish message (attempt %d): %s", attempt + 1, e)
+                pool.release(pair, broken=True)
+                continue
+            except Exception as e:
+                logger.error("Unexpected error publishing message: %s", e)
+                pool.release(pair, broken=True)
+                return False
+            
+            logger.debug("Published message to exchange '%s' with routing key '%s'", exchange, routing_key)
+            pool.release(pair)
+            return True
+        
+        logger.error("Failed to publish message after %d attempts", self._publish_attempts)
+        return False
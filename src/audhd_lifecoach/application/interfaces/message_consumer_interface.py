@@ -3,7 +3,7 @@ Message Consumer Interface for handling message-based communication.
 
 This module defines the protocol for message consumer adapters to interact with the application.
 """
-from typing import Protocol, runtime_checkable, Any, Callable
+from typing import Protocol, runtime_checkable, Any, Callable, List
 
 
 @runtime_checkable
@@ -47,6 +47,33 @@ class MessageConsumerInterface(Protocol):
         """
         ...
     
+    def consume_raw(self, queue_name: str, callback: Callable[[bytes, str], Any]) -> None:
+        """
+        Start consuming messages from the specified queue without decoding them.
+        
+        Like consume_messages, but the callback receives the message body
+        exactly as delivered by the broker, leaving decoding to the caller.
+        
+        Args:
+            queue_name: The name of the queue to consume from
+            callback: Function to call when a message is received.
+                     The callback should accept the raw message body and the message ID.
+        """
+        ...
+    
+    def stop_consuming(self) -> bool:
+        """
+        Stop delivering new messages, leaving the connection open.
+        
+        Safe to call from any thread. The blocking consume call returns once
+        consuming has stopped, while messages already delivered can still be
+        acknowledged or rejected until disconnect is called.
+        
+        Returns:
+            bool: True if consuming was stopped, False otherwise
+        """
+        ...
+    
     def acknowledge_message(self, message_id: str) -> bool:
         """
         Acknowledge that a message has been processed successfully.
@@ -59,6 +86,18 @@ class MessageConsumerInterface(Protocol):
         """
         ...
     
+    def acknowledge_messages(self, message_ids: List[str]) -> bool:
+        """
+        Acknowledge a batch of messages that have been processed successfully.
+        
+        Args:
+            message_ids: The IDs of the messages to acknowledge
+            
+        Returns:
+            bool: True if the acknowledgment was successful, False otherwise
+        """
+        ...
+    
     def reject_message(self, message_id: str, requeue: bool = False) -> bool:
         """
         Reject a message that could not be processed.
@@ -3,7 +3,7 @@ Message Publisher Interface.
 
 This interface defines the contract for message publishing adapters.
 """
-from typing import Any, Dict, Protocol, runtime_checkable
+from typing import Any, Dict, Optional, Protocol, runtime_checkable
 
 
 @runtime_checkable
@@ -35,7 +35,8 @@ class MessagePublisherInterface(Protocol):
                         routing_key: str, 
                         message: Dict[str, Any],
                         content_type: str = "application/json",
-                        persistent: bool = True) -> bool:
+                        persistent: bool = True,
+                        schema: Optional[str] = None) -> bool:
         """
         Publish a message to the message broker.
         
@@ -45,6 +46,32 @@ class MessagePublisherInterface(Protocol):
             message: The message to publish
             content_type: The content type of the message
             persistent: Whether the message should be persisted by the broker
+            schema: Optional identifier of the message schema, so consumers can
+                pick a decoder without inspecting the body
+            
+        Returns:
+            bool: True if the message was published successfully, False otherwise
+        """
+        ...
+    
+    def publish_raw(self,
+                    exchange: str,
+                    routing_key: str,
+                    body: bytes,
+                    content_type: str = "application/json",
+                    persistent: bool = True,
+                    schema: Optional[str] = None) -> bool:
+        """
+        Publish an already-serialized message body to the message broker.
+        
+        Args:
+            exchange: The exchange to publish to
+            routing_key: The routing key for the message
+            body: The serialized message body, sent unmodified
+            content_type: The content type of the message
+            persistent: Whether the message should be persisted by the broker
+            schema: Optional identifier of the message schema, so consumers can
+                pick a decoder without inspecting the body
             
         Returns:
             bool: True if the message was published successfully, False otherwise
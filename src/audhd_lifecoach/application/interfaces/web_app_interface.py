@@ -22,6 +22,11 @@ class WebAppInterface(ABC):
         """Register a route with the web framework."""
         pass
     
+    @abstractmethod
+    def register_shutdown_handler(self, handler: Callable[[], Any]) -> None:
+        """Register a function to call when the web application shuts down."""
+        pass
+    
     @abstractmethod
     def get_app(self) -> Any:
         """Return the underlying web application instance."""
@@ -3,6 +3,7 @@ Application services package.
 
 This package contains application-level service implementations.
 """
+from audhd_lifecoach.application.services.background_message_publisher import BackgroundMessagePublisher
 from audhd_lifecoach.application.services.message_consumer_service import MessageConsumerService
 
-__all__ = ["MessageConsumerService"]
\ No newline at end of file
+__all__ = ["BackgroundMessagePublisher", "MessageConsumerService"]
\ No newline at end of file
@@ -0,0 +1,179 @@
+"""
+Background Message Publisher.
+
+This service wraps a message publisher so that messages are published from a
+background thread, keeping broker round-trips off the caller's path.
+"""
+import logging
+import queue
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from audhd_lifecoach.application.interfaces.message_publisher_interface import MessagePublisherInterface
+
+
+logger = logging.getLogger(__name__)
+
+# Queued after the pending messages to tell the worker thread to exit
+_STOP = object()
+
+
+class BackgroundMessagePublisher:
+    """
+    Message publisher that hands messages to a background thread.
+
+    publish_message() and publish_raw() only enqueue the message and return
+    straight away; the wrapped publisher sends it from the worker thread. When
+    the publisher is not connected or the queue is full the message is dropped
+    and the call returns False.
+
+    Queued messages are only sent once dequeued, so call disconnect() on
+    shutdown to publish the ones still waiting.
+    """
+
+    def __init__(self, message_publisher: MessagePublisherInterface, max_queue_size: int = 10_000):
+        """
+        Initialize the background message publisher.
+
+        Args:
+            message_publisher: The publisher that sends the messages
+            max_queue_size: Maximum number of messages waiting to be published
+        """
+        self.message_publisher = message_publisher
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._worker: Optional[threading.Thread] = None
+
+    def connect(self) -> bool:
+        """
+        Connect the wrapped publisher and start the background thread.
+
+        Returns:
+            bool: True if connection was successful, False otherwise
+        """
+        connected = self.message_publisher.connect()
+        if connected and self._worker is None:
+            self._worker = threading.Thread(
+                target=self._run,
+                name="background-message-publisher",
+                daemon=True
+            )
+            self._worker.start()
+        return connected
+
+    def disconnect(self) -> bool:
+        """
+        Publish the queued messages, stop the background thread and disconnect.
+
+        Returns:
+            bool: True if disconnection was successful, False otherwise
+        """
+        if self._worker is not None:
+            self._queue.put(_STOP)
+            self._worker.join()
+            self._worker = None
+        return self.message_publisher.disconnect()
+
+    def publish_message(self,
+                        exchange: str,
+                        routing_key: str,
+                        message: Dict[str, Any],
+                        content_type: str = "application/json",
+                        persistent: bool = True,
+                        schema: Optional[str] = None) -> bool:
+        """
+        Queue a message to be published in the background.
+
+        Args:
+            exchange: The exchange to publish to
+            routing_key: The routing key for the message
+            message: The message to publish
+            content_type: The content type of the message
+            persistent: Whether the message should be persisted by the broker
+            schema: Optional identifier of the message schema
+
+        Returns:
+            bool: True if the message was queued, False if it was dropped
+        """
+        return self._enqueue(
+            self.message_publisher.publish_message,
+            exchange=exchange,
+            routing_key=routing_key,
+            message=message,
+            content_type=content_type,
+            persistent=persistent,
+            schema=schema
+        )
+
+    def publish_raw(self,
+                    exchange: str,
+                    routing_key: str,
+                    body: bytes,
+                    content_type: str = "application/json",
+                    persistent: bool = True,
+                    schema: Optional[str] = None) -> bool:
+        """
+        Queue an already-serialized message body to be published in the background.
+
+        Args:
+            exchange: The exchange to publish to
+            routing_key: The routing key for the message
+            body: The serialized message body, sent unmodified
+            content_type: The content type of the message
+            persistent: Whether the message should be persisted by the broker
+            schema: Optional identifier of the message schema
+
+        Returns:
+            bool: True if the message was queued, False if it was dropped
+        """
+        return self._enqueue(
+            self.message_publisher.publish_raw,
+            exchange=exchange,
+            routing_key=routing_key,
+            body=body,
+            content_type=content_type,
+            persistent=persistent,
+            schema=schema
+        )
+
+    def _enqueue(self, publish: Callable[..., bool], **kwargs: Any) -> bool:
+        """
+        Queue a publish call for the background thread.
+
+        Args:
+            publish: The wrapped publisher method to call
+            **kwargs: Keyword arguments for the publish call
+
+        Returns:
+            bool: True if the call was queued, False if it was dropped
+        """
+        if self._worker is None:
+            logger.warning("Publisher is not connected, dropping message for routing key '%s'",
+                           kwargs["routing_key"])
+            return False
+
+        try:
+            self._queue.put_nowait((publish, kwargs))
+        except queue.Full:
+            logger.warning("Publish queue is full, dropping message for routing key '%s'",
+                           kwargs["routing_key"])
+            return False
+        return True
+
+    def _run(self) -> None:
+        """Publish queued messages until told to stop."""
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+
+            publish, kwargs = item
+            try:
+                published = publish(**kwargs)
+            except Exception as e:
+                logger.exception("Error publishing message in the background: %s", e)
+                continue
+
+            if published:
+                logger.info("Published message to routing key '%s'", kwargs["routing_key"])
+            else:
+                logger.warning("Background publish to routing key '%s' failed", kwargs["routing_key"])
@@ -4,12 +4,17 @@ Message Consumer Service.
 This service is responsible for consuming messages from a message queue
 and processing them to extract commitments and create reminders.
 """
+import functools
 import logging
-from typing import Any, Dict, Optional
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from pydantic import ValidationError
 
 from audhd_lifecoach.application.interfaces.message_consumer_interface import MessageConsumerInterface
 from audhd_lifecoach.application.use_cases.process_communication import ProcessCommunication
-from audhd_lifecoach.application.dtos.communication_dto import CommunicationRequestDTO
+from audhd_lifecoach.application.dtos.communication_dto import CommunicationRequestDTO, CommunicationResponseDTO
 
 
 logger = logging.getLogger(__name__)
@@ -24,7 +29,12 @@ class MessageConsumerService:
     def __init__(self, 
                  message_consumer: MessageConsumerInterface, 
                  process_communication_use_case: ProcessCommunication,
-                 queue_name: str = "communications"):
+                 queue_name: str = "communications",
+                 max_workers: int = 8,
+                 ack_batch_size: int = 10,
+                 ack_flush_interval: float = 0.05,
+                 consumer_factory: Optional[Callable[[], MessageConsumerInterface]] = None,
+                 num_consumers: int = 1):
         """
         Initialize the message consumer service.
         
@@ -32,27 +42,44 @@ class MessageConsumerService:
             message_consumer: The message consumer adapter to use
             process_communication_use_case: The use case for processing communications
             queue_name: The name of the queue to consume from
+            max_workers: Number of worker threads processing messages concurrently.
+                The consumers' prefetch limits bound how many messages wait for
+                a free worker.
+            ack_batch_size: Number of acknowledgments buffered before they are sent
+            ack_flush_interval: Seconds a partial batch of acknowledgments may wait
+                before it is sent
+            consumer_factory: Creates additional message consumers, each with its
+                own broker connection. Required when num_consumers is above one.
+            num_consumers: Number of message consumers, each run on its own thread
         """
+        if num_consumers > 1 and consumer_factory is None:
+            raise ValueError("consumer_factory is required when num_consumers is above one")
+        
         self.message_consumer = message_consumer
         self.process_communication_use_case = process_communication_use_case
         self.queue_name = queue_name
-        self.is_consuming = False
-        
-    def _validate_message(self, message_data: Dict[str, Any]) -> bool:
-        """
-        Validate that a message has the required fields.
+        self.max_workers = max_workers
+        self._running = threading.Event()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.ack_batch_size = ack_batch_size
+        self.ack_flush_interval = ack_flush_interval
+        self.consumer_factory = consumer_factory
+        self.num_consumers = num_consumers
+        self._consumers: List[MessageConsumerInterface] = []
+        self._consumer_threads: List[threading.Thread] = []
+        self._runs_in_background = False
+        self._ack_buffer: List[Tuple[MessageConsumerInterface, Any]] = []
+        self._ack_lock = threading.Lock()
+        self._ack_timer: Optional[threading.Timer] = None
         
-        Args:
-            message_data: The message data to validate
-            
-        Returns:
-            bool: True if the message is valid, False otherwise
-        """
-        # Check for required fields
-        required_fields = ["content", "sender", "recipient"]
-        return all(field in message_data for field in required_fields)
+    @property
+    def is_consuming(self) -> bool:
+        """Whether the service is currently consuming messages."""
+        return self._running.is_set()
     
-    def _process_message(self, message_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def _process_message(self,
+                         message_data: Union[bytes, Dict[str, Any]],
+                         message_id: Any = None) -> Optional[Dict[str, Any]]:
         """
         Process a message to extract commitments and create reminders.
         
@@ -60,94 +87,269 @@ class MessageConsumerService:
         processor, and returns the result including any reminders created.
         
         Args:
-            message_data: The message data to process
-            
+            message_data: The message data to process, either already decoded or
+                as the raw JSON body delivered by the broker
+            message_id: The ID of the message. Defaults to the "message_id"
+                entry of decoded message data.
+        
         Returns:
             Optional[Dict[str, Any]]: The processing result, or None if validation fails
         """
-        # First, validate the message
-        if not self._validate_message(message_data):
-            logger.warning(f"Received invalid message: {message_data}")
+        communication_dto = self._validate(message_data)
+        if communication_dto is None:
             return None
-            
-        # Create a CommunicationRequestDTO from the message data
-        communication_dto = CommunicationRequestDTO(
-            content=message_data["content"],
-            sender=message_data["sender"],
-            recipient=message_data["recipient"],
-            timestamp=message_data.get("timestamp")
-        )
+        
+        if message_id is None and isinstance(message_data, dict):
+            message_id = message_data.get("message_id")
         
         # Process the communication using the use case
         response_dto = self.process_communication_use_case.execute(communication_dto)
         
-        # Format the results for return
-        result = {
-            "message_id": message_data.get("message_id", "unknown"),
-            "commitments_found": len(response_dto.reminders),
-            "reminders": [self._format_reminder(r) for r in response_dto.reminders]
-        }
+        return self._format_result(message_id, response_dto)
+    
+    def process_messages(self,
+                         messages: List[Union[bytes, Dict[str, Any]]],
+                         message_ids: Optional[List[Any]] = None) -> List[Optional[Dict[str, Any]]]:
+        """
+        Process several messages to extract commitments and create reminders.
+        
+        The valid messages are processed as one batch, so the commitment
+        identifier analyzes them together instead of once per message.
+        
+        Args:
+            messages: The messages to process, each either already decoded or
+                as the raw JSON body delivered by the broker
+            message_ids: The ID of each message, in the same order. Defaults to
+                the "message_id" entry of decoded message data; raw bodies
+                carry no ID of their own.
+        
+        Returns:
+            List[Optional[Dict[str, Any]]]: The processing result for each
+                message, in order, or None for a message that fails validation
+        
+        Raises:
+            ValueError: If message_ids does not have one ID per message
+        """
+        if message_ids is not None and len(message_ids) != len(messages):
+            raise ValueError("message_ids must have one ID per message")
+        
+        communication_dtos = [self._validate(message_data) for message_data in messages]
+        valid = [index for index, dto in enumerate(communication_dtos) if dto is not None]
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * len(messages)
+        if not valid:
+            return results
+        
+        response_dtos = self.process_communication_use_case.execute_many(
+            [communication_dtos[index] for index in valid]
+        )
+        for index, response_dto in zip(valid, response_dtos):
+            message_data = messages[index]
+            message_id = message_ids[index] if message_ids is not None else None
+            if message_id is None and isinstance(message_data, dict):
+                message_id = message_data.get("message_id")
+            results[index] = self._format_result(message_id, response_dto)
         
-        return result
+        return results
     
     @staticmethod
-    def _format_reminder(reminder_dto) -> Dict[str, Any]:
+    def _validate(message_data: Union[bytes, Dict[str, Any]]) -> Optional[CommunicationRequestDTO]:
         """
-        Format a reminder DTO as a dictionary for the response.
+        Validate a message and build its request DTO in a single pass.
         
         Args:
-            reminder_dto: The reminder DTO to format
-            
+            message_data: The message data, either already decoded or as the raw
+                JSON body delivered by the broker
+        
+        Returns:
+            Optional[CommunicationRequestDTO]: The request DTO, or None if the
+                message is invalid
+        """
+        # Raw bodies are parsed straight into the DTO by pydantic-core
+        try:
+            if isinstance(message_data, bytes):
+                return CommunicationRequestDTO.model_validate_json(message_data)
+            return CommunicationRequestDTO.model_validate(message_data)
+        except ValidationError as e:
+            logger.warning("Received invalid message: %s (%d validation errors)", message_data, e.error_count())
+            return None
+    
+    @staticmethod
+    def _format_result(message_id: Any, response_dto: CommunicationResponseDTO) -> Dict[str, Any]:
+        """
+        Format the result of processing a message.
+        
+        Args:
+            message_id: The ID of the processed message
+            response_dto: The response from processing the message
+        
         Returns:
-            Dict[str, Any]: A dictionary representation of the reminder
+            Dict[str, Any]: The processing result
         """
         return {
-            "when": reminder_dto.when.isoformat(),
-            "message": reminder_dto.message,
-            "acknowledged": reminder_dto.acknowledged,
-            "commitment_who": reminder_dto.commitment_who,
-            "commitment_what": reminder_dto.commitment_what,
-            "commitment_where": reminder_dto.commitment_where,
-            "commitment_start_time": reminder_dto.commitment_start_time.isoformat(),
-            "commitment_end_time": reminder_dto.commitment_end_time.isoformat(),
+            "message_id": message_id if message_id is not None else "unknown",
+            "commitments_found": len(response_dto.reminders),
+            # Serialized by pydantic-core in a single call rather than per reminder
+            "reminders": response_dto.model_dump(include={"reminders"})["reminders"]
         }
     
-    def _message_callback(self, message_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def _raw_message_callback(self,
+                              body: bytes,
+                              message_id: str,
+                              consumer: Optional[MessageConsumerInterface] = None) -> Future:
         """
         Callback function for the message consumer.
         
         This function is called by the message consumer when a message is received.
-        It processes the message and handles acknowledgment/rejection.
+        Processing is handed to the worker pool so the consumer loop can fetch the
+        next delivery straight away; acknowledgment/rejection happens once the
+        worker finishes. The body reaches the worker undecoded and is parsed
+        straight into the request DTO, without building an intermediate
+        dictionary.
         
         Args:
-            message_data: The message data received from the queue
-            
+            body: The message body received from the queue
+            message_id: The ID of the message
+            consumer: The consumer that received the message. Defaults to the
+                service's primary message consumer.
+        
         Returns:
-            Optional[Dict[str, Any]]: The processing result, or None if validation fails
+            Future: Resolves to the processing result, or None if validation fails
         """
-        message_id = message_data.get("message_id", "unknown")
+        return self._dispatch(consumer, message_id, body, message_id)
+    
+    def _dispatch(self,
+                  consumer: Optional[MessageConsumerInterface],
+                  message_id: Any,
+                  *args: Any) -> Future:
+        """
+        Submit a message to the worker pool.
+        
+        This runs on the consumer's IO thread, so it never waits: the broker
+        stops delivering once the consumer's prefetch limit of unacknowledged
+        messages is reached, which bounds the work queued here.
         
+        Args:
+            consumer: The consumer that received the message. Defaults to the
+                service's primary message consumer.
+            message_id: The ID of the message
+            *args: Arguments for _process_message
+        
+        Returns:
+            Future: Resolves to the processing result, or None if validation fails
+        """
+        consumer = consumer or self.message_consumer
+        
+        future = self._executor.submit(self._process_message, *args)
+        future.add_done_callback(lambda f: self._ack_or_reject(consumer, message_id, f))
+        return future
+    
+    def _ack_or_reject(self, 
+                       consumer: MessageConsumerInterface, 
+                       message_id: Any, 
+                       future: Future) -> None:
+        """
+        Acknowledge or reject a message once its processing has finished.
+        
+        Args:
+            consumer: The consumer that received the message
+            message_id: The ID of the processed message
+            future: The completed processing future
+        """
         try:
-            # Process the message
-            result = self._process_message(message_data)
-            
-            # If processing succeeded, acknowledge the message
-            if result is not None and "error" not in result:
-                self.message_consumer.acknowledge_message(message_id)
-                logger.info(f"Successfully processed message {message_id} "
-                           f"with {result.get('commitments_found', 0)} commitments found.")
-                return result
-            
-            # If processing failed or returned None (invalid message), reject the message
-            self.message_consumer.reject_message(message_id, requeue=False)
-            logger.warning(f"Failed to process message {message_id}")
-            return result
-            
+            result = future.result()
         except Exception as e:
             # If an exception occurred, reject the message and log the error
-            logger.exception(f"Error in message callback for message {message_id}: {e}")
-            self.message_consumer.reject_message(message_id, requeue=True)
-            return None
+            logger.exception("Error in message callback for message %s: %s", message_id, e)
+            consumer.reject_message(message_id, requeue=True)
+            return
+        
+        # If processing succeeded, acknowledge the message
+        if result is not None and "error" not in result:
+            self._buffer_ack(message_id, consumer)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Successfully processed message %s with %d commitments found.",
+                            message_id, result.get("commitments_found", 0))
+            return
+        
+        # If processing failed or returned None (invalid message), reject the message
+        consumer.reject_message(message_id, requeue=False)
+        logger.warning("Failed to process message %s", message_id)
+    
+    def _buffer_ack(self, 
+                    message_id: Any, 
+                    consumer: Optional[MessageConsumerInterface] = None) -> None:
+        """
+        Queue a message acknowledgment to be sent with the next batch.
+        
+        A full batch is sent straight away; a partial one is sent when the
+        flush timer fires.
+        
+        Args:
+            message_id: The ID of the message to acknowledge
+            consumer: The consumer that received the message. Defaults to the
+                service's primary message consumer.
+        """
+        batch = None
+        with self._ack_lock:
+            self._ack_buffer.append((consumer or self.message_consumer, message_id))
+            if len(self._ack_buffer) >= self.ack_batch_size:
+                batch = self._take_ack_batch()
+            elif self._ack_timer is None:
+                self._ack_timer = threading.Timer(self.ack_flush_interval, self._flush_acks)
+                self._ack_timer.daemon = True
+                self._ack_timer.start()
+        
+        if batch:
+            self._send_acks(batch)
+    
+    def _flush_acks(self) -> None:
+        """Send any buffered acknowledgments."""
+        with self._ack_lock:
+            batch = self._take_ack_batch()
+        
+        if batch:
+            self._send_acks(batch)
+    
+    def _take_ack_batch(self) -> List[Tuple[MessageConsumerInterface, Any]]:
+        """
+        Empty the acknowledgment buffer and cancel the pending flush.
+        
+        Must be called with the acknowledgment lock held.
+        
+        Returns:
+            List[Tuple[MessageConsumerInterface, Any]]: The buffered
+                (consumer, message ID) pairs
+        """
+        batch = self._ack_buffer
+        self._ack_buffer = []
+        if self._ack_timer is not None:
+            self._ack_timer.cancel()
+            self._ack_timer = None
+        return batch
+    
+    @staticmethod
+    def _send_acks(batch: List[Tuple[MessageConsumerInterface, Any]]) -> None:
+        """
+        Acknowledge a batch of messages through the consumers that received them.
+        
+        Message IDs are only meaningful to the consumer that received the
+        message, so each consumer acknowledges its own share of the batch. A
+        consumer that fails to acknowledge, e.g. because its connection has
+        closed, is logged and skipped; the broker redelivers those messages.
+        
+        Args:
+            batch: The (consumer, message ID) pairs to acknowledge
+        """
+        message_ids_by_consumer: Dict[MessageConsumerInterface, List[Any]] = {}
+        for consumer, message_id in batch:
+            message_ids_by_consumer.setdefault(consumer, []).append(message_id)
+        
+        for consumer, message_ids in message_ids_by_consumer.items():
+            try:
+                consumer.acknowledge_messages(message_ids)
+            except Exception as e:
+                logger.exception("Error acknowledging messages %s: %s", message_ids, e)
     
     def start(self, block: bool = True) -> None:
         """
@@ -155,37 +357,118 @@ class MessageConsumerService:
         
         Args:
             block: Whether to block the current thread. If True, the method
-                  will not return until stop() is called. If False, the consumer
-                  will run in a separate thread.
+                  will not return until consuming ends. If False, every
+                  consumer runs in its own background thread until stop()
+                  is called.
         """
-            
+        consumers = [self.message_consumer]
+        if self.consumer_factory is not None:
+            consumers.extend(self.consumer_factory() for _ in range(self.num_consumers - 1))
+        
         # Connect to the message broker first - this is needed in both blocking and non-blocking modes
-        connected = self.message_consumer.connect()
-        if not connected:
-            logger.error("Failed to connect to the message broker")
-            return
+        for consumer in consumers:
+            if not consumer.connect():
+                logger.error("Failed to connect to the message broker")
+                self._disconnect_consumers()
+                return
+            self._consumers.append(consumer)
+        
+        self._running.set()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="message-consumer"
+        )
+        
+        # In blocking mode the primary consumer runs on the calling thread
+        self._runs_in_background = not block
+        background_consumers = self._consumers if not block else self._consumers[1:]
+        self._consumer_threads = [
+            threading.Thread(
+                target=self._consumer_loop,
+                args=(consumer,),
+                name=f"message-consumer-loop-{index}",
+                daemon=True
+            )
+            for index, consumer in enumerate(background_consumers)
+        ]
+        for thread in self._consumer_threads:
+            thread.start()
         
-        self.is_consuming = True
+        if block:
+            try:
+                self._consumer_loop(self.message_consumer)
+            finally:
+                # The remaining consumers stop along with the primary one
+                self._stop_consumers()
+                self._shutdown()
+    
+    def _consumer_loop(self, consumer: MessageConsumerInterface) -> None:
+        """
+        Consume messages from the queue until the consumer stops.
         
+        Args:
+            consumer: The message consumer to run
+        """
         try:
             # Start consuming messages
-            logger.info(f"Starting to consume messages from queue '{self.queue_name}'")
-            self.message_consumer.consume_messages(self.queue_name, self._message_callback)
+            logger.info("Starting to consume messages from queue '%s'", self.queue_name)
+            consumer.consume_raw(
+                self.queue_name,
+                functools.partial(self._raw_message_callback, consumer=consumer)
+            )
         except Exception as e:
-            logger.exception(f"Error in consumer loop: {e}")
-        finally:
-            # Make sure to disconnect when the loop ends
-            self.message_consumer.disconnect()
-            self.is_consuming = False
+            logger.exception("Error in consumer loop: %s", e)
+    
+    def _stop_consumers(self) -> None:
+        """Stop every consumer from receiving new messages, leaving it connected."""
+        for consumer in self._consumers or [self.message_consumer]:
+            try:
+                consumer.stop_consuming()
+            except Exception as e:
+                logger.exception("Error stopping message consumer: %s", e)
+    
+    def _shutdown(self) -> None:
+        """
+        Wait for the consumer threads and in-flight messages, then disconnect.
+        
+        Consuming must already have been stopped, so no new messages arrive
+        while the workers finish, and every consumer is still connected to
+        acknowledge them.
+        """
+        for thread in self._consumer_threads:
+            thread.join()
+        self._consumer_threads = []
+        
+        # Let in-flight messages finish so their acks are sent before disconnecting
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self._flush_acks()
+        
+        # Make sure to disconnect when the loops end
+        self._disconnect_consumers()
+        self._running.clear()
+    
+    def _disconnect_consumers(self) -> None:
+        """Disconnect every connected consumer from the message broker."""
+        for consumer in self._consumers:
+            consumer.disconnect()
+        self._consumers = []
     
     def stop(self) -> None:
         """Stop consuming messages."""
         
         logger.info("Stopping message consumer")
-        self.is_consuming = False
+        self._running.clear()
+        
+        # Stop new deliveries; this makes the consumer loops return while the
+        # connections stay open for the in-flight messages' acknowledgments
+        self._stop_consumers()
         
-        # Disconnect from the message broker
-        # This should cause the consumer loop to exit
-        self.message_consumer.disconnect()
+        # Consumers started in the background are cleaned up here; a blocking
+        # start() cleans up after its own loop returns
+        if self._runs_in_background:
+            self._runs_in_background = False
+            self._shutdown()
             
-        logger.info("Message consumer stopped")
\ No newline at end of file
+        logger.info("Message consumer stopped")
@@ -4,20 +4,28 @@ Use case for processing communications received through the API.
 This use case handles the flow of receiving a communication via the API,
 processing it to extract commitments, and creating reminders.
 """
-import json
 import logging
-import uuid
-from datetime import datetime, UTC
+import os
+from datetime import datetime, timezone
 from typing import Dict, List, Any
 
+import orjson
+
 from audhd_lifecoach.application.dtos.communication_dto import CommunicationRequestDTO, CommunicationResponseDTO, ReminderResponseDTO
 from audhd_lifecoach.core.services.communication_processor import CommunicationProcessor
 from audhd_lifecoach.core.domain.entities.communication import Communication
+from audhd_lifecoach.core.domain.entities.reminder import Reminder
 from audhd_lifecoach.application.interfaces.message_publisher_interface import MessagePublisherInterface
 
 
 logger = logging.getLogger(__name__)
 
+# Routing key for published processing results
+PROCESSED_COMMUNICATION_ROUTING_KEY = "communication.processed"
+
+# Schema identifier attached to published results so consumers can pick a decoder
+PROCESSED_COMMUNICATION_SCHEMA = "CommunicationProcessed/v1"
+
 
 class ProcessCommunication:
     """Use case for processing communications through the API."""
@@ -50,21 +58,69 @@ class ProcessCommunication:
         Returns:
             Response DTO with processing results and created reminders
         """
-        # Convert DTO to domain entity
-        communication = Communication(
+        communication = self._to_communication(communication_dto)
+        
+        # Process the communication
+        reminders = self.communication_processor.process_communication(communication)
+        
+        return self._respond(communication_dto, reminders)
+    
+    def execute_many(self, communication_dtos: List[CommunicationRequestDTO]) -> List[CommunicationResponseDTO]:
+        """
+        Execute the use case for several communications at once.
+        
+        The communications are processed as one batch, so the commitment
+        identifier analyzes them together; the results for each communication
+        are published just as they are by execute.
+        
+        Args:
+            communication_dtos: DTOs containing the communication data
+            
+        Returns:
+            Response DTOs with processing results and created reminders, in order
+        """
+        communications = [self._to_communication(dto) for dto in communication_dtos]
+        
+        # Process the communications as one batch
+        reminders_per_communication = self.communication_processor.process_communications(communications)
+        
+        return [
+            self._respond(communication_dto, reminders)
+            for communication_dto, reminders in zip(communication_dtos, reminders_per_communication)
+        ]
+    
+    @staticmethod
+    def _to_communication(communication_dto: CommunicationRequestDTO) -> Communication:
+        """
+        Convert a communication DTO to a domain entity.
+        
+        Args:
+            communication_dto: DTO containing the communication data
+            
+        Returns:
+            Communication: The communication domain entity
+        """
+        return Communication(
             content=communication_dto.content,
             sender=communication_dto.sender,
             recipient=communication_dto.recipient,
             timestamp=communication_dto.timestamp
         )
+    
+    def _respond(self, communication_dto: CommunicationRequestDTO, reminders: List[Reminder]) -> CommunicationResponseDTO:
+        """
+        Build the response for a processed communication and publish it.
         
-        # Process the communication
-        reminders = self.communication_processor.process_communication(communication)
-        
+        Args:
+            communication_dto: The original communication DTO
+            reminders: The reminders created from the communication
+            
+        Returns:
+            Response DTO with processing results and created reminders
+        """
         # Convert reminders to DTOs
-        reminder_dtos = []
-        for reminder in reminders:
-            reminder_dto = ReminderResponseDTO(
+        reminder_dtos = [
+            ReminderResponseDTO(
                 message=reminder.message,
                 when=reminder.when,
                 acknowledged=reminder.acknowledged,
@@ -74,7 +130,8 @@ class ProcessCommunication:
                 commitment_end_time=reminder.commitment.end_time,
                 commitment_where=reminder.commitment.where
             )
-            reminder_dtos.append(reminder_dto)
+            for reminder in reminders
+        ]
         
         # Create response DTO
         response = CommunicationResponseDTO(
@@ -86,7 +143,7 @@ class ProcessCommunication:
         try:
             self._publish_results(communication_dto, response)
         except Exception as e:
-            logger.error(f"Failed to publish communication results: {e}")
+            logger.error("Failed to publish communication results: %s", e)
             # We intentionally don't re-raise the exception to avoid affecting the main flow
             # The communication was processed successfully even if publishing fails
         
@@ -96,6 +153,8 @@ class ProcessCommunication:
         """
         Format a reminder DTO for publishing.
         
+        Datetimes are left as-is; orjson serializes them to ISO 8601.
+        
         Args:
             reminder_dto: The reminder DTO to format
             
@@ -103,15 +162,15 @@ class ProcessCommunication:
             Dict[str, Any]: A dictionary representation of the reminder
         """
         return {
-            "when": reminder_dto.when.isoformat(),
+            "when": reminder_dto.when,
             "message": reminder_dto.message,
             "acknowledged": reminder_dto.acknowledged,
             "commitment": {
                 "who": reminder_dto.commitment_who,
                 "what": reminder_dto.commitment_what,
                 "where": reminder_dto.commitment_where,
-                "start_time": reminder_dto.commitment_start_time.isoformat() if reminder_dto.commitment_start_time else None,
-                "end_time": reminder_dto.commitment_end_time.isoformat() if reminder_dto.commitment_end_time else None,
+                "start_time": reminder_dto.commitment_start_time,
+                "end_time": reminder_dto.commitment_end_time,
             }
         }
     
@@ -123,40 +182,43 @@ class ProcessCommunication:
         """
         Publish the results of processing a communication.
         
+        The message is serialized here, once, and handed to the publisher as
+        the finished body. A background publisher only queues it, so success
+        here means the publisher accepted the message; whether it reached the
+        broker is logged by the publisher.
+        
         Args:
             communication_dto: The original communication DTO
             response_dto: The response DTO containing processing results
             
         Returns:
-            bool: True if publishing was successful, False otherwise
+            bool: True if the publisher accepted the message, False otherwise
         """
         # Prepare the message
         message = {
-            "message_id": str(uuid.uuid4()),
-            "timestamp": datetime.now(UTC).isoformat(),
+            "message_id": os.urandom(16).hex(),
+            "timestamp": datetime.now(timezone.utc),
             "original_communication": {
                 "content": communication_dto.content,
                 "sender": communication_dto.sender,
                 "recipient": communication_dto.recipient,
-                "timestamp": communication_dto.timestamp.isoformat() if communication_dto.timestamp else None,
+                "timestamp": communication_dto.timestamp,
             },
             "processed": response_dto.processed,
             "reminders": [self._format_reminder_for_publishing(r) for r in response_dto.reminders]
         }
         
-        # Define the routing key for this type of message
-        routing_key = "communication.processed"
-        
         # Publish the message
-        success = self.message_publisher.publish_message(
+        success = self.message_publisher.publish_raw(
             exchange=self.exchange_name,
-            routing_key=routing_key,
-            message=message
+            routing_key=PROCESSED_COMMUNICATION_ROUTING_KEY,
+            body=orjson.dumps(message),
+            schema=PROCESSED_COMMUNICATION_SCHEMA
         )
         
         if success:
-            logger.info(f"Published communication results with {len(message['reminders'])} reminders")
+            logger.debug("Queued communication results with %d reminders for publishing", len(message["reminders"]))
         else:
-            logger.warning("Failed to publish communication results")
+            logger.warning("Failed to queue communication results for publishing")
             
         return success
\ No newline at end of file
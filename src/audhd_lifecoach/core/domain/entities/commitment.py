@@ -2,14 +2,24 @@
 Commitment entity represents a promise or obligation made by the user.
 """
 from datetime import datetime, timedelta
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, fields
+from typing import Any, List
 
 from audhd_lifecoach.core.domain.config import DEFAULT_TRAVEL_TIME, DEFAULT_PREP_TIME
 
 
-@dataclass
-class Commitment:
+class _CommitmentDerivedValues:
+    """
+    Slots for the values a Commitment derives from its fields.
+    
+    They live outside the dataclass, so they are not dataclass fields and stay
+    out of fields(), asdict(), __eq__ and __repr__.
+    """
+    __slots__ = ("_duration", "_departure_time", "_str_cache")
+
+
+@dataclass(slots=True, frozen=True)
+class Commitment(_CommitmentDerivedValues):
     """
     Represents a commitment or obligation that the user has made.
     
@@ -28,6 +38,29 @@ class Commitment:
     estimated_travel_time: timedelta = DEFAULT_TRAVEL_TIME
     estimated_prep_time: timedelta = DEFAULT_PREP_TIME
     
+    def __post_init__(self) -> None:
+        """Precompute the derived time values of this commitment."""
+        # The dataclass is frozen, so bypass its __setattr__
+        object.__setattr__(self, "_duration", self.end_time - self.start_time)
+        object.__setattr__(
+            self,
+            "_departure_time",
+            self.start_time - self.estimated_travel_time - self.estimated_prep_time
+        )
+        # The string representation is built on first use
+        object.__setattr__(self, "_str_cache", None)
+    
+    def __setstate__(self, state: List[Any]) -> None:
+        """
+        Restore a pickled or copied commitment and recompute its derived values.
+        
+        Args:
+            state: The field values, in field order
+        """
+        for commitment_field, value in zip(fields(self), state):
+            object.__setattr__(self, commitment_field.name, value)
+        self.__post_init__()
+    
     def calculate_departure_time(self) -> datetime:
         """
         Calculate when the user needs to leave to make this commitment.
@@ -37,7 +70,7 @@ class Commitment:
         Returns:
             datetime: The time the user should begin preparing for the commitment
         """
-        return self.start_time - self.estimated_travel_time - self.estimated_prep_time
+        return self._departure_time
     
     @classmethod
     def from_single_datetime(cls, when: datetime, who: str, what: str, where: str, 
@@ -76,11 +109,21 @@ class Commitment:
         Returns:
             str: A human-readable description of the commitment
         """
-        start_str = self.start_time.strftime("%Y-%m-%d %H:%M")
-        end_str = self.end_time.strftime("%H:%M") if self.start_time.date() == self.end_time.date() else self.end_time.strftime("%Y-%m-%d %H:%M")
-        duration = int((self.end_time - self.start_time).total_seconds() / 60)
-        
-        return f"Commitment to {self.what} with {self.who} at {self.where} on {start_str} to {end_str} ({duration} min)"
+        if self._str_cache is None:
+            # isoformat is much cheaper than strftime; slicing drops any UTC offset
+            start_str = self.start_time.isoformat(sep=' ', timespec='minutes')[:16]
+            end_str = self.end_time.isoformat(sep=' ', timespec='minutes')[:16]
+            if self.start_time.date() == self.end_time.date():
+                end_str = end_str[11:]
+            duration = int(self._duration.total_seconds() / 60)
+            
+            # The dataclass is frozen, so bypass its __setattr__
+            object.__setattr__(
+                self,
+                "_str_cache",
+                f"Commitment to {self.what} with {self.who} at {self.where} on {start_str} to {end_str} ({duration} min)"
+            )
+        return self._str_cache
     
     @property
     def duration(self) -> timedelta:
@@ -90,4 +133,4 @@ class Commitment:
         Returns:
             timedelta: The time between start_time and end_time
         """
-        return self.end_time - self.start_time
\ No newline at end of file
+        return self._duration
\ No newline at end of file
@@ -2,12 +2,22 @@
 Communication entity represents a message or interaction between individuals.
 """
 from datetime import datetime
-from dataclasses import dataclass, field
-from typing import Optional
+from dataclasses import dataclass, field, fields
+from typing import Any, List
 
 
-@dataclass
-class Communication:
+class _CommunicationDerivedValues:
+    """
+    Slots for the values a Communication derives from its fields.
+    
+    They live outside the dataclass, so they are not dataclass fields and stay
+    out of fields(), asdict(), __eq__ and __repr__.
+    """
+    __slots__ = ("_str_cache",)
+
+
+@dataclass(slots=True, frozen=True)
+class Communication(_CommunicationDerivedValues):
     """
     Represents a communication or interaction between individuals.
     
@@ -22,6 +32,22 @@ class Communication:
     # Optional attributes with defaults
     timestamp: datetime = field(default_factory=datetime.now)
     
+    def __post_init__(self) -> None:
+        """Prepare the string representation to be built on first use."""
+        # The dataclass is frozen, so bypass its __setattr__
+        object.__setattr__(self, "_str_cache", None)
+    
+    def __setstate__(self, state: List[Any]) -> None:
+        """
+        Restore a pickled or copied communication and reset its derived values.
+        
+        Args:
+            state: The field values, in field order
+        """
+        for communication_field, value in zip(fields(self), state):
+            object.__setattr__(self, communication_field.name, value)
+        self.__post_init__()
+    
     def __str__(self) -> str:
         """
         Return a string representation of the communication.
@@ -29,5 +55,14 @@ class Communication:
         Returns:
             str: A human-readable description of the communication
         """
-        time_str = self.timestamp.strftime("%Y-%m-%d %H:%M")
-        return f"From {self.sender} to {self.recipient} at {time_str}: {self.content}"
\ No newline at end of file
+        if self._str_cache is None:
+            # isoformat is much cheaper than strftime; slicing drops any UTC offset
+            time_str = self.timestamp.isoformat(sep=' ', timespec='minutes')[:16]
+            
+            # The dataclass is frozen, so bypass its __setattr__
+            object.__setattr__(
+                self,
+                "_str_cache",
+                f"From {self.sender} to {self.recipient} at {time_str}: {self.content}"
+            )
+        return self._str_cache
\ No newline at end of file
@@ -1,14 +1,14 @@
 """
 Reminder entity represents a notification about a commitment.
 """
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from dataclasses import dataclass
-from typing import Optional
+from typing import List, Optional
 
 from audhd_lifecoach.core.domain.entities.commitment import Commitment
 
 
-@dataclass
+@dataclass(slots=True)
 class Reminder:
     """
     Represents a reminder notification for a commitment.
@@ -50,14 +50,7 @@ class Reminder:
         
         # Generate a default message if none provided
         if message is None:
-            # Format the time based on whether it's today or a future date
-            today = datetime.now().date()
-            if commitment.start_time.date() == today:
-                time_str = commitment.start_time.strftime("%H:%M")
-                message = f"Reminder: You have a commitment with {commitment.who} at {time_str} today."
-            else:
-                date_time_str = commitment.start_time.strftime("%Y-%m-%d at %H:%M")
-                message = f"Reminder: You have a commitment with {commitment.who} on {date_time_str}."
+            message = cls._default_message(commitment, datetime.now().date())
         
         return cls(
             when=reminder_time,
@@ -65,6 +58,51 @@ class Reminder:
             message=message
         )
     
+    @classmethod
+    def from_commitments(cls, commitments: List[Commitment], 
+                         lead_time: timedelta = timedelta(minutes=30)) -> List['Reminder']:
+        """
+        Create a reminder with a default message for each of several commitments.
+        
+        The current date is looked up once for the whole batch rather than once
+        per reminder.
+        
+        Args:
+            commitments: The commitments to create reminders for
+            lead_time: How long before each commitment its reminder should be sent
+            
+        Returns:
+            A new Reminder instance for each commitment, in order
+        """
+        today = datetime.now().date()
+        return [
+            cls(
+                when=commitment.start_time - lead_time,
+                commitment=commitment,
+                message=cls._default_message(commitment, today)
+            )
+            for commitment in commitments
+        ]
+    
+    @staticmethod
+    def _default_message(commitment: Commitment, today: date) -> str:
+        """
+        Generate the default reminder message for a commitment.
+        
+        Args:
+            commitment: The commitment the reminder is for
+            today: The current date, used to word commitments happening today
+            
+        Returns:
+            The reminder message
+        """
+        start = commitment.start_time
+        # Format the time based on whether it's today or a future date
+        if start.date() == today:
+            return f"Reminder: You have a commitment with {commitment.who} at {start.hour:02d}:{start.minute:02d} today."
+        return (f"Reminder: You have a commitment with {commitment.who} on "
+                f"{start.year:04d}-{start.month:02d}-{start.day:02d} at {start.hour:02d}:{start.minute:02d}.")
+    
     def acknowledge(self) -> None:
         """
         Mark the reminder as acknowledged by the user.
@@ -102,4 +140,4 @@ class Reminder:
             str: A human-readable description of the reminder
         """
         status = "Acknowledged" if self.acknowledged else "Not acknowledged"
-        return f"Reminder at {self.when.strftime('%Y-%m-%d %H:%M')}: {self.message} [{status}]"
\ No newline at end of file
+        return f"Reminder at {self.when.isoformat(sep=' ', timespec='minutes')[:16]}: {self.message} [{status}]"
\ No newline at end of file
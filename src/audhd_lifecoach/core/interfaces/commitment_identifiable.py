@@ -26,4 +26,19 @@ class CommitmentIdentifiable(Protocol):
         Returns:
             A list of identified commitments (empty if none found)
         """
+        ...
+    
+    def identify_commitments_batch(self, communications: List[Communication]) -> List[List[Commitment]]:
+        """
+        Identify the commitments contained within each of several communications.
+        
+        Implementations can analyze the communications together, which is
+        much cheaper than one call per communication for model-based analysis.
+        
+        Args:
+            communications: The communications to analyze
+            
+        Returns:
+            A list of identified commitments for each communication, in order
+        """
         ...
\ No newline at end of file
@@ -5,7 +5,10 @@ This service orchestrates the flow from Communication to Commitment to Reminder,
 handling the extraction of commitments from communications and the creation
 of reminders from those commitments.
 """
-from typing import List
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple
 
 from audhd_lifecoach.core.domain.entities.communication import Communication
 from audhd_lifecoach.core.domain.entities.commitment import Commitment
@@ -13,6 +16,10 @@ from audhd_lifecoach.core.domain.entities.reminder import Reminder
 from audhd_lifecoach.core.interfaces.commitment_identifiable import CommitmentIdentifiable
 
 
+# Identifies a communication for the commitment cache: content, sender, recipient
+CacheKey = Tuple[str, str, str]
+
+
 class CommunicationProcessor:
     """
     Service that processes communications to extract commitments and create reminders.
@@ -20,16 +27,33 @@ class CommunicationProcessor:
     This service orchestrates the flow from Communication to Reminder by:
     1. Using a commitment identifier to extract commitments from communications
     2. Creating reminders from the identified commitments
+    
+    Commitments identified for a communication can optionally be cached for a
+    short time, so a resubmitted or forwarded message does not go through the
+    identifier again. The cache is off by default: a cached commitment such as
+    "tomorrow at 9" stays relative to when the message was first processed,
+    which is why entries expire.
     """
     
-    def __init__(self, commitment_identifier: CommitmentIdentifiable):
+    def __init__(self,
+                 commitment_identifier: CommitmentIdentifiable,
+                 cache_size: int = 0,
+                 cache_ttl: float = 60.0):
         """
         Initialize the communication processor with a commitment identifier.
         
         Args:
             commitment_identifier: Component that identifies commitments in communications
+            cache_size: Maximum number of communications whose commitments are
+                cached. Defaults to zero, which disables the cache.
+            cache_ttl: Seconds a cached result may be reused
         """
         self.commitment_identifier = commitment_identifier
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        
+        self._cache: "OrderedDict[CacheKey, Tuple[float, List[Commitment]]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
     
     def process_communication(self, communication: Communication) -> List[Reminder]:
         """
@@ -37,17 +61,102 @@ class CommunicationProcessor:
         
         Args:
             communication: The communication to process
-            
+        
         Returns:
             List of reminders created from the communication (empty if no commitments found)
         """
         # Extract commitments from the communication
-        commitments = self.commitment_identifier.identify_commitments(communication)
+        key = self._cache_key(communication)
+        commitments = self._get_cached(key)
+        if commitments is None:
+            commitments = self.commitment_identifier.identify_commitments(communication)
+            self._store(key, commitments)
         
         # Create reminders from the extracted commitments
-        reminders = []
-        for commitment in commitments:
-            reminder = Reminder.from_commitment(commitment)
-            reminders.append(reminder)
+        return Reminder.from_commitments(commitments)
+    
+    def process_communications(self, communications: List[Communication]) -> List[List[Reminder]]:
+        """
+        Process several communications to create reminders from their commitments.
+        
+        The commitment identifier analyzes all of the communications in a single
+        batch.
+        
+        Args:
+            communications: The communications to process
+        
+        Returns:
+            List of reminders created from each communication, in order
+        """
+        keys = [self._cache_key(communication) for communication in communications]
+        commitments_per_communication = [self._get_cached(key) for key in keys]
+        
+        # Identify the communications that were not cached in one batch
+        missing = [index for index, commitments in enumerate(commitments_per_communication) if commitments is None]
+        if missing:
+            identified = self.commitment_identifier.identify_commitments_batch(
+                [communications[index] for index in missing]
+            )
+            for index, commitments in zip(missing, identified):
+                commitments_per_communication[index] = commitments
+                self._store(keys[index], commitments)
+        
+        return [Reminder.from_commitments(commitments) for commitments in commitments_per_communication]
+    
+    @staticmethod
+    def _cache_key(communication: Communication) -> CacheKey:
+        """
+        Build the cache key for a communication.
+        
+        Args:
+            communication: The communication to build the key for
+        
+        Returns:
+            CacheKey: The key identifying the communication in the cache
+        """
+        return communication.content, communication.sender, communication.recipient
+    
+    def _get_cached(self, key: CacheKey) -> Optional[List[Commitment]]:
+        """
+        Look up the cached commitments for a communication.
+        
+        Args:
+            key: The communication's cache key
+        
+        Returns:
+            Optional[List[Commitment]]: The cached commitments, or None if they
+                are not cached or have expired
+        """
+        if self.cache_size <= 0:
+            return None
+        
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+        
+            stored_at, commitments = entry
+            if time.monotonic() - stored_at > self.cache_ttl:
+                del self._cache[key]
+                return None
+        
+            self._cache.move_to_end(key)
+            return commitments
+    
+    def _store(self, key: CacheKey, commitments: List[Commitment]) -> None:
+        """
+        Cache the commitments identified for a communication.
+        
+        Args:
+            key: The communication's cache key
+            commitments: The identified commitments
+        """
+        if self.cache_size <= 0:
+            return
         
-        return reminders
\ No newline at end of file
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic(), commitments)
+            self._cache.move_to_end(key)
+            # Evict the least recently used entries
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
@@ -0,0 +1,164 @@
+"""
+Service for dispatching reminders when they become due.
+
+Reminders are kept in a heap ordered by when they are due, so finding the
+next due reminder never means scanning every reminder, and the dispatch loop
+sleeps until exactly that moment instead of polling.
+"""
+import heapq
+import itertools
+import threading
+from datetime import datetime, timedelta
+from typing import Callable, List, Optional, Tuple
+
+from audhd_lifecoach.core.domain.entities.reminder import Reminder
+
+
+class ReminderScheduler:
+    """
+    Service that dispatches reminders at their scheduled time.
+    
+    Snoozing a reminder schedules it again at its new time; the entry for the
+    old time is left in the heap and skipped when it reaches the top, as are
+    entries for reminders that have been acknowledged.
+    """
+    
+    def __init__(self,
+                 on_due: Callable[[Reminder], None],
+                 clock: Callable[[], datetime] = datetime.now,
+                 max_batch: Optional[int] = 64):
+        """
+        Initialize the reminder scheduler.
+        
+        Args:
+            on_due: Function called with each reminder once it is due
+            clock: Function returning the current time, compared against
+                each reminder's scheduled time
+            max_batch: Maximum number of reminders dispatched per cycle, so a
+                backlog of due reminders is spread over several cycles instead
+                of holding up the loop. None dispatches every due reminder.
+        """
+        self.on_due = on_due
+        self.clock = clock
+        self.max_batch = max_batch
+        
+        self._heap: List[Tuple[datetime, int, Reminder]] = []
+        # Tiebreaker so reminders due at the same time are never compared
+        self._sequence = itertools.count()
+        self._changed = threading.Condition()
+    
+    def schedule(self, reminder: Reminder) -> None:
+        """
+        Schedule a reminder to be dispatched at its scheduled time.
+        
+        Args:
+            reminder: The reminder to schedule
+        """
+        with self._changed:
+            heapq.heappush(self._heap, (reminder.when, next(self._sequence), reminder))
+            # Wake the dispatch loop in case this reminder is due sooner
+            self._changed.notify_all()
+    
+    def snooze(self, reminder: Reminder, duration: timedelta) -> None:
+        """
+        Postpone a reminder and reschedule it for its new time.
+        
+        Args:
+            reminder: The reminder to postpone
+            duration: How long to postpone the reminder
+        """
+        with self._changed:
+            reminder.snooze(duration)
+            self.schedule(reminder)
+    
+    def next_due_time(self) -> Optional[datetime]:
+        """
+        Get the time the next scheduled reminder is due.
+        
+        Returns:
+            Optional[datetime]: The time the next reminder is due, or None if
+                no reminders are scheduled
+        """
+        with self._changed:
+            self._discard_stale_entries()
+            return self._heap[0][0] if self._heap else None
+    
+    def dispatch_due(self) -> int:
+        """
+        Dispatch the reminders that are due, earliest first.
+        
+        At most max_batch reminders are dispatched; any others that are due
+        stay scheduled for the next cycle.
+        
+        Returns:
+            int: The number of reminders dispatched
+        """
+        now = self.clock()
+        due = []
+        with self._changed:
+            self._discard_stale_entries()
+            while self._heap and self._heap[0][0] <= now:
+                if self.max_batch is not None and len(due) >= self.max_batch:
+                    break
+                due.append(heapq.heappop(self._heap)[2])
+                self._discard_stale_entries()
+        
+        # Call out without holding the lock so on_due may schedule reminders
+        for reminder in due:
+            self.on_due(reminder)
+        return len(due)
+    
+    def run(self, stop_event: threading.Event, max_wait: float = 60.0) -> None:
+        """
+        Dispatch reminders as they become due until stop_event is set.
+        
+        Between dispatches the loop sleeps until the next reminder is due, or
+        at most max_wait seconds, waking early when a reminder is scheduled.
+        
+        Args:
+            stop_event: Event that ends the loop once set
+            max_wait: Longest time in seconds to sleep between checks
+        """
+        while not stop_event.is_set():
+            self.dispatch_due()
+        
+            with self._changed:
+                # Checked under the lock so a wake-up from stop() is not missed
+                if stop_event.is_set():
+                    return
+                next_due = self.next_due_time()
+                wait = max_wait
+                if next_due is not None:
+                    wait = min(max_wait, max(0.0, (next_due - self.clock()).total_seconds()))
+                self._changed.wait(timeout=wait)
+    
+    def stop(self) -> None:
+        """
+        Wake the dispatch loop so it notices its stop event has been set.
+        
+        Call this after setting the stop event passed to run().
+        """
+        with self._changed:
+            self._changed.notify_all()
+    
+    def __len__(self) -> int:
+        """
+        Return the number of scheduled entries, including stale ones not yet discarded.
+        
+        Returns:
+            int: The number of entries in the heap
+        """
+        return len(self._heap)
+    
+    def _discard_stale_entries(self) -> None:
+        """
+        Pop entries at the top of the heap that should no longer be dispatched.
+        
+        An entry is stale once its reminder has been acknowledged or snoozed
+        to a different time. Must be called with the lock held.
+        """
+        while self._heap:
+            when, _, reminder = self._heap[0]
+            if not reminder.acknowledged and reminder.when == when:
+                return
+            heapq.heappop(self._heap)
@@ -0,0 +1,60 @@
+"""
+Shared dependencies for the AuDHD LifeCoach entry points.
+
+Loading the NER model is by far the most expensive part of start-up, so the
+commitment identifier is created once per process and reused by every caller.
+"""
+import functools
+import os
+
+from audhd_lifecoach.adapters.ai.batching_commitment_identifier import BatchingCommitmentIdentifier
+from audhd_lifecoach.adapters.ai.hugging_face_onyx_transformer_commitment_identifier import (
+    DEFAULT_MODEL_NAME,
+    HuggingFaceONYXTransformerCommitmentIdentifier
+)
+from audhd_lifecoach.core.interfaces.commitment_identifiable import CommitmentIdentifiable
+
+
+@functools.lru_cache(maxsize=None)
+def get_commitment_identifier() -> CommitmentIdentifiable:
+    """
+    Get the process-wide commitment identifier.
+
+    The identifier is created on first use; later calls return the same
+    instance, so the model weights are only loaded once. NER_MODEL names the
+    Hugging Face NER model to load instead of the default. Setting
+    NER_USE_ONNX runs the model with ONNX Runtime, NER_QUANTIZE additionally
+    quantizes it to int8 and NER_ONNX_MODEL_DIR chooses where the exported
+    model is kept.
+    NER_DEVICE selects the device the PyTorch model runs on, and a positive
+    NER_BATCH_WAIT_MS batches concurrent requests for up to that long.
+
+    Returns:
+        CommitmentIdentifiable: The shared commitment identifier
+    """
+    device = os.environ.get("NER_DEVICE")
+    identifier = HuggingFaceONYXTransformerCommitmentIdentifier(
+        model_name=os.environ.get("NER_MODEL", DEFAULT_MODEL_NAME),
+        use_onnx=_env_flag("NER_USE_ONNX"),
+        quantize=_env_flag("NER_QUANTIZE"),
+        onnx_model_dir=os.environ.get("NER_ONNX_MODEL_DIR"),
+        device=int(device) if device and device.isdigit() else device
+    )
+
+    batch_wait_ms = float(os.environ.get("NER_BATCH_WAIT_MS", "0"))
+    if batch_wait_ms > 0:
+        return BatchingCommitmentIdentifier(identifier, max_wait=batch_wait_ms / 1000)
+    return identifier
+
+
+def _env_flag(name: str) -> bool:
+    """
+    Read a boolean flag from the environment.
+
+    Args:
+        name: The name of the environment variable
+
+    Returns:
+        bool: True if the variable is set to 1, true or yes
+    """
+    return os.environ.get(name, "").strip().lower() in ("1", "true", "yes")
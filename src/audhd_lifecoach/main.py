@@ -3,7 +3,7 @@ Main entry point for AuDHD LifeCoach application.
 This file orchestrates the setup of the application using clean architecture principles.
 """
 import os
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 from audhd_lifecoach.adapters.api.fastapi_adapter import FastAPIAdapter
 from audhd_lifecoach.adapters.api.communication_controller import CommunicationController
@@ -12,9 +12,10 @@ from audhd_lifecoach.application.interfaces.web_app_interface import WebAppInter
 from audhd_lifecoach.application.dtos.communication_dto import CommunicationResponseDTO
 from audhd_lifecoach.application.dtos.health_dto import HealthCheckResponseDTO
 from audhd_lifecoach.core.services.communication_processor import CommunicationProcessor
+from audhd_lifecoach.dependencies import get_commitment_identifier
 from audhd_lifecoach.application.use_cases.process_communication import ProcessCommunication
-from audhd_lifecoach.adapters.ai.hugging_face_onyx_transformer_commitment_identifier import HuggingFaceONYXTransformerCommitmentIdentifier
 from audhd_lifecoach.adapters.messaging.rabbitmq_message_publisher import RabbitMQMessagePublisher
+from audhd_lifecoach.application.services.background_message_publisher import BackgroundMessagePublisher
 
 
 def create_app() -> WebAppInterface:
@@ -35,19 +36,24 @@ def create_app() -> WebAppInterface:
     rabbitmq_pass = os.environ.get("RABBITMQ_PASS", "guest")
     exchange_name = os.environ.get("RABBITMQ_EXCHANGE", "audhd_lifecoach")
     
-    # Initialize the message publisher
-    message_publisher = RabbitMQMessagePublisher(
-        host=rabbitmq_host,
-        port=rabbitmq_port,
-        username=rabbitmq_user,
-        password=rabbitmq_pass
+    # Initialize the message publisher, publishing in the background so
+    # broker round-trips stay out of request handling
+    message_publisher = BackgroundMessagePublisher(
+        RabbitMQMessagePublisher(
+            host=rabbitmq_host,
+            port=rabbitmq_port,
+            username=rabbitmq_user,
+            password=rabbitmq_pass,
+            publish_attempts=3
+        )
     )
     
-    # Connect to RabbitMQ
+    # Connect to RabbitMQ, and publish the messages still queued on shutdown
     message_publisher.connect()
+    web_app.register_shutdown_handler(message_publisher.disconnect)
     
     # Initialize dependencies for communication processing
-    identifier = HuggingFaceONYXTransformerCommitmentIdentifier()
+    identifier = get_commitment_identifier()
     processor = CommunicationProcessor(identifier)
     
     # Initialize the use case with the message publisher
@@ -79,6 +85,15 @@ def create_app() -> WebAppInterface:
         tags=["Communications"]
     )
     
+    # Register the batch endpoint, which analyzes all communications together
+    web_app.register_route(
+        path="/communications:batch",
+        http_method="POST",
+        handler_func=communication_controller.process_communications_batch,
+        response_model=List[CommunicationResponseDTO],
+        tags=["Communications"]
+    )
+    
     return web_app
 
 
@@ -10,7 +10,7 @@ from audhd_lifecoach.adapters.messaging.rabbitmq_message_consumer import RabbitM
 from audhd_lifecoach.adapters.messaging.rabbitmq_message_publisher import RabbitMQMessagePublisher
 from audhd_lifecoach.application.services.message_consumer_service import MessageConsumerService
 from audhd_lifecoach.core.services.communication_processor import CommunicationProcessor
-from audhd_lifecoach.adapters.ai.hugging_face_onyx_transformer_commitment_identifier import HuggingFaceONYXTransformerCommitmentIdentifier
+from audhd_lifecoach.dependencies import get_commitment_identifier
 from audhd_lifecoach.application.use_cases.process_communication import ProcessCommunication
 
 # Configure logging
@@ -29,28 +29,38 @@ def create_message_consumer(queue_name: str = "communications") -> MessageConsum
     rabbitmq_user = os.environ.get("RABBITMQ_USER", "guest")
     rabbitmq_pass = os.environ.get("RABBITMQ_PASS", "guest")
     exchange_name = os.environ.get("RABBITMQ_EXCHANGE", "audhd_lifecoach")
+    num_consumers = int(os.environ.get("CONSUMER_COUNT", "1"))
+    prefetch_count = int(os.environ.get("CONSUMER_PREFETCH_COUNT", "16"))
+    
+    def create_rabbitmq_consumer() -> RabbitMQMessageConsumer:
+        # Each consumer gets its own connection, as pika connections are not thread-safe
+        return RabbitMQMessageConsumer(
+            host=rabbitmq_host,
+            port=rabbitmq_port,
+            username=rabbitmq_user,
+            password=rabbitmq_pass,
+            prefetch_count=prefetch_count
+        )
     
     # Create message consumer adapter (RabbitMQ implementation)
-    message_consumer = RabbitMQMessageConsumer(
-        host=rabbitmq_host,
-        port=rabbitmq_port,
-        username=rabbitmq_user,
-        password=rabbitmq_pass
-    )
+    message_consumer = create_rabbitmq_consumer()
     
-    # Create message publisher adapter (RabbitMQ implementation)
+    # Create message publisher adapter (RabbitMQ implementation). Workers
+    # publish synchronously, so a message is only acknowledged once its
+    # results have been handed to the broker.
     message_publisher = RabbitMQMessagePublisher(
         host=rabbitmq_host,
         port=rabbitmq_port,
         username=rabbitmq_user,
-        password=rabbitmq_pass
+        password=rabbitmq_pass,
+        publish_attempts=3
     )
     
     # Connect to RabbitMQ for publishing
     message_publisher.connect()
     
     # Initialize dependencies for commitment processing
-    identifier = HuggingFaceONYXTransformerCommitmentIdentifier()
+    identifier = get_commitment_identifier()
     processor = CommunicationProcessor(identifier)
     
     # Create the process communication use case with message publisher
@@ -64,7 +74,9 @@ def create_message_consumer(queue_name: str = "communications") -> MessageConsum
     return MessageConsumerService(
         message_consumer=message_consumer,
         process_communication_use_case=process_communication,
-        queue_name=queue_name
+        queue_name=queue_name,
+        consumer_factory=create_rabbitmq_consumer,
+        num_consumers=num_consumers
     )
 
 
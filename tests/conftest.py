@@ -0,0 +1,53 @@
+"""
+Shared pytest configuration for the test suite.
+"""
+import os
+from pathlib import Path
+
+import pytest
+
+
+# The model the slow tests load unless NER_MODEL names another; kept in step
+# with DEFAULT_MODEL_NAME, which cannot be imported before transformers is
+NER_MODEL_NAME = os.environ.get("NER_MODEL", "dslim/bert-base-NER")
+
+
+def pytest_addoption(parser):
+    """Add the option that opts in to the slow tests."""
+    parser.addoption(
+        "--runslow",
+        action="store_true",
+        default=False,
+        help="run the slow tests that load the NER model"
+    )
+
+
+def pytest_configure(config):
+    """
+    Load the NER model from the local cache without contacting the Hub.
+    
+    Once the model has been downloaded, checking the Hub for a newer revision
+    only adds a network round trip, or a failure without a network, to every
+    model load. Offline mode is only switched on when the model is already
+    cached, so the first run can still download it, and an explicit
+    HF_HUB_OFFLINE setting is left alone. It has to happen here, before
+    transformers is imported by the test modules.
+    """
+    hub_cache = os.environ.get("HF_HUB_CACHE") or os.path.join(
+        os.environ.get("HF_HOME", Path.home() / ".cache" / "huggingface"), "hub"
+    )
+    model_dir = Path(hub_cache) / f"models--{NER_MODEL_NAME.replace('/', '--')}"
+    if (model_dir / "snapshots").is_dir():
+        os.environ.setdefault("HF_HUB_OFFLINE", "1")
+        os.environ.setdefault("TRANSFORMERS_OFFLINE", "1")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip the slow tests unless --runslow was given."""
+    if config.getoption("--runslow"):
+        return
+    
+    skip_slow = pytest.mark.skip(reason="loads the NER model; use --runslow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
@@ -0,0 +1,134 @@
+"""
+Shared fixtures for the integration tests.
+"""
+import re
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+import orjson
+import pytest
+
+from audhd_lifecoach.core.domain.entities.commitment import Commitment
+from audhd_lifecoach.core.domain.entities.communication import Communication
+
+
+# An hour and minute such as "15:30", as understood by StubCommitmentIdentifier
+CLOCK_TIME_PATTERN = re.compile(r"(\d{1,2}):(\d{2})")
+
+
+class RecordingPublisher:
+    """
+    Message publisher stand-in that records what is published.
+    
+    Cheaper than a MagicMock for the many publishes the flow tests make, and
+    the recorded keyword arguments are all the tests inspect.
+    """
+    
+    def __init__(self):
+        """Initialize the publisher with no recorded calls."""
+        self.calls: List[Dict[str, Any]] = []
+    
+    def connect(self) -> bool:
+        """Pretend to connect to the broker."""
+        return True
+    
+    def disconnect(self) -> bool:
+        """Pretend to disconnect from the broker."""
+        return True
+    
+    def publish_message(self, **kwargs) -> bool:
+        """Record the published message."""
+        self.calls.append(kwargs)
+        return True
+    
+    def publish_raw(self, **kwargs) -> bool:
+        """Record the published message, decoding its body for the assertions."""
+        kwargs["message"] = orjson.loads(kwargs["body"])
+        self.calls.append(kwargs)
+        return True
+
+
+class StubCommitmentIdentifier:
+    """
+    Commitment identifier stand-in for tests of the message plumbing.
+    
+    Any message mentioning a clock time such as "15:30" yields one commitment
+    with the recipient at the next occurrence of that time; other messages
+    yield none. No model is loaded.
+    """
+    
+    def __init__(self):
+        """Initialize the identifier with no batches seen."""
+        self.batch_sizes: List[int] = []
+    
+    def identify_commitments(self, communication: Communication) -> List[Commitment]:
+        """Identify a commitment at the first clock time in the communication."""
+        match = CLOCK_TIME_PATTERN.search(communication.content)
+        if match is None:
+            return []
+        
+        now = datetime.now()
+        start_time = now.replace(hour=int(match.group(1)), minute=int(match.group(2)), second=0, microsecond=0)
+        if start_time <= now:
+            start_time += timedelta(days=1)
+        return [Commitment(
+            start_time=start_time,
+            end_time=start_time + timedelta(minutes=30),
+            who=communication.recipient,
+            what="Call",
+            where="Unknown"
+        )]
+    
+    def identify_commitments_batch(self, communications: List[Communication]) -> List[List[Commitment]]:
+        """Identify the commitments in each communication, recording the batch size."""
+        self.batch_sizes.append(len(communications))
+        return [self.identify_commitments(communication) for communication in communications]
+
+
+@pytest.fixture
+def stub_commitment_identifier() -> StubCommitmentIdentifier:
+    """Create a commitment identifier that needs no model for a single test."""
+    return StubCommitmentIdentifier()
+
+
+@pytest.fixture
+def now() -> datetime:
+    """Get the current time once, so every timestamp in a test agrees."""
+    return datetime.now()
+
+
+@pytest.fixture
+def now_iso(now: datetime) -> str:
+    """Get the test's current time formatted once for JSON request bodies."""
+    return now.isoformat()
+
+
+@pytest.fixture
+def message_publisher():
+    """Create a recording message publisher for a single test."""
+    return RecordingPublisher()
+
+
+@pytest.fixture(scope="session")
+def commitment_identifier():
+    """
+    Create a real commitment identifier using the transformer pipeline.
+    
+    The identifier keeps no per-call state, so one instance is shared by the
+    whole session and the model is only loaded once. It is warmed up with a
+    throwaway message so the first inference's start-up cost is not charged
+    to whichever test happens to run first.
+    
+    The identifier is configured from the environment like the application's,
+    so NER_USE_ONNX=1 NER_QUANTIZE=1 runs the tests against the int8 model.
+    The tests using it are skipped where transformers is not installed.
+    """
+    pytest.importorskip("transformers", reason="the NER model needs transformers")
+    # Imported here so collecting the tests does not import transformers
+    from audhd_lifecoach.dependencies import get_commitment_identifier
+    
+    identifier = get_commitment_identifier()
+    identifier.identify_commitments(
+        Communication(content="I'll call you at 3:30 PM.", sender="Warmup", recipient="Warmup", timestamp=datetime.now())
+    )
+    return identifier
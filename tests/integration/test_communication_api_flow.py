@@ -10,71 +10,88 @@ This test verifies the full flow via the API:
 This test uses the actual transformer pipeline rather than mocks.
 """
 import pytest
-from datetime import datetime
+from typing import List
 from fastapi import status
 from fastapi.testclient import TestClient
-from unittest.mock import MagicMock
 
 from audhd_lifecoach.adapters.api.fastapi_adapter import FastAPIAdapter
 from audhd_lifecoach.adapters.api.communication_controller import CommunicationController
-from audhd_lifecoach.adapters.ai.hugging_face_onyx_transformer_commitment_identifier import HuggingFaceONYXTransformerCommitmentIdentifier
 from audhd_lifecoach.application.use_cases.process_communication import ProcessCommunication
 from audhd_lifecoach.core.services.communication_processor import CommunicationProcessor
 from audhd_lifecoach.application.dtos.communication_dto import CommunicationResponseDTO
 
 
+# Every test here uses the NER model: skip them unless --runslow is given, and
+# keep them on one xdist worker so the model is only loaded once
+pytestmark = [pytest.mark.slow, pytest.mark.xdist_group("ner_model")]
+
+
+@pytest.fixture(scope="module")
+def api(commitment_identifier):
+    """
+    Create the API once for all of the tests using the FastAPI adapter.
+    
+    Building the app and its response schemas and starting the test
+    client are shared; each test supplies its own publisher via client.
+    """
+    app = FastAPIAdapter(
+        title="Test API",
+        description="API for testing"
+    )
+    
+    # Use the actual transformer pipeline
+    processor = CommunicationProcessor(commitment_identifier)
+    
+    # Create the use case; the publisher is set per test
+    process_communication = ProcessCommunication(
+        communication_processor=processor,
+        message_publisher=None,
+        exchange_name="test-exchange"
+    )
+    
+    # Create controller with the use case
+    controller = CommunicationController(process_communication)
+    
+    # Register the route
+    app.register_route(
+        path="/communications",
+        http_method="POST",
+        handler_func=controller.process_communication,
+        response_model=CommunicationResponseDTO
+    )
+    app.register_route(
+        path="/communications:batch",
+        http_method="POST",
+        handler_func=controller.process_communications_batch,
+        response_model=List[CommunicationResponseDTO]
+    )
+    
+    # Get the fully configured app with router included
+    fastapi_app = app.get_app()
+    
+    with TestClient(fastapi_app) as test_client:
+        yield test_client, process_communication
+
+
 class TestCommunicationAPIFlow:
     """Integration test for the communication API flow."""
     
     @pytest.fixture
-    def client(self):
-        """Create a test client for the API using the FastAPI adapter."""
-        app = FastAPIAdapter(
-            title="Test API",
-            description="API for testing"
-        )
-        
-        # Create a mock message publisher
-        mock_publisher = MagicMock()
-        mock_publisher.connect.return_value = True
-        mock_publisher.publish_message.return_value = True
-        
-        # Use the actual transformer pipeline
-        identifier = HuggingFaceONYXTransformerCommitmentIdentifier()
-        processor = CommunicationProcessor(identifier)
-        
-        # Create the use case with the mock publisher
-        process_communication = ProcessCommunication(
-            communication_processor=processor,
-            message_publisher=mock_publisher,
-            exchange_name="test-exchange"
-        )
-        
-        # Create controller with the use case
-        controller = CommunicationController(process_communication)
-        
-        # Register the route
-        app.register_route(
-            path="/communications",
-            http_method="POST",
-            handler_func=controller.process_communication,
-            response_model=CommunicationResponseDTO
-        )
-        
-        # Get the fully configured app with router included
-        fastapi_app = app.get_app()
-        
-        return TestClient(fastapi_app)
+    def client(self, api, message_publisher):
+        """Get the shared test client, publishing to this test's recording publisher."""
+        test_client, process_communication = api
+        process_communication.message_publisher = message_publisher
+        return test_client
     
     @pytest.mark.integration
-    def test_process_communication_with_commitment(self, client):
+    def test_process_communication_with_commitment(self, client, now_iso):
         """Test processing a communication with a commitment via the API."""
         # Arrange
         communication_data = {
             "content": "I'll call you at 3:30 PM tomorrow.",
             "sender": "Alice",
             "recipient": "Bob",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso
         }
         
         # Act
@@ -96,14 +113,14 @@ class TestCommunicationAPIFlow:
         assert reminder["when"] is not None
     
     @pytest.mark.integration
-    def test_process_communication_no_commitment(self, client):
+    def test_process_communication_no_commitment(self, client, now_iso):
         """Test processing a communication without any commitments via the API."""
         # Arrange
         communication_data = {
             "content": "The weather is nice today.",
             "sender": "Alice",
             "recipient": "Bob",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso
         }
         
         # Act
@@ -117,4 +134,38 @@ class TestCommunicationAPIFlow:
         
         data = response.json()
         assert data["processed"] is True
-        assert len(data["reminders"]) == 0, "Reminders were created when none were expected"
\ No newline at end of file
+        assert len(data["reminders"]) == 0, "Reminders were created when none were expected"
+    
+    @pytest.mark.integration
+    def test_process_communications_batch(self, client, now_iso):
+        """Test processing several communications in a single API request."""
+        # Arrange
+        communications_data = [
+            {
+                "content": "I'll call you at 3:30 PM tomorrow.",
+                "sender": "Alice",
+                "recipient": "Bob",
+                "timestamp": now_iso
+            },
+            {
+                "content": "The weather is nice today.",
+                "sender": "Alice",
+                "recipient": "Bob",
+                "timestamp": now_iso
+            }
+        ]
+        
+        # Act
+        response = client.post(
+            "/communications:batch",
+            json=communications_data
+        )
+        
+        # Assert
+        assert response.status_code == status.HTTP_200_OK, f"Unexpected response: {response.json()}"
+        
+        data = response.json()
+        assert len(data) == 2
+        assert all(item["processed"] is True for item in data)
+        assert len(data[0]["reminders"]) > 0, "No reminders were created"
+        assert len(data[1]["reminders"]) == 0, "Reminders were created when none were expected"
@@ -9,48 +9,37 @@ This test verifies the core domain flow:
 This test uses the actual transformer pipeline rather than mocks.
 """
 import pytest
-from datetime import datetime, timedelta
-from unittest.mock import MagicMock
 
 from audhd_lifecoach.core.domain.entities.communication import Communication
 from audhd_lifecoach.core.services.communication_processor import CommunicationProcessor
-from audhd_lifecoach.adapters.ai.hugging_face_onyx_transformer_commitment_identifier import HuggingFaceONYXTransformerCommitmentIdentifier
 from audhd_lifecoach.application.use_cases.process_communication import ProcessCommunication
 from audhd_lifecoach.application.dtos.communication_dto import CommunicationRequestDTO
 
 
+# Every test here uses the NER model: skip them unless --runslow is given, and
+# keep them on one xdist worker so the model is only loaded once
+pytestmark = [pytest.mark.slow, pytest.mark.xdist_group("ner_model")]
+
+
 class TestCommunicationToReminderFlow:
     """Integration test for the communication to reminder flow."""
     
-    @pytest.fixture
-    def commitment_identifier(self):
-        """Create a real commitment identifier using the transformer pipeline."""
-        return HuggingFaceONYXTransformerCommitmentIdentifier()
-    
     @pytest.fixture
     def communication_processor(self, commitment_identifier):
         """Create a real communication processor with the transformer pipeline."""
         return CommunicationProcessor(commitment_identifier)
 
     @pytest.fixture
-    def mock_message_publisher(self):
-        """Create a mock message publisher for the tests."""
-        publisher = MagicMock()
-        publisher.connect.return_value = True
-        publisher.publish_message.return_value = True
-        return publisher
-    
-    @pytest.fixture
-    def process_communication_use_case(self, communication_processor, mock_message_publisher):
-        """Create the process communication use case with the mock publisher."""
+    def process_communication_use_case(self, communication_processor, message_publisher):
+        """Create the process communication use case with the recording publisher."""
         return ProcessCommunication(
             communication_processor=communication_processor,
-            message_publisher=mock_message_publisher,
+            message_publisher=message_publisher,
             exchange_name='test-exchange'
         )
     
     @pytest.mark.integration
-    def test_process_communication_with_commitment(self, process_communication_use_case, mock_message_publisher):
+    def test_process_communication_with_commitment(self, process_communication_use_case, message_publisher, now):
         """Test processing a communication with a commitment."""
         # Arrange
         # Create a communication DTO with a commitment
@@ -58,7 +47,7 @@ class TestCommunicationToReminderFlow:
             content="I'll call you tomorrow at 3:30 PM",
             sender="Alice",
             recipient="Bob",
-            timestamp=datetime.now()
+            timestamp=now
         )
         
         # Act
@@ -75,15 +64,15 @@ class TestCommunicationToReminderFlow:
         # Verify the reminder contains the correct information
         reminder = response.reminders[0]
         assert "commitment" in reminder.message.lower(), "Expected the word 'commitment' in the reminder message"
-        assert reminder.when > datetime.now()
+        assert reminder.when > now
         
         # Verify the commitment information is present
         assert reminder.commitment_what is not None
         assert reminder.commitment_what.lower() == "call"  # Verify the what field directly
         
         # Verify the message was published
-        mock_message_publisher.publish_message.assert_called_once()
-        args, kwargs = mock_message_publisher.publish_message.call_args
+        assert len(message_publisher.calls) == 1
+        kwargs = message_publisher.calls[0]
         
         # Check exchange and routing key
         assert kwargs["exchange"] == "test-exchange"
@@ -96,7 +85,7 @@ class TestCommunicationToReminderFlow:
         assert len(message["reminders"]) > 0
     
     @pytest.mark.integration
-    def test_process_communication_no_commitment(self, process_communication_use_case, mock_message_publisher):
+    def test_process_communication_no_commitment(self, process_communication_use_case, message_publisher, now):
         """Test processing a communication without any commitments."""
         # Arrange
         # Create a communication DTO without any commitments
@@ -104,7 +93,7 @@ class TestCommunicationToReminderFlow:
             content="The weather is nice today",
             sender="Alice",
             recipient="Bob",
-            timestamp=datetime.now()
+            timestamp=now
         )
         
         # Act
@@ -119,11 +108,39 @@ class TestCommunicationToReminderFlow:
         assert len(response.reminders) == 0, "Reminders were created when none were expected"
         
         # Verify the message was published even with no commitments
-        mock_message_publisher.publish_message.assert_called_once()
-        args, kwargs = mock_message_publisher.publish_message.call_args
+        assert len(message_publisher.calls) == 1
+        kwargs = message_publisher.calls[0]
         
         # Check message contents
         message = kwargs["message"]
         assert "original_communication" in message
         assert message["processed"] is True
-        assert len(message["reminders"]) == 0
\ No newline at end of file
+        assert len(message["reminders"]) == 0
+    
+    @pytest.mark.integration
+    def test_process_communications_in_one_batch(self, communication_processor, now):
+        """Test that a batch of communications gives the same reminders as processing each one."""
+        # Arrange
+        contents = [
+            "I'll call you tomorrow at 3:30 PM",
+            "The weather is nice today",
+            "Let's meet for lunch tomorrow at noon",
+        ]
+        communications = [
+            Communication(content=content, timestamp=now, sender="Alice", recipient="Bob")
+            for content in contents
+        ]
+        
+        # Act
+        # Run all of the communications through the pipeline in a single batch
+        batched = communication_processor.process_communications(communications)
+        individual = [
+            CommunicationProcessor(communication_processor.commitment_identifier).process_communication(communication)
+            for communication in communications
+        ]
+        
+        # Assert
+        assert len(batched) == len(communications)
+        assert [len(reminders) for reminders in batched] == [len(reminders) for reminders in individual]
+        assert batched[0][0].commitment.what.lower() == "call"
+        assert batched[1] == []
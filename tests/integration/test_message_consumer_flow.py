@@ -6,19 +6,19 @@ This test verifies the full flow via the message consumer:
 2. The message is processed to extract commitments
 3. Reminders are created for these commitments
 
-This test uses the actual transformer pipeline rather than mocks.
+Commitments come from a deterministic stub identifier, so these tests exercise
+the message plumbing without loading the NER model.
 """
 import pytest
 import json
-import time
 from datetime import datetime
+from typing import Any, Dict, Tuple
 from unittest.mock import MagicMock, patch, call
 
 import pika
 
 from audhd_lifecoach.application.dtos.communication_dto import CommunicationRequestDTO
 from audhd_lifecoach.core.domain.entities.communication import Communication
-from audhd_lifecoach.adapters.ai.hugging_face_onyx_transformer_commitment_identifier import HuggingFaceONYXTransformerCommitmentIdentifier
 from audhd_lifecoach.adapters.messaging.rabbitmq_message_consumer import RabbitMQMessageConsumer
 from audhd_lifecoach.core.services.communication_processor import CommunicationProcessor
 from audhd_lifecoach.application.interfaces.message_consumer_interface import MessageConsumerInterface
@@ -26,6 +26,20 @@ from audhd_lifecoach.application.services.message_consumer_service import Messag
 from audhd_lifecoach.application.use_cases.process_communication import ProcessCommunication
 
 
+def make_delivery(message_data: Dict[str, Any]) -> Tuple[MagicMock, MagicMock, bytes]:
+    """
+    Build the (method, properties, body) triple RabbitMQ delivers for a message.
+    
+    Args:
+        message_data: The message, whose message_id becomes the delivery tag
+    
+    Returns:
+        Tuple[MagicMock, MagicMock, bytes]: The delivery method, properties and body
+    """
+    method = MagicMock(delivery_tag=message_data["message_id"])
+    return method, MagicMock(), json.dumps(message_data).encode('utf-8')
+
+
 class TestMessageConsumerFlow:
     """Integration test for the message consumer flow."""
     
@@ -38,7 +52,10 @@ class TestMessageConsumerFlow:
             
             # Configure connection to return the mock channel
             mock_connection.return_value.channel.return_value = mock_channel
-            
+        
+            # Run thread-safe callbacks immediately, as pika's IO loop would
+            mock_connection.return_value.add_callback_threadsafe.side_effect = lambda callback: callback()
+        
             # Set up basic_consume to store the callback function
             # and prevent actual consumption from occurring
             def mock_basic_consume(queue, on_message_callback, auto_ack):
@@ -67,28 +84,20 @@ class TestMessageConsumerFlow:
         return adapter
     
     @pytest.fixture
-    def mock_message_publisher(self):
-        """Create a mock message publisher for the tests."""
-        publisher = MagicMock()
-        publisher.connect.return_value = True
-        publisher.publish_message.return_value = True
-        return publisher
-    
-    @pytest.fixture
-    def message_consumer_service(self, rabbitmq_adapter, mock_message_publisher):
+    def message_consumer_service(self, rabbitmq_adapter, message_publisher, stub_commitment_identifier):
         """
         Create an actual MessageConsumerService with the real RabbitMQMessageConsumer.
-        """
-        # Create the commitment identifier
-        commitment_identifier = HuggingFaceONYXTransformerCommitmentIdentifier()
         
+        These tests cover the message plumbing, so commitments come from a stub
+        identifier instead of the NER model.
+        """
         # Create the communication processor
-        communication_processor = CommunicationProcessor(commitment_identifier)
+        communication_processor = CommunicationProcessor(stub_commitment_identifier)
         
-        # Create the process communication use case with mock publisher
+        # Create the process communication use case with the recording publisher
         process_communication = ProcessCommunication(
             communication_processor=communication_processor,
-            message_publisher=mock_message_publisher,
+            message_publisher=message_publisher,
             exchange_name='test-exchange'
         )
         
@@ -100,7 +109,7 @@ class TestMessageConsumerFlow:
         )
         
         return service
-
+    
     @pytest.fixture
     def setup_message_delivery(self, mock_pika_connection):
         """
@@ -140,7 +149,7 @@ class TestMessageConsumerFlow:
     @pytest.mark.integration
     def test_basic_message_flow_with_one_commitment(self, mock_pika_connection, rabbitmq_adapter, 
                                                   message_consumer_service, setup_message_delivery, 
-                                                  mock_message_publisher):
+                                                  message_publisher):
         """
         Test the basic flow through the message consumer from message to reminder.
         
@@ -160,14 +169,8 @@ class TestMessageConsumerFlow:
             "message_id": 1
         }
         
-        # Create method, properties and message body for the message
-        method = MagicMock()
-        method.delivery_tag = message_data["message_id"]
-        properties = MagicMock()
-        body = json.dumps(message_data).encode('utf-8')
-        
         # Setup message delivery using our fixture
-        setup_message_delivery(rabbitmq_adapter, [(method, properties, body)])
+        setup_message_delivery(rabbitmq_adapter, [make_delivery(message_data)])
         
         # Start the consumer service - this will connect to RabbitMQ and start consuming
         message_consumer_service.start()
@@ -176,7 +179,7 @@ class TestMessageConsumerFlow:
         mock_channel.basic_ack.assert_called_once_with(delivery_tag=message_data["message_id"])
         
         # Verify the message was published
-        mock_message_publisher.publish_message.assert_called_once()
+        assert len(message_publisher.calls) == 1
         
         # Stop the consumer service - this will disconnect from RabbitMQ
         message_consumer_service.stop()
@@ -200,14 +203,8 @@ class TestMessageConsumerFlow:
             "message_id": 2
         }
         
-        # Create method, properties and message body for the message
-        method = MagicMock()
-        method.delivery_tag = invalid_message_data["message_id"]
-        properties = MagicMock()
-        body = json.dumps(invalid_message_data).encode('utf-8')
-        
         # Setup message delivery using our fixture
-        setup_message_delivery(rabbitmq_adapter, [(method, properties, body)])
+        setup_message_delivery(rabbitmq_adapter, [make_delivery(invalid_message_data)])
         
         # Start the consumer service
         message_consumer_service.start()
@@ -244,31 +241,58 @@ class TestMessageConsumerFlow:
             }
         ]
         
-        # Create message tuples
-        message_tuples = []
-        for message in messages:
-            method = MagicMock()
-            method.delivery_tag = message["message_id"]
-            properties = MagicMock()
-            body = json.dumps(message).encode('utf-8')
-            message_tuples.append((method, properties, body))
-        
         # Setup message delivery using our fixture
-        setup_message_delivery(rabbitmq_adapter, message_tuples)
+        setup_message_delivery(rabbitmq_adapter, [make_delivery(message) for message in messages])
         
         # Start the consumer service
         message_consumer_service.start()
         
-        # Verify that basic_ack was called once for each message
-        assert mock_channel.basic_ack.call_count == len(messages), f"Expected basic_ack to be called {len(messages)} times"
-        
-        # Verify that basic_ack was called with the correct delivery tags
-        for message in messages:
-            mock_channel.basic_ack.assert_any_call(delivery_tag=message["message_id"])
+        # Verify that every message was acknowledged. Acks are batched, so a
+        # single ack with multiple=True may cover several delivery tags.
+        delivery_tags = [message["message_id"] for message in messages]
+        acknowledged_tags = set()
+        for ack_call in mock_channel.basic_ack.call_args_list:
+            tag = ack_call.kwargs["delivery_tag"]
+            if ack_call.kwargs.get("multiple"):
+                acknowledged_tags.update(t for t in delivery_tags if t <= tag)
+            else:
+                acknowledged_tags.add(tag)
+        assert acknowledged_tags == set(delivery_tags)
             
         # Stop the consumer service
         message_consumer_service.stop()
     
+    @pytest.mark.integration
+    def test_process_messages_identifies_commitments_in_one_batch(self, message_consumer_service,
+                                                                  stub_commitment_identifier, message_publisher):
+        """
+        Test that a batch of messages runs through the commitment identifier in one call.
+        """
+        # Arrange
+        messages = [
+            {
+                "content": "I'll call you at 15:30 tomorrow.",
+                "sender": "Me",
+                "recipient": "Friend",
+                "message_id": 1
+            },
+            {
+                "content": "Let's meet at the coffee shop at 10:00.",
+                "sender": "Me",
+                "recipient": "Colleague",
+                "message_id": 2
+            }
+        ]
+        
+        # Act
+        results = message_consumer_service.process_messages(messages)
+        
+        # Assert
+        assert stub_commitment_identifier.batch_sizes == [2]
+        assert [result["message_id"] for result in results] == [1, 2]
+        assert [result["commitments_found"] for result in results] == [1, 1]
+        assert len(message_publisher.calls) == 2
+    
     @pytest.mark.integration
     def test_json_decode_error_in_flow(self, mock_pika_connection, rabbitmq_adapter, 
                                      message_consumer_service, setup_message_delivery):
@@ -324,17 +348,11 @@ class TestMessageConsumerFlow:
             "message_id": 6
         }
         
-        # Create method, properties and message body for the message
-        method = MagicMock()
-        method.delivery_tag = message_data["message_id"]
-        properties = MagicMock()
-        body = json.dumps(message_data).encode('utf-8')
-        
         # Patch the process_message method to raise an exception
         with patch.object(message_consumer_service, '_process_message', 
                          side_effect=Exception("Simulated processing error")):
             # Setup message delivery using our fixture
-            setup_message_delivery(rabbitmq_adapter, [(method, properties, body)])
+            setup_message_delivery(rabbitmq_adapter, [make_delivery(message_data)])
             
             # Start the consumer service
             message_consumer_service.start()
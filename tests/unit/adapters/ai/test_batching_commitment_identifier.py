@@ -0,0 +1,96 @@
+import threading
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from audhd_lifecoach.adapters.ai.batching_commitment_identifier import BatchingCommitmentIdentifier
+from audhd_lifecoach.core.domain.entities.commitment import Commitment
+from audhd_lifecoach.core.domain.entities.communication import Communication
+from audhd_lifecoach.core.interfaces.commitment_identifiable import CommitmentIdentifiable
+
+
+def make_commitment(who: str) -> Commitment:
+    """Create a commitment with the given person."""
+    start_time = datetime(2025, 4, 20, 15, 30)
+    return Commitment(
+        start_time=start_time,
+        end_time=start_time + timedelta(hours=1),
+        who=who,
+        what="Meeting",
+        where="Office"
+    )
+
+
+class TestBatchingCommitmentIdentifier:
+    """Tests for the BatchingCommitmentIdentifier adapter."""
+    
+    def test_interface_compliance(self):
+        """Test that the adapter implements the CommitmentIdentifiable interface."""
+        # Arrange & Act
+        identifier = BatchingCommitmentIdentifier(MagicMock())
+        
+        # Assert
+        assert isinstance(identifier, CommitmentIdentifiable)
+    
+    def test_concurrent_requests_share_one_batch(self):
+        """Test that requests arriving within the window are identified together."""
+        # Arrange
+        inner = MagicMock()
+        inner.identify_commitments_batch.side_effect = lambda communications: [
+            [make_commitment(communication.recipient)] for communication in communications
+        ]
+        identifier = BatchingCommitmentIdentifier(inner, max_batch_size=3, max_wait=5)
+        communications = [
+            Communication(content="Meet at 15:30", sender="Me", recipient=name)
+            for name in ("Ann", "Bob", "Cat")
+        ]
+        results = {}
+        
+        def identify(communication):
+            results[communication.recipient] = identifier.identify_commitments(communication)
+        
+        threads = [threading.Thread(target=identify, args=(c,)) for c in communications]
+        
+        # Act
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+        identifier.close()
+        
+        # Assert - the full batch was sent without waiting out the window
+        inner.identify_commitments_batch.assert_called_once()
+        assert len(inner.identify_commitments_batch.call_args.args[0]) == 3
+        assert {name: commitments[0].who for name, commitments in results.items()} == {
+            "Ann": "Ann", "Bob": "Bob", "Cat": "Cat"
+        }
+    
+    def test_batch_errors_reach_every_caller(self):
+        """Test that a failing batch raises the error for the waiting caller."""
+        # Arrange
+        inner = MagicMock()
+        inner.identify_commitments_batch.side_effect = RuntimeError("model failed")
+        identifier = BatchingCommitmentIdentifier(inner, max_wait=0)
+        
+        # Act & Assert
+        with pytest.raises(RuntimeError):
+            identifier.identify_commitments(Communication(content="Hi", sender="Me", recipient="You"))
+        identifier.close()
+    
+    def test_requests_after_close_are_refused(self):
+        """Test that identifying after close fails instead of waiting forever."""
+        # Arrange
+        inner = MagicMock()
+        inner.identify_commitments_batch.side_effect = lambda communications: [[] for _ in communications]
+        identifier = BatchingCommitmentIdentifier(inner, max_wait=0)
+        communication = Communication(content="Hi", sender="Me", recipient="You")
+        identifier.identify_commitments(communication)
+        
+        # Act
+        identifier.close()
+        
+        # Assert
+        with pytest.raises(RuntimeError):
+            identifier.identify_commitments(communication)
+        assert identifier._worker is None
@@ -1,10 +1,11 @@
 import pytest
+import torch
 from datetime import datetime
 from unittest.mock import patch, MagicMock
 
 from audhd_lifecoach.core.domain.entities.communication import Communication
 from audhd_lifecoach.core.interfaces.commitment_identifiable import CommitmentIdentifiable
-from audhd_lifecoach.adapters.ai.hugging_face_onyx_transformer_commitment_identifier import HuggingFaceONYXTransformerCommitmentIdentifier
+from audhd_lifecoach.adapters.ai.hugging_face_onyx_transformer_commitment_identifier import HuggingFaceONYXTransformerCommitmentIdentifier, _quantization_config
 
 
 class TestHuggingFaceONYXTransformerCommitmentIdentifier:
@@ -16,6 +17,60 @@ class TestHuggingFaceONYXTransformerCommitmentIdentifier:
             identifier = HuggingFaceONYXTransformerCommitmentIdentifier()
             assert isinstance(identifier, CommitmentIdentifiable)
     
+    def test_onnx_backend_loads_onnx_pipeline(self):
+        """Test that the ONNX Runtime pipeline is loaded when the ONNX backend is selected."""
+        # Arrange
+        identifier = HuggingFaceONYXTransformerCommitmentIdentifier(use_onnx=True, quantize=True)
+        onnx_pipeline = MagicMock()
+        
+        # Act
+        with patch.object(identifier, '_load_onnx_pipeline', return_value=onnx_pipeline) as load_onnx, \
+                patch('audhd_lifecoach.adapters.ai.hugging_face_onyx_transformer_commitment_identifier.pipeline') as torch_pipeline:
+            loaded = identifier.ner_pipeline
+        
+        # Assert
+        assert loaded is onnx_pipeline
+        load_onnx.assert_called_once()
+        torch_pipeline.assert_not_called()
+    
+    @pytest.mark.parametrize("device, expected_kwargs", [
+        (None, {}),
+        ("cpu", {}),
+        (0, {"torch_dtype": torch.float16}),
+    ])
+    def test_torch_pipeline_uses_half_precision_on_gpu(self, device, expected_kwargs):
+        """Test that the PyTorch model is loaded in float16 only when it runs on a GPU."""
+        # Arrange
+        identifier = HuggingFaceONYXTransformerCommitmentIdentifier(device=device)
+        
+        # Act
+        with patch('audhd_lifecoach.adapters.ai.hugging_face_onyx_transformer_commitment_identifier.pipeline') as torch_pipeline:
+            identifier.ner_pipeline
+        
+        # Assert
+        torch_pipeline.assert_called_once_with("ner", model=identifier.model_name, device=device, **expected_kwargs)
+    
+    @pytest.mark.parametrize("machine, flags, expected", [
+        ("x86_64", {"avx2", "avx512f", "avx512_vnni"}, "avx512_vnni"),
+        ("x86_64", {"avx2", "avx512f"}, "avx512"),
+        ("x86_64", {"avx2"}, "avx2"),
+        ("aarch64", set(), "arm64"),
+    ])
+    def test_quantization_config_matches_host_cpu(self, machine, flags, expected):
+        """Test that the int8 quantization settings are chosen for the host CPU."""
+        # Arrange
+        auto_quantization_config = MagicMock()
+        module = 'audhd_lifecoach.adapters.ai.hugging_face_onyx_transformer_commitment_identifier'
+        
+        # Act
+        with patch(f'{module}.platform.machine', return_value=machine), \
+                patch(f'{module}._cpu_flags', return_value=flags):
+            config = _quantization_config(auto_quantization_config)
+        
+        # Assert
+        assert config is getattr(auto_quantization_config, expected).return_value
+        getattr(auto_quantization_config, expected).assert_called_once_with(is_static=False, per_channel=False)
+    
     def test_identify_basic_commitment(self):
         """Test identifying a simple commitment with mocked transformers."""
         # Arrange
@@ -50,6 +105,94 @@ class TestHuggingFaceONYXTransformerCommitmentIdentifier:
         assert commitments[0].who == "Friend"
         assert "coffee shop" in commitments[0].where.lower()
     
+    def test_identify_commitments_batch_runs_pipeline_once(self):
+        """Test that a batch of communications is sent through the pipeline together."""
+        # Arrange
+        mock_ner_pipeline = MagicMock()
+        mock_ner_pipeline.return_value = [
+            [{'entity': 'LOCATION', 'score': 0.95, 'word': 'coffee shop', 'start': 33, 'end': 44}],
+            []
+        ]
+        identifier = HuggingFaceONYXTransformerCommitmentIdentifier(
+            ner_pipeline=mock_ner_pipeline
+        )
+        communications = [
+            Communication(content="I'll meet you at 15:30 at the coffee shop.", sender="Me", recipient="Friend"),
+            Communication(content="Just saying hello!", sender="Me", recipient="Friend"),
+            Communication(content="I will call you at 9:00", sender="Me", recipient="Mom"),
+        ]
+        
+        # Act
+        results = identifier.identify_commitments_batch(communications)
+        
+        # Assert - the message without commitment intent never reaches the model
+        mock_ner_pipeline.assert_called_once_with(
+            ["I'll meet you at 15:30 at the coffee shop.", "I will call you at 9:00"],
+            batch_size=2
+        )
+        assert len(results) == 3
+        assert len(results[0]) == 1
+        assert "coffee shop" in results[0][0].where.lower()
+        assert results[1] == []
+        assert results[2][0].who == "Mom"
+    
+    def test_repeated_text_reuses_named_entities(self):
+        """Test that the model runs once for a text seen again, even from another sender."""
+        # Arrange
+        mock_ner_pipeline = MagicMock()
+        mock_ner_pipeline.return_value = []
+        identifier = HuggingFaceONYXTransformerCommitmentIdentifier(
+            ner_pipeline=mock_ner_pipeline
+        )
+        content = "I will call you at 9:00"
+        
+        # Act
+        first = identifier.identify_commitments(Communication(content=content, sender="Me", recipient="Mom"))
+        batch = identifier.identify_commitments_batch([
+            Communication(content=content, sender="Sister", recipient="Dad"),
+        ])
+        
+        # Assert
+        mock_ner_pipeline.assert_called_once_with(content)
+        assert first[0].who == "Mom"
+        assert batch[0][0].who == "Dad"
+    
+    def test_ner_is_skipped_without_a_time(self):
+        """Test that the model is not run for a message that mentions no time."""
+        # Arrange
+        mock_ner_pipeline = MagicMock()
+        identifier = HuggingFaceONYXTransformerCommitmentIdentifier(
+            ner_pipeline=mock_ner_pipeline
+        )
+        communication = Communication(
+            content="I will submit the report",
+            sender="Me",
+            recipient="Boss"
+        )
+        
+        # Act
+        commitments = identifier.identify_commitments(communication)
+        
+        # Assert
+        assert commitments == []
+        mock_ner_pipeline.assert_not_called()
+    
+    def test_repeated_time_expression_is_parsed_once(self):
+        """Test that a time expression matched by several patterns is only parsed once."""
+        # Arrange
+        identifier = HuggingFaceONYXTransformerCommitmentIdentifier(ner_pipeline=MagicMock())
+        parsed = datetime(2025, 4, 21, 9, 0)
+        
+        # Act
+        with patch('audhd_lifecoach.adapters.ai.hugging_face_onyx_transformer_commitment_identifier.dateparser.parse',
+                   return_value=parsed) as parse:
+            time_entities = identifier._extract_time_entities("Morning standup")
+        
+        # Assert
+        assert [entity['word'] for entity in time_entities] == ["Morning", "Morning"]
+        assert all(entity['parsed_datetime'] == parsed for entity in time_entities)
+        parse.assert_called_once()
+    
     def test_no_commitment_identified(self):
         """Test that no commitments are identified in casual conversation."""
         # Arrange
@@ -0,0 +1,51 @@
+"""
+Tests for the FastAPI adapter.
+"""
+from unittest.mock import MagicMock, patch
+
+import orjson
+
+from fastapi.testclient import TestClient
+
+from audhd_lifecoach.adapters.api.fastapi_adapter import FastAPIAdapter, OrjsonResponse
+from audhd_lifecoach.application.dtos.health_dto import HealthCheckResponseDTO
+
+
+class TestFastAPIAdapter:
+    """Test case for the FastAPI adapter."""
+    
+    def test_shutdown_handlers_run_when_the_app_stops(self):
+        """Test that registered shutdown handlers are called on shutdown, not before."""
+        # Arrange
+        adapter = FastAPIAdapter(title="Test API", description="API for testing")
+        handler = MagicMock()
+        adapter.register_shutdown_handler(handler)
+        
+        # Act
+        with TestClient(adapter.get_app()):
+            handler.assert_not_called()
+        
+        # Assert
+        handler.assert_called_once_with()
+    
+    def test_responses_are_rendered_with_orjson(self):
+        """Test that routes render their response models with OrjsonResponse."""
+        # Arrange
+        adapter = FastAPIAdapter(title="Test API", description="API for testing")
+        adapter.register_route(
+            path="/health",
+            http_method="GET",
+            handler_func=lambda: HealthCheckResponseDTO(status="healthy", version="0.1.0"),
+            response_model=HealthCheckResponseDTO
+        )
+        client = TestClient(adapter.get_app())
+        
+        # Act
+        with patch.object(OrjsonResponse, "render", autospec=True,
+                          side_effect=lambda response, content: orjson.dumps(content)) as render:
+            response = client.get("/health")
+        
+        # Assert
+        render.assert_called_once()
+        assert response.headers["content-type"] == "application/json"
+        assert response.content == orjson.dumps({"status": "healthy", "version": "0.1.0"})
@@ -0,0 +1,190 @@
+"""
+Unit tests for the RabbitMQ connection pool.
+"""
+import threading
+import pytest
+from unittest.mock import MagicMock, patch
+
+from pika.exceptions import AMQPError
+
+from audhd_lifecoach.adapters.messaging.rabbitmq_connection_pool import RabbitMQChannelPool
+
+
+class TestRabbitMQChannelPool:
+    """Test case for the RabbitMQ channel pool."""
+    
+    @pytest.fixture
+    def mock_pika_connection(self):
+        """Create a mock pika BlockingConnection returning a new connection per call."""
+        with patch('pika.BlockingConnection', side_effect=lambda parameters: MagicMock()) as mock_connection:
+            yield mock_connection
+    
+    def test_released_pair_is_reused(self, mock_pika_connection):
+        """Test that a released pair is handed out again instead of opening a new one."""
+        # Arrange
+        pool = RabbitMQChannelPool(MagicMock(), max_channels=2)
+        pool.open()
+        
+        # Act
+        first_pair = pool.acquire()
+        pool.release(first_pair)
+        second_pair = pool.acquire()
+        
+        # Assert
+        assert second_pair is first_pair
+        assert mock_pika_connection.call_count == 1
+    
+    def test_idle_pair_is_serviced_before_reuse(self, mock_pika_connection):
+        """Test that an idle pair processes its pending I/O before it is handed out."""
+        # Arrange
+        pool = RabbitMQChannelPool(MagicMock(), max_channels=1)
+        pool.open()
+        
+        # Act
+        connection, _ = pool.acquire()
+        
+        # Assert
+        connection.process_data_events.assert_called_once_with(time_limit=0)
+    
+    def test_dead_idle_pair_is_replaced(self, mock_pika_connection):
+        """Test that an idle pair dropped by the broker is discarded for a fresh one."""
+        # Arrange
+        pool = RabbitMQChannelPool(MagicMock(), max_channels=1)
+        pool.open()
+        dead_pair = pool.acquire()
+        dead_connection, _ = dead_pair
+        dead_connection.process_data_events.side_effect = AMQPError("Missed heartbeats")
+        pool.release(dead_pair)
+        
+        # Act
+        pair = pool.acquire()
+        
+        # Assert
+        assert pair is not dead_pair
+        assert mock_pika_connection.call_count == 2
+    
+    def test_pool_grows_when_all_pairs_busy(self, mock_pika_connection):
+        """Test that a new pair is opened when every pooled pair is in use."""
+        # Arrange
+        pool = RabbitMQChannelPool(MagicMock(), max_channels=2)
+        pool.open()
+        busy_pair = pool.acquire()
+        
+        # Act
+        new_pair = pool.acquire()
+        
+        # Assert
+        assert new_pair is not busy_pair
+        assert mock_pika_connection.call_count == 2
+    
+    def test_broken_pair_is_closed_and_replaced(self, mock_pika_connection):
+        """Test that a pair released as broken is closed and not reused."""
+        # Arrange
+        pool = RabbitMQChannelPool(MagicMock(), max_channels=1)
+        pool.open()
+        broken_pair = pool.acquire()
+        
+        # Act
+        pool.release(broken_pair, broken=True)
+        replacement_pair = pool.acquire()
+        
+        # Assert
+        broken_connection, _ = broken_pair
+        broken_connection.close.assert_called_once()
+        assert replacement_pair is not broken_pair
+        assert mock_pika_connection.call_count == 2
+    
+    def test_closed_pool_hands_out_nothing(self, mock_pika_connection):
+        """Test that acquiring from a closed pool returns None."""
+        # Arrange
+        pool = RabbitMQChannelPool(MagicMock())
+        pool.open()
+        
+        # Act
+        result = pool.close()
+        
+        # Assert
+        assert result is True
+        assert pool.acquire() is None
+    
+    def test_close_reports_failure(self, mock_pika_connection):
+        """Test that close returns False when a connection fails to close."""
+        # Arrange
+        pool = RabbitMQChannelPool(MagicMock())
+        pool.open()
+        pair = pool.acquire()
+        connection, _ = pair
+        connection.close.side_effect = AMQPError("Close failed")
+        pool.release(pair)
+        
+        # Act
+        result = pool.close()
+        
+        # Assert
+        assert result is False
+    
+    def test_pair_in_use_is_closed_when_released_after_close(self, mock_pika_connection):
+        """Test that closing the pool leaves a checked-out pair open until it is released."""
+        # Arrange
+        pool = RabbitMQChannelPool(MagicMock(), max_channels=2)
+        pool.open()
+        idle_pair = pool.acquire()
+        busy_pair = pool.acquire()
+        pool.release(idle_pair)
+        
+        # Act
+        pool.close()
+        busy_closed_by_close = busy_pair[0].close.called
+        pool.release(busy_pair)
+        
+        # Assert
+        idle_pair[0].close.assert_called_once()
+        assert busy_closed_by_close is False
+        busy_pair[0].close.assert_called_once()
+        assert pool.acquire() is None
+    
+    def test_release_does_not_wait_for_a_connection_being_opened(self, mock_pika_connection):
+        """Test that a slow connect does not hold the pool lock."""
+        # Arrange
+        connecting = threading.Event()
+        finish_connecting = threading.Event()
+        
+        def slow_connection(parameters):
+            connecting.set()
+            finish_connecting.wait(timeout=5)
+            return MagicMock()
+        
+        pool = RabbitMQChannelPool(MagicMock(), max_channels=2)
+        pool.open()
+        pair = pool.acquire()
+        mock_pika_connection.side_effect = slow_connection
+        opener = threading.Thread(target=pool.acquire)
+        opener.start()
+        assert connecting.wait(timeout=5)
+        
+        # Act
+        released = threading.Thread(target=pool.release, args=(pair,))
+        released.start()
+        released.join(timeout=1)
+        release_finished = not released.is_alive()
+        finish_connecting.set()
+        opener.join(timeout=5)
+        
+        # Assert
+        assert release_finished
+    
+    def test_failed_connect_frees_its_slot(self, mock_pika_connection):
+        """Test that a connection that fails to open does not count against max_channels."""
+        # Arrange
+        pool = RabbitMQChannelPool(MagicMock(), max_channels=1)
+        mock_pika_connection.side_effect = AMQPError("Connection refused")
+        with pytest.raises(AMQPError):
+            pool.acquire()
+        mock_pika_connection.side_effect = lambda parameters: MagicMock()
+        
+        # Act
+        pair = pool.acquire()
+        
+        # Assert
+        assert pair is not None
+        assert mock_pika_connection.call_count == 2
@@ -0,0 +1,148 @@
+"""
+Unit tests for the RabbitMQ message consumer adapter.
+
+This test module verifies how the RabbitMQ adapter decodes delivered
+message bodies and acknowledges them on the channel.
+"""
+import json
+import threading
+import pytest
+from unittest.mock import MagicMock, call
+
+from audhd_lifecoach.adapters.messaging.rabbitmq_message_consumer import RabbitMQMessageConsumer
+
+
+class TestRabbitMQMessageConsumer:
+    """Test case for the RabbitMQ message consumer adapter."""
+
+    @pytest.fixture
+    def delivery(self):
+        """Create a mock channel, method and properties for a single delivery."""
+        channel = MagicMock()
+        method = MagicMock()
+        method.delivery_tag = 7
+        properties = MagicMock()
+        return channel, method, properties
+
+    def test_on_message_decodes_json_by_default(self, delivery):
+        """Test that message bodies are decoded as JSON."""
+        # Arrange
+        channel, method, properties = delivery
+        consumer = RabbitMQMessageConsumer()
+        callback = MagicMock()
+        consumer._callback = callback
+
+        # Act
+        consumer._on_message(channel, method, properties, json.dumps({"content": "hi"}).encode('utf-8'))
+
+        # Assert
+        callback.assert_called_once_with({"content": "hi", "message_id": 7})
+        channel.basic_reject.assert_not_called()
+
+    def test_on_message_rejects_undecodable_body(self, delivery):
+        """Test that a body that cannot be decoded is rejected without requeue."""
+        # Arrange
+        channel, method, properties = delivery
+        consumer = RabbitMQMessageConsumer()
+        callback = MagicMock()
+        consumer._callback = callback
+
+        # Act
+        consumer._on_message(channel, method, properties, b"not json")
+
+        # Assert
+        callback.assert_not_called()
+        channel.basic_reject.assert_called_once_with(delivery_tag=7, requeue=False)
+
+    def test_on_message_passes_raw_body_when_consuming_raw(self, delivery):
+        """Test that raw consumers receive the undecoded body and its message ID."""
+        # Arrange
+        channel, method, properties = delivery
+        consumer = RabbitMQMessageConsumer()
+        consumer._channel = channel
+        raw_callback = MagicMock()
+        consumer.consume_raw("communications", raw_callback)
+
+        # Act
+        consumer._on_message(channel, method, properties, b'{"content": "hi"}')
+
+        # Assert
+        raw_callback.assert_called_once_with(b'{"content": "hi"}', "7")
+        channel.basic_reject.assert_not_called()
+
+    def test_acknowledge_messages_uses_multiple_for_contiguous_batch(self, delivery):
+        """Test that a batch covering all outstanding tags is acked with one frame."""
+        # Arrange
+        channel, method, properties = delivery
+        consumer = RabbitMQMessageConsumer()
+        consumer._channel = channel
+        consumer._callback = MagicMock()
+        for tag in (1, 2, 3):
+            method.delivery_tag = tag
+            consumer._on_message(channel, method, properties, b'{"content": "hi"}')
+
+        # Act
+        result = consumer.acknowledge_messages(["1", "2", "3"])
+
+        # Assert
+        assert result is True
+        channel.basic_ack.assert_called_once_with(delivery_tag=3, multiple=True)
+
+    def test_acknowledge_messages_acks_individually_around_outstanding_tags(self, delivery):
+        """Test that tags still being processed are not covered by a multiple ack."""
+        # Arrange
+        channel, method, properties = delivery
+        consumer = RabbitMQMessageConsumer()
+        consumer._channel = channel
+        consumer._callback = MagicMock()
+        for tag in (1, 2, 3):
+            method.delivery_tag = tag
+            consumer._on_message(channel, method, properties, b'{"content": "hi"}')
+
+        # Act - message 2 is still in flight
+        consumer.acknowledge_messages(["1", "3"])
+
+        # Assert
+        assert channel.basic_ack.call_args_list == [
+            call(delivery_tag=1),
+            call(delivery_tag=3),
+        ]
+
+    def test_consume_raw_limits_prefetch_before_consuming(self, delivery):
+        """Test that the prefetch limit is set on the channel before the consumer subscribes."""
+        # Arrange
+        channel, method, properties = delivery
+        consumer = RabbitMQMessageConsumer(prefetch_count=4)
+        consumer._channel = channel
+
+        # Act
+        consumer.consume_raw("communications", MagicMock())
+
+        # Assert
+        calls = [name for name, _, _ in channel.mock_calls]
+        assert calls.index("basic_qos") < calls.index("basic_consume")
+        channel.basic_qos.assert_called_once_with(prefetch_count=4)
+
+    def test_stop_consuming_cancels_on_the_connection_thread(self, delivery):
+        """Test that stopping from another thread is scheduled onto the IO loop and keeps the channel."""
+        # Arrange
+        channel, method, properties = delivery
+        connection = MagicMock()
+        connection.is_open = True
+        consumer = RabbitMQMessageConsumer()
+        consumer._connection = connection
+        consumer._channel = channel
+        consumer._consumer_tag = "consumer-1"
+        consumer._consumer_thread_id = threading.get_ident() + 1
+
+        # Act
+        result = consumer.stop_consuming()
+        scheduled = connection.add_callback_threadsafe.call_args.args[0]
+        channel.stop_consuming.assert_not_called()
+        scheduled()
+
+        # Assert
+        assert result is True
+        channel.stop_consuming.assert_called_once_with()
+        assert consumer._channel is channel
+        assert consumer._consumer_tag is None
@@ -4,8 +4,9 @@ Unit tests for the RabbitMQ message publisher adapter.
 This test module verifies that the RabbitMQ adapter correctly implements the
 message publisher interface and interacts with pika as expected.
 """
-import json
+import orjson
 import pytest
+from datetime import datetime
 from unittest.mock import MagicMock, patch, call
 from typing import Dict, Any
 
@@ -185,11 +186,13 @@ class TestRabbitMQMessagePublisher:
         
         assert kwargs["exchange"] == exchange
         assert kwargs["routing_key"] == routing_key
-        assert kwargs["body"] == json.dumps(message).encode('utf-8')
+        assert kwargs["body"] == orjson.dumps(message)
         
         # Verify properties
         properties = kwargs["properties"]
         assert properties.content_type == "application/json"
+        assert properties.content_encoding == "utf-8"
+        assert properties.type is None
         assert properties.delivery_mode == 2  # persistent
     
     def test_publish_message_not_connected(self):
@@ -259,4 +262,162 @@ class TestRabbitMQMessagePublisher:
         # Verify properties - delivery_mode should be 1 (non-persistent)
         args, kwargs = mock_channel.basic_publish.call_args
         properties = kwargs["properties"]
-        assert properties.delivery_mode == 1  # non-persistent
\ No newline at end of file
+        assert properties.delivery_mode == 1  # non-persistent
+    
+    def test_publish_raw_sends_body_unmodified(self, mock_pika_connection):
+        """Test publishing pre-serialized bytes without re-encoding."""
+        # Arrange
+        mock_connection, mock_channel = mock_pika_connection
+        
+        publisher = RabbitMQMessagePublisher(
+            host='localhost',
+            port=5672,
+            username='guest',
+            password='guest'
+        )
+        
+        # Connect first
+        publisher.connect()
+        
+        body = b'{"test": "message"}'
+        
+        # Act
+        result = publisher.publish_raw("test-exchange", "test.key", body)
+        
+        # Assert
+        assert result is True
+        
+        args, kwargs = mock_channel.basic_publish.call_args
+        assert kwargs["body"] is body
+        assert kwargs["properties"].content_type == "application/json"
+        assert kwargs["properties"].delivery_mode == 2  # persistent
+    
+    def test_publish_message_with_schema(self, mock_pika_connection):
+        """Test that the schema is sent as the message type property."""
+        # Arrange
+        mock_connection, mock_channel = mock_pika_connection
+        
+        publisher = RabbitMQMessagePublisher(
+            host='localhost',
+            port=5672,
+            username='guest',
+            password='guest'
+        )
+        
+        # Connect first
+        publisher.connect()
+        
+        # Act
+        result = publisher.publish_message(
+            "test-exchange",
+            "test.key",
+            {"test": "message"},
+            schema="TestMessage/v1"
+        )
+        
+        # Assert
+        assert result is True
+        
+        args, kwargs = mock_channel.basic_publish.call_args
+        assert kwargs["properties"].type == "TestMessage/v1"
+    
+    def test_publish_message_serializes_datetimes(self, mock_pika_connection):
+        """Test that datetime values are serialized to ISO 8601 strings."""
+        # Arrange
+        mock_connection, mock_channel = mock_pika_connection
+        
+        publisher = RabbitMQMessagePublisher(
+            host='localhost',
+            port=5672,
+            username='guest',
+            password='guest'
+        )
+        
+        # Connect first
+        publisher.connect()
+        
+        # Act
+        result = publisher.publish_message(
+            "test-exchange",
+            "test.key",
+            {"when": datetime(2025, 4, 25, 15, 30), "end_time": None}
+        )
+        
+        # Assert
+        assert result is True
+        
+        args, kwargs = mock_channel.basic_publish.call_args
+        assert orjson.loads(kwargs["body"]) == {"when": "2025-04-25T15:30:00", "end_time": None}
+    
+    def test_publish_message_reuses_pooled_connection(self, mock_pika_connection):
+        """Test that sequential publishes share one connection and channel."""
+        # Arrange
+        mock_connection, mock_channel = mock_pika_connection
+        
+        publisher = RabbitMQMessagePublisher(
+            host='localhost',
+            port=5672,
+            username='guest',
+            password='guest'
+        )
+        
+        # Connect first
+        publisher.connect()
+        
+        # Act
+        for _ in range(3):
+            publisher.publish_message("test-exchange", "test.key", {"test": "message"})
+        
+        # Assert
+        mock_connection.assert_called_once()
+        assert mock_channel.basic_publish.call_count == 3
+    
+    def test_failed_publish_replaces_broken_connection(self):
+        """Test that a connection whose publish failed is not used again."""
+        # Arrange
+        connections = []
+        
+        def open_connection(parameters):
+            connection = MagicMock()
+            connections.append(connection)
+            return connection
+        
+        with patch('pika.BlockingConnection', side_effect=open_connection):
+            publisher = RabbitMQMessagePublisher()
+            publisher.connect()
+            connections[0].channel.return_value.basic_publish.side_effect = AMQPError("Channel closed")
+            
+            # Act
+            first_result = publisher.publish_message("test-exchange", "test.key", {"test": "message"})
+            second_result = publisher.publish_message("test-exchange", "test.key", {"test": "message"})
+            
+            # Assert
+            assert first_result is False
+            assert second_result is True
+            connections[0].close.assert_called_once()
+            connections[1].channel.return_value.basic_publish.assert_called_once()
+    
+    def test_failed_publish_is_retried_on_a_fresh_connection(self):
+        """Test that a failed publish is retried when retries are enabled."""
+        # Arrange
+        connections = []
+        
+        def open_connection(parameters):
+            connection = MagicMock()
+            connections.append(connection)
+            return connection
+        
+        with patch('pika.BlockingConnection', side_effect=open_connection), \
+                patch('time.sleep') as mock_sleep:
+            publisher = RabbitMQMessagePublisher(publish_attempts=3, publish_backoff=0.1)
+            publisher.connect()
+            connections[0].channel.return_value.basic_publish.side_effect = AMQPError("Channel closed")
+            
+            # Act
+            result = publisher.publish_message("test-exchange", "test.key", {"test": "message"})
+            
+            # Assert
+            assert result is True
+            connections[0].close.assert_called_once()
+            connections[1].channel.return_value.basic_publish.assert_called_once()
+            mock_sleep.assert_called_once_with(0.1)
@@ -28,9 +28,18 @@ class TestMessageConsumerInterface:
             def consume_messages(self, queue_name: str, callback: Callable[[dict], Any]) -> None:
                 pass
             
+            def consume_raw(self, queue_name: str, callback: Callable[[bytes, str], Any]) -> None:
+                pass
+            
+            def stop_consuming(self) -> bool:
+                return True
+            
             def acknowledge_message(self, message_id: str) -> bool:
                 return True
             
+            def acknowledge_messages(self, message_ids: List[str]) -> bool:
+                return True
+            
             def reject_message(self, message_id: str, requeue: bool = False) -> bool:
                 return True
         
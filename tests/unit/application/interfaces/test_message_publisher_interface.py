@@ -27,6 +27,15 @@ class ConcreteMessagePublisher:
                       persistent: bool = True) -> bool:
         """Publish message implementation for testing."""
         return True
+    
+    def publish_raw(self, 
+                    exchange: str,
+                    routing_key: str, 
+                    body: bytes,
+                    content_type: str = "application/json",
+                    persistent: bool = True) -> bool:
+        """Publish raw implementation for testing."""
+        return True
 
 
 class TestMessagePublisherInterface:
@@ -41,6 +50,7 @@ class TestMessagePublisherInterface:
         assert publisher.connect() is True
         assert publisher.disconnect() is True
         assert publisher.publish_message("test-exchange", "test.key", {"test": "message"}) is True
+        assert publisher.publish_raw("test-exchange", "test.key", b'{"test": "message"}') is True
         
         # Verify the object satisfies the Protocol
         assert isinstance(publisher, MessagePublisherInterface)
@@ -77,6 +87,14 @@ class TestMessagePublisherInterface:
                               content_type: str = "application/json",
                               persistent: bool = True) -> bool:
                 return False
+                
+            def publish_raw(self, 
+                            exchange: str,
+                            routing_key: str, 
+                            body: bytes,
+                            content_type: str = "application/json",
+                            persistent: bool = True) -> bool:
+                return False
         
         # Act
         random_obj = RandomPublisherLike()
@@ -0,0 +1,108 @@
+"""
+Unit tests for the background message publisher.
+"""
+import logging
+import threading
+from unittest.mock import MagicMock
+
+from audhd_lifecoach.application.interfaces.message_publisher_interface import MessagePublisherInterface
+from audhd_lifecoach.application.services.background_message_publisher import BackgroundMessagePublisher
+
+
+class TestBackgroundMessagePublisher:
+    """Test case for the background message publisher."""
+    
+    def test_implements_interface(self):
+        """Test that the background publisher satisfies the publisher protocol."""
+        # Arrange
+        publisher = BackgroundMessagePublisher(MagicMock())
+        
+        # Assert
+        assert isinstance(publisher, MessagePublisherInterface)
+    
+    def test_queued_messages_are_published_before_disconnect(self):
+        """Test that every queued message is sent by the wrapped publisher."""
+        # Arrange
+        wrapped_publisher = MagicMock()
+        wrapped_publisher.connect.return_value = True
+        publisher = BackgroundMessagePublisher(wrapped_publisher)
+        publisher.connect()
+        
+        # Act
+        results = [
+            publisher.publish_message("test-exchange", "test.key", {"n": n})
+            for n in range(3)
+        ]
+        publisher.disconnect()
+        
+        # Assert
+        assert results == [True, True, True]
+        assert wrapped_publisher.publish_message.call_count == 3
+        args, kwargs = wrapped_publisher.publish_message.call_args
+        assert kwargs["message"] == {"n": 2}
+        wrapped_publisher.disconnect.assert_called_once()
+    
+    def test_publish_fails_when_queue_is_full(self):
+        """Test that messages are dropped once the queue is full."""
+        # Arrange - the worker is held on the first message, so nothing drains the queue
+        publishing = threading.Event()
+        release = threading.Event()
+        
+        def publish_raw(**kwargs):
+            publishing.set()
+            release.wait(timeout=5)
+            return True
+        
+        wrapped_publisher = MagicMock()
+        wrapped_publisher.connect.return_value = True
+        wrapped_publisher.publish_raw.side_effect = publish_raw
+        publisher = BackgroundMessagePublisher(wrapped_publisher, max_queue_size=1)
+        publisher.connect()
+        publisher.publish_raw("test-exchange", "test.key", b"{}")
+        assert publishing.wait(timeout=5)
+        
+        # Act
+        queued_result = publisher.publish_raw("test-exchange", "test.key", b"{}")
+        dropped_result = publisher.publish_raw("test-exchange", "test.key", b"{}")
+        release.set()
+        publisher.disconnect()
+        
+        # Assert
+        assert queued_result is True
+        assert dropped_result is False
+        assert wrapped_publisher.publish_raw.call_count == 2
+    
+    def test_publish_fails_when_not_connected(self):
+        """Test that messages are refused while no background thread would send them."""
+        # Arrange
+        wrapped_publisher = MagicMock()
+        wrapped_publisher.connect.return_value = False
+        publisher = BackgroundMessagePublisher(wrapped_publisher)
+        publisher.connect()
+        
+        # Act
+        result = publisher.publish_raw("test-exchange", "test.key", b"{}")
+        
+        # Assert
+        assert result is False
+    
+    def test_worker_logs_the_publish_outcome(self, caplog):
+        """Test that the background thread logs whether each message reached the broker."""
+        # Arrange
+        wrapped_publisher = MagicMock()
+        wrapped_publisher.connect.return_value = True
+        wrapped_publisher.publish_raw.side_effect = [True, False]
+        publisher = BackgroundMessagePublisher(wrapped_publisher)
+        publisher.connect()
+        
+        # Act
+        with caplog.at_level(logging.INFO):
+            publisher.publish_raw("test-exchange", "first.key", b"{}")
+            publisher.publish_raw("test-exchange", "second.key", b"{}")
+            publisher.disconnect()
+        
+        # Assert
+        assert [(record.levelno, record.getMessage()) for record in caplog.records] == [
+            (logging.INFO, "Published message to routing key 'first.key'"),
+            (logging.WARNING, "Background publish to routing key 'second.key' failed"),
+        ]
@@ -0,0 +1,381 @@
+"""
+Unit tests for the message consumer service.
+
+These tests cover how the service formats processing results, batches
+message acknowledgments, runs its message consumers and hands messages to
+its workers.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from audhd_lifecoach.application.dtos.communication_dto import CommunicationResponseDTO, ReminderResponseDTO
+from audhd_lifecoach.application.services.message_consumer_service import MessageConsumerService
+
+
+class TestMessageConsumerServiceProcessing:
+    """Test case for processing a single message."""
+    
+    def test_process_message_formats_reminders(self):
+        """Test that the result lists each reminder as a flat dictionary."""
+        # Arrange
+        reminder = ReminderResponseDTO(
+            message="Time to leave for coffee with Friend",
+            when=datetime(2025, 4, 25, 15, 10),
+            acknowledged=False,
+            commitment_what="coffee",
+            commitment_who="Friend",
+            commitment_start_time=datetime(2025, 4, 25, 15, 30),
+            commitment_end_time=datetime(2025, 4, 25, 16, 30),
+            commitment_where="Cafe"
+        )
+        use_case = MagicMock()
+        use_case.execute.return_value = CommunicationResponseDTO(processed=True, reminders=[reminder])
+        service = MessageConsumerService(
+            message_consumer=MagicMock(),
+            process_communication_use_case=use_case
+        )
+        
+        # Act
+        result = service._process_message({
+            "content": "Coffee at 15:30?",
+            "sender": "Friend",
+            "recipient": "Me",
+            "message_id": 5
+        })
+        
+        # Assert
+        assert result["message_id"] == 5
+        assert result["commitments_found"] == 1
+        assert result["reminders"] == [{
+            "message": "Time to leave for coffee with Friend",
+            "when": datetime(2025, 4, 25, 15, 10),
+            "acknowledged": False,
+            "commitment_what": "coffee",
+            "commitment_who": "Friend",
+            "commitment_start_time": datetime(2025, 4, 25, 15, 30),
+            "commitment_end_time": datetime(2025, 4, 25, 16, 30),
+            "commitment_where": "Cafe",
+        }]
+    
+    def test_process_message_rejects_invalid_message(self):
+        """Test that a message that does not match the request schema is not processed."""
+        # Arrange
+        use_case = MagicMock()
+        service = MessageConsumerService(
+            message_consumer=MagicMock(),
+            process_communication_use_case=use_case
+        )
+        
+        # Act - sender is missing and content is not a string
+        result = service._process_message({"content": 42, "recipient": "Me", "message_id": 6})
+        
+        # Assert
+        assert result is None
+        use_case.execute.assert_not_called()
+    
+    def test_process_message_parses_raw_body(self):
+        """Test that a raw JSON body is parsed straight into the request DTO."""
+        # Arrange
+        use_case = MagicMock()
+        use_case.execute.return_value = CommunicationResponseDTO(processed=True, reminders=[])
+        service = MessageConsumerService(
+            message_consumer=MagicMock(),
+            process_communication_use_case=use_case
+        )
+        
+        # Act
+        result = service._process_message(
+            b'{"content": "Coffee at 15:30?", "sender": "Friend", "recipient": "Me"}',
+            "7"
+        )
+        
+        # Assert
+        request_dto = use_case.execute.call_args.args[0]
+        assert request_dto.content == "Coffee at 15:30?"
+        assert request_dto.sender == "Friend"
+        assert result["message_id"] == "7"
+        assert result["commitments_found"] == 0
+    
+    def test_process_message_rejects_malformed_raw_body(self):
+        """Test that a raw body that is not valid JSON is not processed."""
+        # Arrange
+        use_case = MagicMock()
+        service = MessageConsumerService(
+            message_consumer=MagicMock(),
+            process_communication_use_case=use_case
+        )
+        
+        # Act
+        result = service._process_message(b"not json", "8")
+        
+        # Assert
+        assert result is None
+        use_case.execute.assert_not_called()
+    
+    def test_process_messages_processes_valid_messages_as_one_batch(self):
+        """Test that valid messages are processed together and invalid ones yield None."""
+        # Arrange
+        use_case = MagicMock()
+        use_case.execute_many.return_value = [
+            CommunicationResponseDTO(processed=True, reminders=[]),
+            CommunicationResponseDTO(processed=True, reminders=[]),
+        ]
+        service = MessageConsumerService(
+            message_consumer=MagicMock(),
+            process_communication_use_case=use_case
+        )
+        
+        # Act
+        results = service.process_messages([
+            {"content": "Call at 15:30", "sender": "Friend", "recipient": "Me", "message_id": 1},
+            b"not json",
+            b'{"content": "Lunch at noon", "sender": "Friend", "recipient": "Me"}',
+        ])
+        
+        # Assert
+        use_case.execute_many.assert_called_once()
+        use_case.execute.assert_not_called()
+        request_dtos = use_case.execute_many.call_args.args[0]
+        assert [dto.content for dto in request_dtos] == ["Call at 15:30", "Lunch at noon"]
+        assert results[0]["message_id"] == 1
+        assert results[1] is None
+        assert results[2]["message_id"] == "unknown"
+    
+    def test_process_messages_keeps_ids_of_raw_bodies(self):
+        """Test that IDs passed alongside raw bodies are reported in their results."""
+        # Arrange
+        use_case = MagicMock()
+        use_case.execute_many.return_value = [
+            CommunicationResponseDTO(processed=True, reminders=[]),
+            CommunicationResponseDTO(processed=True, reminders=[]),
+        ]
+        service = MessageConsumerService(
+            message_consumer=MagicMock(),
+            process_communication_use_case=use_case
+        )
+        
+        # Act
+        results = service.process_messages(
+            [
+                b'{"content": "Call at 15:30", "sender": "Friend", "recipient": "Me"}',
+                b"not json",
+                b'{"content": "Lunch at noon", "sender": "Friend", "recipient": "Me"}',
+            ],
+            message_ids=["11", "12", "13"]
+        )
+        
+        # Assert
+        assert results[0]["message_id"] == "11"
+        assert results[1] is None
+        assert results[2]["message_id"] == "13"
+    
+    def test_process_messages_requires_one_id_per_message(self):
+        """Test that a mismatched list of message IDs is refused."""
+        # Arrange
+        service = MessageConsumerService(
+            message_consumer=MagicMock(),
+            process_communication_use_case=MagicMock()
+        )
+        
+        # Act & Assert
+        with pytest.raises(ValueError):
+            service.process_messages([b"{}", b"{}"], message_ids=["1"])
+
+
+class TestMessageConsumerServiceAckBatching:
+    """Test case for acknowledgment batching in the message consumer service."""
+    
+    def test_full_batch_is_acknowledged_immediately(self):
+        """Test that reaching the batch size sends the acknowledgments at once."""
+        # Arrange
+        message_consumer = MagicMock()
+        service = MessageConsumerService(
+            message_consumer=message_consumer,
+            process_communication_use_case=MagicMock(),
+            ack_batch_size=3,
+            ack_flush_interval=60
+        )
+        
+        # Act
+        for message_id in (1, 2, 3):
+            service._buffer_ack(message_id)
+        
+        # Assert
+        message_consumer.acknowledge_messages.assert_called_once_with([1, 2, 3])
+        assert service._ack_timer is None
+    
+    def test_partial_batch_is_flushed_after_interval(self):
+        """Test that a partial batch is sent once the flush interval elapses."""
+        # Arrange
+        message_consumer = MagicMock()
+        service = MessageConsumerService(
+            message_consumer=message_consumer,
+            process_communication_use_case=MagicMock(),
+            ack_batch_size=10,
+            ack_flush_interval=0.01
+        )
+        
+        # Act
+        service._buffer_ack(1)
+        service._buffer_ack(2)
+        time.sleep(0.2)
+        
+        # Assert
+        message_consumer.acknowledge_messages.assert_called_once_with([1, 2])
+    
+    def test_batch_is_acknowledged_by_the_receiving_consumers(self):
+        """Test that each consumer acknowledges only the messages it received."""
+        # Arrange
+        primary_consumer = MagicMock()
+        other_consumer = MagicMock()
+        service = MessageConsumerService(
+            message_consumer=primary_consumer,
+            process_communication_use_case=MagicMock(),
+            ack_batch_size=3,
+            ack_flush_interval=60
+        )
+        
+        # Act
+        service._buffer_ack(1, primary_consumer)
+        service._buffer_ack(1, other_consumer)
+        service._buffer_ack(2, primary_consumer)
+        
+        # Assert
+        primary_consumer.acknowledge_messages.assert_called_once_with([1, 2])
+        other_consumer.acknowledge_messages.assert_called_once_with([1])
+    
+    def test_failed_acknowledgment_does_not_escape_flush(self):
+        """Test that a consumer failing to acknowledge is skipped without raising."""
+        # Arrange
+        closed_consumer = MagicMock()
+        closed_consumer.acknowledge_messages.side_effect = AttributeError("'NoneType' object has no attribute 'basic_ack'")
+        open_consumer = MagicMock()
+        service = MessageConsumerService(
+            message_consumer=closed_consumer,
+            process_communication_use_case=MagicMock(),
+            ack_batch_size=10,
+            ack_flush_interval=60
+        )
+        service._buffer_ack(1, closed_consumer)
+        service._buffer_ack(2, open_consumer)
+        
+        # Act
+        service._flush_acks()
+        
+        # Assert
+        closed_consumer.acknowledge_messages.assert_called_once_with([1])
+        open_consumer.acknowledge_messages.assert_called_once_with([2])
+        assert service._ack_buffer == []
+
+
+class TestMessageConsumerServiceConsumers:
+    """Test case for running several message consumers."""
+    
+    def test_start_in_background_runs_every_consumer(self):
+        """Test that a non-blocking start runs one loop per consumer until stopped."""
+        # Arrange
+        primary_consumer = MagicMock()
+        extra_consumers = [MagicMock(), MagicMock()]
+        service = MessageConsumerService(
+            message_consumer=primary_consumer,
+            process_communication_use_case=MagicMock(),
+            consumer_factory=MagicMock(side_effect=extra_consumers),
+            num_consumers=3
+        )
+        
+        # Act
+        service.start(block=False)
+        consuming_while_started = service.is_consuming
+        service.stop()
+        
+        # Assert
+        for consumer in [primary_consumer, *extra_consumers]:
+            consumer.connect.assert_called_once()
+            consumer.consume_raw.assert_called_once()
+            consumer.disconnect.assert_called()
+        assert consuming_while_started is True
+        assert service.is_consuming is False
+    
+    def test_stop_acknowledges_message_in_flight_before_disconnecting(self):
+        """Test that stopping lets an in-flight message finish and be acked while still connected."""
+        # Arrange
+        events = []
+        stop_requested = threading.Event()
+        
+        def consume_raw(queue_name, callback):
+            callback(b'{"content": "Call at 15:30", "sender": "Friend", "recipient": "Me"}', "1")
+            stop_requested.wait(timeout=5)
+        
+        def acknowledge_messages(message_ids):
+            # Acknowledging after disconnecting fails, as it does on a closed channel
+            if "disconnect" in events:
+                raise AttributeError("'NoneType' object has no attribute 'basic_ack'")
+            events.append(("ack", message_ids))
+            return True
+        
+        def execute(communication_dto):
+            # Keep the message in flight until the service is asked to stop
+            stop_requested.wait(timeout=5)
+            return CommunicationResponseDTO(processed=True, reminders=[])
+        
+        message_consumer = MagicMock()
+        message_consumer.consume_raw.side_effect = consume_raw
+        message_consumer.stop_consuming.side_effect = lambda: stop_requested.set() or True
+        message_consumer.acknowledge_messages.side_effect = acknowledge_messages
+        message_consumer.disconnect.side_effect = lambda: events.append("disconnect") or True
+        use_case = MagicMock()
+        use_case.execute.side_effect = execute
+        service = MessageConsumerService(
+            message_consumer=message_consumer,
+            process_communication_use_case=use_case,
+            ack_flush_interval=60
+        )
+        service.start(block=False)
+        
+        # Act
+        service.stop()
+        
+        # Assert
+        assert events == [("ack", ["1"]), "disconnect"]
+        assert service.is_consuming is False
+    
+    def test_multiple_consumers_require_a_factory(self):
+        """Test that asking for several consumers without a factory fails fast."""
+        # Act & Assert
+        with pytest.raises(ValueError):
+            MessageConsumerService(
+                message_consumer=MagicMock(),
+                process_communication_use_case=MagicMock(),
+                num_consumers=2
+            )
+
+
+class TestMessageConsumerServiceDispatch:
+    """Test case for handing messages to the worker pool."""
+    
+    def test_callback_does_not_wait_for_a_free_worker(self):
+        """Test that dispatching never blocks the consumer's IO thread while the workers are busy."""
+        # Arrange
+        release_processing = threading.Event()
+        service = MessageConsumerService(
+            message_consumer=MagicMock(),
+            process_communication_use_case=MagicMock(),
+            max_workers=1
+        )
+        service._executor = ThreadPoolExecutor(max_workers=1)
+        service._process_message = lambda body, message_id: release_processing.wait(timeout=5)
+        
+        # Act - both deliveries are dispatched while the only worker is busy
+        futures = [service._raw_message_callback(b"{}", str(tag)) for tag in (1, 2)]
+        
+        # Assert
+        assert not any(future.done() for future in futures)
+        release_processing.set()
+        for future in futures:
+            future.result(timeout=1)
+        service._executor.shutdown(wait=True)
@@ -8,6 +8,8 @@ import pytest
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
+import orjson
+
 from audhd_lifecoach.application.dtos.communication_dto import CommunicationRequestDTO, CommunicationResponseDTO
 from audhd_lifecoach.application.interfaces.message_publisher_interface import MessagePublisherInterface
 from audhd_lifecoach.application.use_cases.process_communication import ProcessCommunication
@@ -44,7 +46,7 @@ class TestProcessCommunicationPublishing:
     def mock_message_publisher(self):
         """Create a mock message publisher."""
         publisher = MagicMock()
-        publisher.publish_message.return_value = True
+        publisher.publish_raw.return_value = True
         return publisher
     
     @pytest.fixture
@@ -76,26 +78,29 @@ class TestProcessCommunicationPublishing:
         assert len(response.reminders) == 1
         
         # 2. Verify the results were published
-        mock_message_publisher.publish_message.assert_called_once()
-        args, kwargs = mock_message_publisher.publish_message.call_args
+        mock_message_publisher.publish_raw.assert_called_once()
+        mock_message_publisher.publish_message.assert_not_called()
+        args, kwargs = mock_message_publisher.publish_raw.call_args
         
         # Check exchange and routing key
         assert kwargs["exchange"] == "test-exchange"
         assert kwargs["routing_key"] == "communication.processed"
+        assert kwargs["schema"] == "CommunicationProcessed/v1"
         
         # Check message contents
-        message = kwargs["message"]
+        message = orjson.loads(kwargs["body"])
         assert "original_communication" in message
         assert message["original_communication"]["content"] == communication_dto.content
         assert message["original_communication"]["sender"] == communication_dto.sender
         assert message["original_communication"]["recipient"] == communication_dto.recipient
         assert message["processed"] is True
         assert len(message["reminders"]) == 1
+        assert message["reminders"][0]["when"] == "2025-04-25T15:30:00"
     
     def test_execute_with_publisher_failure(self, mock_communication_processor, mock_message_publisher, communication_dto):
         """Test that the use case handles publishing failures gracefully."""
         # Arrange
-        mock_message_publisher.publish_message.return_value = False  # Simulate publishing failure
+        mock_message_publisher.publish_raw.return_value = False  # Simulate publishing failure
         
         use_case = ProcessCommunication(
             communication_processor=mock_communication_processor,
@@ -114,7 +119,7 @@ class TestProcessCommunicationPublishing:
     def test_execute_with_publisher_exception(self, mock_communication_processor, mock_message_publisher, communication_dto):
         """Test that the use case handles publishing exceptions gracefully."""
         # Arrange
-        mock_message_publisher.publish_message.side_effect = Exception("Publishing error")
+        mock_message_publisher.publish_raw.side_effect = Exception("Publishing error")
         
         use_case = ProcessCommunication(
             communication_processor=mock_communication_processor,
@@ -128,4 +133,32 @@ class TestProcessCommunicationPublishing:
         # Assert
         # Verify the use case completes successfully despite publishing exception
         assert response.processed is True
-        assert len(response.reminders) == 1
\ No newline at end of file
+        assert len(response.reminders) == 1
+    
+    def test_execute_many_processes_as_one_batch(self, mock_communication_processor, mock_message_publisher, communication_dto):
+        """Test that several communications are processed in one batch and each result is published."""
+        # Arrange
+        reminder = mock_communication_processor.process_communication.return_value[0]
+        mock_communication_processor.process_communications.return_value = [[reminder], []]
+        use_case = ProcessCommunication(
+            communication_processor=mock_communication_processor,
+            message_publisher=mock_message_publisher,
+            exchange_name="test-exchange"
+        )
+        no_commitment_dto = CommunicationRequestDTO(
+            content="The weather is nice today",
+            sender="Alice",
+            recipient="Bob",
+            timestamp=datetime(2025, 4, 24, 10, 0)
+        )
+        
+        # Act
+        responses = use_case.execute_many([communication_dto, no_commitment_dto])
+        
+        # Assert
+        mock_communication_processor.process_communications.assert_called_once()
+        mock_communication_processor.process_communication.assert_not_called()
+        communications = mock_communication_processor.process_communications.call_args.args[0]
+        assert [c.content for c in communications] == [communication_dto.content, no_commitment_dto.content]
+        assert [len(response.reminders) for response in responses] == [1, 0]
+        assert mock_message_publisher.publish_raw.call_count == 2
@@ -1,4 +1,6 @@
+import copy
 import pytest
+from dataclasses import FrozenInstanceError, asdict, fields
 from datetime import datetime, timedelta
 from audhd_lifecoach.core.domain.entities.commitment import Commitment
 from audhd_lifecoach.core.domain.config import DEFAULT_TRAVEL_TIME, DEFAULT_PREP_TIME
@@ -160,4 +162,68 @@ class TestCommitment:
         
         # Act & Assert
         assert commitment.duration == timedelta(hours=1, minutes=30)
-        assert commitment.duration.total_seconds() == 5400  # 1.5 hours = 5400 seconds
\ No newline at end of file
+        assert commitment.duration.total_seconds() == 5400  # 1.5 hours = 5400 seconds
+        
+    def test_commitment_is_immutable(self):
+        """Test that a commitment cannot be modified after creation."""
+        # Arrange
+        commitment = Commitment(
+            start_time=datetime(2025, 4, 20, 15, 30),
+            end_time=datetime(2025, 4, 20, 16, 30),
+            who="Friend",
+            what="Give a ride",
+            where="Friend's house"
+        )
+        
+        # Act & Assert
+        with pytest.raises(FrozenInstanceError):
+            commitment.where = "Somewhere else"
+        
+    def test_derived_values_are_not_dataclass_fields(self):
+        """Test that cached values stay out of fields, asdict and equality."""
+        # Arrange
+        commitment = Commitment(
+            start_time=datetime(2025, 4, 20, 15, 30),
+            end_time=datetime(2025, 4, 20, 16, 30),
+            who="Friend",
+            what="Give a ride",
+            where="Friend's house"
+        )
+        same_commitment = Commitment(
+            start_time=datetime(2025, 4, 20, 15, 30),
+            end_time=datetime(2025, 4, 20, 16, 30),
+            who="Friend",
+            what="Give a ride",
+            where="Friend's house"
+        )
+        
+        # Act
+        str(commitment)
+        
+        # Assert
+        assert [field.name for field in fields(commitment)] == [
+            "start_time", "end_time", "who", "what", "where",
+            "estimated_travel_time", "estimated_prep_time"
+        ]
+        assert set(asdict(commitment)) == {field.name for field in fields(commitment)}
+        assert commitment == same_commitment
+        
+    def test_copy_keeps_derived_values(self):
+        """Test that a copied commitment still has its derived values."""
+        # Arrange
+        commitment = Commitment(
+            start_time=datetime(2025, 4, 20, 15, 30),
+            end_time=datetime(2025, 4, 20, 16, 30),
+            who="Friend",
+            what="Give a ride",
+            where="Friend's house"
+        )
+        
+        # Act
+        copied = copy.deepcopy(commitment)
+        
+        # Assert
+        assert copied == commitment
+        assert copied.duration == timedelta(hours=1)
+        assert copied.calculate_departure_time() == commitment.calculate_departure_time()
+        assert str(copied) == str(commitment)
@@ -1,4 +1,6 @@
+import copy
 import pytest
+from dataclasses import FrozenInstanceError, asdict, fields
 from datetime import datetime
 from audhd_lifecoach.core.domain.entities.communication import Communication
 
@@ -84,4 +86,56 @@ class TestCommunication:
         assert sender in str_repr
         assert recipient in str_repr
         assert "14:30" in str_repr
-        assert content in str_repr
\ No newline at end of file
+        assert content in str_repr
+    
+    def test_communication_is_immutable(self):
+        """Test that a communication cannot be modified after creation."""
+        # Arrange
+        communication = Communication(content="Hello", sender="Me", recipient="Friend")
+        
+        # Act & Assert
+        with pytest.raises(FrozenInstanceError):
+            communication.content = "Goodbye"
+    
+    def test_str_representation_is_cached(self):
+        """Test that repeated string conversions return the same cached string."""
+        # Arrange
+        communication = Communication(
+            content="Hello",
+            sender="Me",
+            recipient="Friend",
+            timestamp=datetime(2025, 4, 19, 14, 30)
+        )
+        
+        # Act
+        first = str(communication)
+        second = str(communication)
+        
+        # Assert
+        assert first is second
+        assert communication == Communication(
+            content="Hello",
+            sender="Me",
+            recipient="Friend",
+            timestamp=datetime(2025, 4, 19, 14, 30)
+        )
+    
+    def test_str_cache_is_not_a_dataclass_field(self):
+        """Test that the cached string stays out of fields and asdict, and survives copying."""
+        # Arrange
+        communication = Communication(
+            content="Hello",
+            sender="Me",
+            recipient="Friend",
+            timestamp=datetime(2025, 4, 19, 14, 30)
+        )
+        
+        # Act
+        text = str(communication)
+        copied = copy.copy(communication)
+        
+        # Assert
+        assert [field.name for field in fields(communication)] == ["content", "sender", "recipient", "timestamp"]
+        assert set(asdict(communication)) == {"content", "sender", "recipient", "timestamp"}
+        assert copied == communication
+        assert str(copied) == text
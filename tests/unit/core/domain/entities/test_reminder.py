@@ -1,5 +1,6 @@
 import pytest
 from datetime import datetime, timedelta
+from unittest.mock import patch
 from audhd_lifecoach.core.domain.entities.reminder import Reminder
 from audhd_lifecoach.core.domain.entities.commitment import Commitment
 
@@ -85,6 +86,59 @@ class TestReminder:
         assert commitment.what in reminder.message or "commitment" in reminder.message.lower()
         assert reminder.commitment == commitment
         
+    def test_reminders_from_commitments(self):
+        """Test that reminders created in a batch match those created one at a time."""
+        # Arrange
+        commitments = [
+            Commitment(
+                start_time=datetime(2025, 4, 20, 15, 30),
+                end_time=datetime(2025, 4, 20, 16, 30),
+                who="Friend",
+                what="Give a ride",
+                where="Friend's house"
+            ),
+            Commitment(
+                start_time=datetime(2025, 4, 19, 23, 5),
+                end_time=datetime(2025, 4, 19, 23, 50),
+                who="Mom",
+                what="Call",
+                where="Phone"
+            )
+        ]
+        
+        # Act - pin the current time so the second commitment is today
+        with patch("audhd_lifecoach.core.domain.entities.reminder.datetime", wraps=datetime) as mock_datetime:
+            mock_datetime.now.return_value = datetime(2025, 4, 19, 9, 0)
+            reminders = Reminder.from_commitments(commitments, lead_time=timedelta(minutes=15))
+            one_at_a_time = [
+                Reminder.from_commitment(commitment, lead_time=timedelta(minutes=15))
+                for commitment in commitments
+            ]
+        
+        # Assert
+        assert reminders == one_at_a_time
+        assert reminders[0].message == "Reminder: You have a commitment with Friend on 2025-04-20 at 15:30."
+        assert reminders[1].message == "Reminder: You have a commitment with Mom at 23:05 today."
+        
+    def test_reminder_uses_slots(self):
+        """Test that reminders store their fields in slots rather than a per-instance dict."""
+        # Arrange
+        commitment = Commitment(
+            start_time=datetime(2025, 4, 20, 15, 30),
+            end_time=datetime(2025, 4, 20, 16, 30),
+            who="Friend",
+            what="Meeting",
+            where="Office"
+        )
+        
+        # Act
+        reminder = Reminder.from_commitment(commitment)
+        
+        # Assert
+        assert not hasattr(reminder, "__dict__")
+        with pytest.raises(AttributeError):
+            reminder.priority = "High"
+        
     def test_acknowledge_reminder(self):
         """Test that a reminder can be acknowledged."""
         # Arrange
@@ -39,6 +39,10 @@ class SimpleCommitmentIdentifier:
             commitments.append(commitment)
             
         return commitments
+    
+    def identify_commitments_batch(self, communications: List[Communication]) -> List[List[Commitment]]:
+        """Identify commitments in each communication one at a time."""
+        return [self.identify_commitments(communication) for communication in communications]
 
 
 class AnotherIdentifier:
@@ -47,6 +51,9 @@ class AnotherIdentifier:
     def identify_commitments(self, communication: Communication) -> List[Commitment]:
         # Different implementation but same interface
         return []
+    
+    def identify_commitments_batch(self, communications: List[Communication]) -> List[List[Commitment]]:
+        return [[] for _ in communications]
 
 
 class TestCommitmentIdentifiable:
@@ -0,0 +1,89 @@
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+from audhd_lifecoach.core.domain.entities.commitment import Commitment
+from audhd_lifecoach.core.domain.entities.communication import Communication
+from audhd_lifecoach.core.services.communication_processor import CommunicationProcessor
+
+
+def make_commitment() -> Commitment:
+    """Create a commitment for the identifier to return."""
+    start_time = datetime(2025, 4, 20, 15, 30)
+    return Commitment(
+        start_time=start_time,
+        end_time=start_time + timedelta(hours=1),
+        who="Friend",
+        what="Meeting",
+        where="Office"
+    )
+
+
+class TestCommunicationProcessorCache:
+    def test_cache_is_disabled_by_default(self):
+        """Test that every communication goes through the identifier unless caching is enabled."""
+        # Arrange
+        identifier = MagicMock()
+        identifier.identify_commitments.return_value = [make_commitment()]
+        processor = CommunicationProcessor(identifier)
+        communication = Communication(content="Meet at 15:30", sender="Me", recipient="Friend")
+        
+        # Act
+        processor.process_communication(communication)
+        processor.process_communication(communication)
+        
+        # Assert
+        assert identifier.identify_commitments.call_count == 2
+    
+    def test_repeated_communication_skips_identifier(self):
+        """Test that an identical communication reuses the cached commitments."""
+        # Arrange
+        identifier = MagicMock()
+        identifier.identify_commitments.return_value = [make_commitment()]
+        processor = CommunicationProcessor(identifier, cache_size=10)
+        communication = Communication(content="Meet at 15:30", sender="Me", recipient="Friend")
+        
+        # Act
+        first = processor.process_communication(communication)
+        second = processor.process_communication(
+            Communication(content="Meet at 15:30", sender="Me", recipient="Friend")
+        )
+        
+        # Assert
+        identifier.identify_commitments.assert_called_once()
+        assert first == second
+        assert first[0] is not second[0]
+    
+    def test_expired_entries_are_identified_again(self):
+        """Test that cached commitments are not reused after the time to live."""
+        # Arrange
+        identifier = MagicMock()
+        identifier.identify_commitments.return_value = [make_commitment()]
+        processor = CommunicationProcessor(identifier, cache_size=10, cache_ttl=60)
+        communication = Communication(content="Meet at 15:30", sender="Me", recipient="Friend")
+        
+        # Act
+        with patch("time.monotonic", side_effect=[0.0, 61.0, 61.0]):
+            processor.process_communication(communication)
+            processor.process_communication(communication)
+        
+        # Assert
+        assert identifier.identify_commitments.call_count == 2
+    
+    def test_batch_only_identifies_uncached_communications(self):
+        """Test that a batch sends only the communications missing from the cache."""
+        # Arrange
+        identifier = MagicMock()
+        identifier.identify_commitments.return_value = [make_commitment()]
+        identifier.identify_commitments_batch.side_effect = lambda communications: [[] for _ in communications]
+        processor = CommunicationProcessor(identifier, cache_size=10)
+        cached = Communication(content="Meet at 15:30", sender="Me", recipient="Friend")
+        uncached = Communication(content="Hello", sender="Me", recipient="Friend")
+        processor.process_communication(cached)
+        
+        # Act
+        results = processor.process_communications([cached, uncached])
+        
+        # Assert
+        identifier.identify_commitments_batch.assert_called_once_with([uncached])
+        assert len(results[0]) == 1
+        assert results[1] == []
@@ -0,0 +1,117 @@
+import threading
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+from audhd_lifecoach.core.domain.entities.commitment import Commitment
+from audhd_lifecoach.core.domain.entities.reminder import Reminder
+from audhd_lifecoach.core.services.reminder_scheduler import ReminderScheduler
+
+
+NOW = datetime(2025, 4, 20, 15, 0)
+
+
+def make_reminder(when: datetime) -> Reminder:
+    """Create a reminder due at the given time."""
+    commitment = Commitment(
+        start_time=when + timedelta(minutes=30),
+        end_time=when + timedelta(minutes=90),
+        who="Friend",
+        what="Meeting",
+        where="Office"
+    )
+    return Reminder(when=when, commitment=commitment, message="Time to leave")
+
+
+class TestReminderScheduler:
+    def test_dispatches_only_due_reminders_in_order(self):
+        """Test that due reminders are dispatched earliest first and later ones are kept."""
+        # Arrange
+        on_due = MagicMock()
+        scheduler = ReminderScheduler(on_due, clock=lambda: NOW)
+        later = make_reminder(NOW + timedelta(minutes=5))
+        earliest = make_reminder(NOW - timedelta(minutes=10))
+        just_due = make_reminder(NOW)
+        for reminder in (later, earliest, just_due):
+            scheduler.schedule(reminder)
+        
+        # Act
+        dispatched = scheduler.dispatch_due()
+        
+        # Assert
+        assert dispatched == 2
+        assert [c.args[0] for c in on_due.call_args_list] == [earliest, just_due]
+        assert scheduler.next_due_time() == later.when
+    
+    def test_dispatch_is_capped_per_cycle(self):
+        """Test that a backlog of due reminders is spread over several cycles."""
+        # Arrange
+        on_due = MagicMock()
+        scheduler = ReminderScheduler(on_due, clock=lambda: NOW, max_batch=2)
+        for minutes in range(5):
+            scheduler.schedule(make_reminder(NOW - timedelta(minutes=minutes)))
+        
+        # Act
+        dispatched_per_cycle = [scheduler.dispatch_due() for _ in range(4)]
+        
+        # Assert
+        assert dispatched_per_cycle == [2, 2, 1, 0]
+        assert on_due.call_count == 5
+    
+    def test_acknowledged_reminders_are_skipped(self):
+        """Test that a reminder acknowledged before it is due is never dispatched."""
+        # Arrange
+        on_due = MagicMock()
+        scheduler = ReminderScheduler(on_due, clock=lambda: NOW)
+        reminder = make_reminder(NOW - timedelta(minutes=1))
+        scheduler.schedule(reminder)
+        reminder.acknowledge()
+        
+        # Act
+        dispatched = scheduler.dispatch_due()
+        
+        # Assert
+        assert dispatched == 0
+        on_due.assert_not_called()
+        assert scheduler.next_due_time() is None
+    
+    def test_snoozed_reminder_is_dispatched_at_its_new_time(self):
+        """Test that snoozing reschedules a reminder and drops its old slot."""
+        # Arrange
+        on_due = MagicMock()
+        current_time = [NOW]
+        scheduler = ReminderScheduler(on_due, clock=lambda: current_time[0])
+        reminder = make_reminder(NOW - timedelta(minutes=1))
+        scheduler.schedule(reminder)
+        
+        # Act
+        scheduler.snooze(reminder, timedelta(minutes=10))
+        dispatched_before = scheduler.dispatch_due()
+        current_time[0] = NOW + timedelta(minutes=10)
+        dispatched_after = scheduler.dispatch_due()
+        
+        # Assert
+        assert dispatched_before == 0
+        assert dispatched_after == 1
+        on_due.assert_called_once_with(reminder)
+        assert len(scheduler) == 0
+    
+    def test_run_wakes_for_newly_scheduled_reminder(self):
+        """Test that the dispatch loop wakes early when a due reminder is scheduled."""
+        # Arrange
+        dispatched = threading.Event()
+        scheduler = ReminderScheduler(lambda reminder: dispatched.set())
+        stop_event = threading.Event()
+        loop = threading.Thread(target=scheduler.run, args=(stop_event,), kwargs={"max_wait": 30})
+        loop.start()
+        
+        # Act
+        scheduler.schedule(make_reminder(datetime.now() - timedelta(seconds=1)))
+        
+        # Assert
+        try:
+            assert dispatched.wait(timeout=5)
+        finally:
+            stop_event.set()
+            scheduler.stop()
+            loop.join(timeout=5)
+        assert not loop.is_alive()